@@ -8,12 +8,18 @@
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 import json
+import hashlib
 import logging
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Default filesystem locations, resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_DEFAULT_DB_PATH = _PROJECT_ROOT / "scrapemaster.db"
+_DEFAULT_PROXY_CONFIG_PATH = _PROJECT_ROOT / "config" / "proxies.json"
+
 @dataclass
 class DatabaseConfig:
     """Database configuration with connection pooling parameters"""
@@ -21,7 +27,13 @@ class DatabaseConfig:
     max_connections: int = 10
     timeout: float = 30.0
     enable_wal: bool = True
-    cache_size: int = 10000
+    cache_size: int = -65536  # negative = KiB, i.e. 64MiB page cache
+    mmap_size: int = 1073741824  # 1GiB memory-mapped I/O window
+    busy_timeout_ms: int = 5000
+    wal_autocheckpoint: int = 1000  # pages
+    checkpoint_interval: int = 300  # seconds between WAL truncations
+    maintenance_interval: int = 3600  # seconds between optimize/incremental_vacuum runs
+    archive_months_to_keep: int = 3  # months kept in scraped_data by the daily pass; 0 disables archiving
     
 @dataclass
 class ProxyConfiguration:
@@ -36,7 +48,7 @@ class ProxyConfiguration:
     
     def __post_init__(self):
         if self.config_file is None:
-            self.config_file = Path(__file__).parent.parent.parent / "config" / "proxies.json"
+            self.config_file = _DEFAULT_PROXY_CONFIG_PATH
 
 @dataclass
 class ScrapingConfig:
@@ -49,6 +61,8 @@ class ScrapingConfig:
     rate_limit_delay: float = 1.0
     cache_responses: bool = True
     cache_ttl: int = 3600
+    max_body_bytes: int = 10 * 1024 * 1024  # responses are truncated past this size
+    verify_ssl: bool = True  # disable only for development against self-signed hosts
     use_stealth: bool = True  # Enable stealth scraping by default
     proxy: ProxyConfiguration = field(default_factory=ProxyConfiguration)
 
@@ -80,10 +94,8 @@ class PricingConfig:
 @dataclass 
 class ApplicationConfig:
     """Master configuration class with all subsystem configs"""
-    project_root: Path = field(default_factory=lambda: Path(__file__).parent.parent.parent)
-    database: DatabaseConfig = field(default_factory=lambda: DatabaseConfig(
-        path=Path(__file__).parent.parent.parent / "scrapemaster.db"
-    ))
+    project_root: Path = _PROJECT_ROOT
+    database: DatabaseConfig = field(default_factory=lambda: DatabaseConfig(path=_DEFAULT_DB_PATH))
     scraping: ScrapingConfig = field(default_factory=ScrapingConfig)
     notifications: NotificationConfig = field(default_factory=NotificationConfig) 
     pricing: PricingConfig = field(default_factory=PricingConfig)
@@ -92,6 +104,7 @@ class ApplicationConfig:
     debug_mode: bool = field(default_factory=lambda: os.getenv("DEBUG", "False").lower() == "true")
     log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
     secret_key: str = field(default_factory=lambda: os.getenv("SECRET_KEY", "dev-secret-key"))
+    require_crypto_hash: bool = field(default_factory=lambda: os.getenv("REQUIRE_CRYPTO_HASH", "False").lower() == "true")
     
     # Feature flags
     enable_async_scraping: bool = True
@@ -168,8 +181,17 @@ def save_custom_settings(self):
             }
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(settings, f, indent=2)
+        new_blob = json.dumps(settings, indent=2, sort_keys=True).encode()
+        
+        # Skip the write when the file already holds identical settings
+        if config_file.exists():
+            new_hash = hashlib.blake2b(new_blob, digest_size=16).digest()
+            current_hash = hashlib.blake2b(config_file.read_bytes(), digest_size=16).digest()
+            if new_hash == current_hash:
+                logging.debug(f"Settings unchanged, skipping write to {config_file}")
+                return
+        
+        config_file.write_bytes(new_blob)
             
         logging.info(f"Saved settings to {config_file}")
 
@@ -6,8 +6,10 @@
 import sqlite3
 import asyncio
 import threading
+import queue
+from concurrent.futures import Future
 from contextlib import contextmanager, asynccontextmanager
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Callable
 import pandas as pd
 from datetime import datetime, timedelta
 import json
@@ -16,87 +18,531 @@
 import aiosqlite
 from functools import lru_cache
 import time
+import zlib
+import gzip
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 from .models import ScrapingTarget, ScrapedData, Client, PlanType, TargetStatus
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+if ORJSON_AVAILABLE:
+    def _dumps(obj: Any) -> str:
+        """Serialize to a JSON string; datetimes are emitted in ISO format"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> str:
+        """Serialize to a JSON string; datetimes are emitted in ISO format"""
+        return json.dumps(obj, default=lambda o: o.isoformat() if isinstance(o, datetime) else str(o))
+    
+    _loads = json.loads
+
+def _convert_timestamp(value: bytes):
+    """Parse TIMESTAMP columns at fetch time, leaving unparseable values as text"""
+    text = value.decode()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return text
+
+# Conversions run inside the driver at fetch time for connections opened with detect_types:
+# TIMESTAMP and BOOLEAN by declared column type, JSON via `AS "col [JSON]"` column aliases
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+sqlite3.register_converter("BOOLEAN", lambda value: value not in (b"0", b""))
+sqlite3.register_converter("JSON", _loads)
+
+_DETECT_TYPES = sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+
+def _decompress_html(codec: str, payload: Any) -> str:
+    """Decode a scraped_data_blobs payload; 'identity' rows hold HTML migrated as-is"""
+    if codec == 'gzip':
+        return gzip.decompress(payload).decode()
+    if codec == 'zlib':
+        return zlib.decompress(payload).decode()
+    return payload.decode() if isinstance(payload, bytes) else payload
+
+# Hot-path statements kept as stable strings so each connection's statement cache is reused
+_SQL_CLIENT_TARGET_CAPACITY = """
+    SELECT c.plan_type,
+           (SELECT COUNT(*) FROM scraping_targets
+            WHERE client_id = c.id AND is_active = TRUE) as current_targets
+    FROM clients c
+    WHERE c.id = ? AND c.is_active = TRUE
+"""
+
+_SQL_INSERT_TARGET = """
+    INSERT INTO scraping_targets 
+    (id, name, url, selectors, frequency_hours, client_id, 
+     price_per_month, status, metadata, headers, cookies)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_ACTIVE_TARGETS = """
+    SELECT
+        id, name, url, frequency_hours, last_scraped, success_rate, status,
+        client_id, price_per_month, consecutive_errors,
+        selectors AS "selectors [JSON]", metadata AS "metadata [JSON]",
+        headers AS "headers [JSON]", cookies AS "cookies [JSON]"
+    FROM v_active_targets_summary
+    ORDER BY 
+        CASE 
+            WHEN last_scraped IS NULL THEN 0
+            ELSE (julianday('now') - julianday(last_scraped)) * 24
+        END DESC,
+        success_rate ASC
+"""
+
+_SQL_SELECT_ACTIVE_TARGETS_ASYNC = """
+    SELECT
+        t.id, t.name, t.url, t.frequency_hours, t.last_scraped, t.success_rate, t.status,
+        t.client_id, t.price_per_month, t.consecutive_errors, c.plan_type,
+        t.selectors AS "selectors [JSON]", t.metadata AS "metadata [JSON]",
+        t.headers AS "headers [JSON]", t.cookies AS "cookies [JSON]"
+    FROM scraping_targets t
+    JOIN clients c ON t.client_id = c.id
+    WHERE t.is_active = TRUE AND c.is_active = TRUE
+    ORDER BY t.last_scraped ASC NULLS FIRST
+"""
+
+# Primary-key probe into the per-target snapshot maintained alongside every insert
+_SQL_PREVIOUS_SCRAPE = """
+    SELECT data AS "data [JSON]", hash_signature 
+    FROM scraped_latest 
+    WHERE target_id = ?
+"""
+
+_SQL_UPSERT_LATEST_SCRAPE = """
+    INSERT INTO scraped_latest (target_id, scraped_id, data, hash_signature)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(target_id) DO UPDATE SET
+        scraped_id = excluded.scraped_id,
+        data = excluded.data,
+        hash_signature = excluded.hash_signature
+"""
+
+_SQL_INSERT_SCRAPED_DATA = """
+    INSERT INTO scraped_data 
+    (target_id, data, change_detected, changes, hash_signature,
+     response_time_ms, status_code, content_length, extraction_success_rate,
+     errors, warnings, metadata, partition_month)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CAST(strftime('%Y%m', 'now') AS INTEGER))
+"""
+
+_SQL_INSERT_RAW_HTML = """
+    INSERT INTO scraped_data_blobs (scraped_id, codec, raw_html)
+    VALUES (?, ?, ?)
+"""
+
+_SQL_SELECT_RAW_HTML = """
+    SELECT codec, raw_html FROM scraped_data_blobs WHERE scraped_id = ?
+"""
+
+# Success and failure share one statement so a single prepared statement serves both
+_SQL_UPDATE_TARGET_STATS = """
+    UPDATE scraping_targets 
+    SET last_scraped = CURRENT_TIMESTAMP,
+        success_rate = CASE WHEN :status_code = 200
+                            THEN MIN(100, success_rate * 0.95 + 5.0)
+                            ELSE MAX(0, success_rate * 0.95) END,
+        error_count = error_count + CASE WHEN :status_code = 200 THEN 0 ELSE 1 END,
+        consecutive_errors = CASE WHEN :status_code = 200 THEN 0 ELSE consecutive_errors + 1 END,
+        status = CASE 
+            WHEN :status_code = 200 THEN 'active'
+            WHEN consecutive_errors + 1 >= 3 THEN 'error'
+            ELSE status
+        END
+    WHERE id = :target_id
+"""
+
+_SQL_QUEUE_CHANGE_NOTIFICATION = """
+    INSERT INTO notification_queue 
+    (target_id, client_id, notification_type, priority, payload)
+    SELECT t.id, t.client_id, 'change_detected', 8, ?
+    FROM scraping_targets t
+    WHERE t.id = ?
+"""
+
+_SQL_PREVIOUS_SCRAPES_FOR_TARGETS = """
+    SELECT target_id, data AS "data [JSON]", hash_signature
+    FROM scraped_latest
+    WHERE target_id IN ({placeholders})
+"""
+
+_SQL_INSERT_CLIENT = """
+    INSERT INTO clients 
+    (id, name, email, company, phone, plan_type, monthly_value, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_RECENT_CHANGES = """
+    SELECT 
+        sd.timestamp,
+        t.name as target_name,
+        t.url,
+        c.name as client_name,
+        sd.changes,
+        sd.response_time_ms
+    FROM scraped_data sd
+    JOIN scraping_targets t ON sd.target_id = t.id
+    JOIN clients c ON t.client_id = c.id
+    WHERE sd.change_detected = TRUE
+    ORDER BY sd.timestamp DESC
+    LIMIT ?
+"""
+
+# Explicit column types let pandas skip its type-inference pass
+_TEXT_DTYPE = "string[pyarrow]" if PYARROW_AVAILABLE else "string"
+_RECENT_CHANGES_DTYPES = {
+    'timestamp': 'datetime64[ns]',
+    'target_name': _TEXT_DTYPE,
+    'url': _TEXT_DTYPE,
+    'client_name': _TEXT_DTYPE,
+    'response_time_ms': 'int32',
+}
+
+# Columns copied into monthly archive tables and exposed through v_scraped_data_all
+_ARCHIVE_COLUMNS = (
+    "id, target_id, timestamp, data, change_detected, changes, hash_signature, "
+    "response_time_ms, status_code, content_length, extraction_success_rate, "
+    "errors, warnings, metadata, partition_month"
+)
+
+# Monthly archive tables created by archive_old_partitions
+_SQL_ARCHIVE_TABLES = (
+    "SELECT name FROM sqlite_master WHERE type = 'table' "
+    "AND name GLOB 'scraped_data_[0-9][0-9][0-9][0-9][0-9][0-9]' ORDER BY name"
+)
+
+# Full recomputation of the trigger-maintained per-target scrape aggregates,
+# including rows already moved into monthly archive tables
+_SQL_REBUILD_TARGET_SUMMARY = """
+    INSERT INTO mv_active_targets_summary
+    (target_id, total_scrapes, changes_detected, avg_response_time, last_data_timestamp)
+    SELECT target_id, COUNT(*),
+           SUM(CASE WHEN change_detected THEN 1 ELSE 0 END),
+           AVG(response_time_ms), MAX(timestamp)
+    FROM v_scraped_data_all
+    GROUP BY target_id
+"""
+
+_SQL_REVENUE_SUMMARY = """
+    WITH target_metrics AS (
+        SELECT 
+            SUM(price_per_month) as mrr,
+            COUNT(*) as target_count,
+            COUNT(CASE WHEN status = 'active' THEN 1 END) as active_targets,
+            AVG(success_rate) as avg_success_rate,
+            SUM(CASE WHEN last_scraped > datetime('now', '-24 hours') THEN 1 ELSE 0 END) as recent_scrapes
+        FROM scraping_targets
+        WHERE is_active = TRUE
+    ),
+    client_metrics AS (
+        SELECT 
+            COUNT(DISTINCT id) as client_count,
+            COUNT(DISTINCT CASE WHEN plan_type = 'enterprise' THEN id END) as enterprise_clients,
+            AVG(satisfaction_score) as avg_satisfaction,
+            COUNT(CASE WHEN satisfaction_score < 3 THEN 1 END) as high_risk_clients,
+            COUNT(CASE WHEN last_activity < datetime('now', '-30 days') THEN 1 END) as inactive_clients
+        FROM clients
+        WHERE is_active = TRUE
+    ),
+    growth AS (
+        SELECT 
+            SUM(CASE WHEN payment_date > datetime('now', '-30 days') THEN amount ELSE 0 END) as current_month,
+            SUM(CASE WHEN payment_date > datetime('now', '-60 days') 
+                     AND payment_date <= datetime('now', '-30 days') THEN amount ELSE 0 END) as previous_month
+        FROM revenue_tracking
+        WHERE status = 'active'
+    )
+    SELECT
+        tm.*, cm.*,
+        CASE WHEN g.previous_month > 0
+             THEN (g.current_month - g.previous_month) * 100.0 / g.previous_month
+             ELSE 0.0
+        END as growth_rate
+    FROM target_metrics tm, client_metrics cm, growth g
+"""
+
+_SQL_REVENUE_TREND = """
+    SELECT 
+        DATE(payment_date) as date,
+        SUM(amount) as revenue
+    FROM revenue_tracking
+    WHERE payment_date > datetime('now', '-30 days')
+        AND status = 'active'
+    GROUP BY DATE(payment_date)
+    ORDER BY date
+"""
+
+def connection_pragmas(cache_size: int = -65536, mmap_size: int = 1073741824,
+                       busy_timeout_ms: int = 5000, wal_autocheckpoint: int = 1000,
+                       enable_wal: bool = True, read_only: bool = False) -> List[str]:
+    """PRAGMA statements applied to every new sync or async connection"""
+    if read_only:
+        # Readers skip anything that would write the database header or WAL settings
+        return [
+            f"PRAGMA busy_timeout={int(busy_timeout_ms)}",
+            f"PRAGMA cache_size={int(cache_size)}",
+            "PRAGMA temp_store=MEMORY",
+            f"PRAGMA mmap_size={int(mmap_size)}",
+            "PRAGMA query_only=ON",
+        ]
+    
+    pragmas = [
+        "PRAGMA page_size=4096",  # only takes effect before the schema is created
+        "PRAGMA auto_vacuum=INCREMENTAL",  # likewise; lets maintenance() trim the freelist
+        f"PRAGMA busy_timeout={int(busy_timeout_ms)}",
+    ]
+    if enable_wal:
+        pragmas.append("PRAGMA journal_mode=WAL")
+    pragmas += [
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA cache_size={int(cache_size)}",
+        "PRAGMA temp_store=MEMORY",
+        f"PRAGMA mmap_size={int(mmap_size)}",
+        f"PRAGMA wal_autocheckpoint={int(wal_autocheckpoint)}",
+        "PRAGMA foreign_keys=ON",
+    ]
+    return pragmas
+
 class ConnectionPool:
     """Thread-safe SQLite connection pool with size management"""
     
-    def __init__(self, db_path: Path, max_connections: int = 10):
+    def __init__(self, db_path: Path, max_connections: int = 10,
+                 cache_size: int = -65536, enable_wal: bool = True,
+                 mmap_size: int = 1073741824, busy_timeout_ms: int = 5000,
+                 wal_autocheckpoint: int = 1000, write_batch_size: int = 64,
+                 read_only: bool = False):
         self.db_path = db_path
+        self.read_only = read_only
         self.max_connections = max_connections
-        self._connections = []
-        self._in_use = set()
+        self.cache_size = cache_size
+        self.enable_wal = enable_wal
+        self.mmap_size = mmap_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self.wal_autocheckpoint = wal_autocheckpoint
+        # LIFO hands out the most recently used (warmest) connection first;
+        # None slots are created lazily up to max_connections
+        self._pool: "queue.LifoQueue[Optional[sqlite3.Connection]]" = queue.LifoQueue(maxsize=max_connections)
+        for _ in range(max_connections):
+            self._pool.put_nowait(None)
         self._lock = threading.Lock()
-        self._condition = threading.Condition(self._lock)
+        
+        # Single writer: all mutations are funnelled through one connection/thread
+        self.write_batch_size = write_batch_size
+        self._write_queue: "queue.Queue[Optional[Tuple[Callable, tuple, Future]]]" = queue.Queue()
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._writer_thread: Optional[threading.Thread] = None
         
     def _create_connection(self) -> sqlite3.Connection:
         """Create optimized SQLite connection"""
-        conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        if self.read_only:
+            target, uri = f"file:{self.db_path}?mode=ro", True
+        else:
+            target, uri = str(self.db_path), False
+        conn = sqlite3.connect(
+            target, timeout=30.0, check_same_thread=False, cached_statements=256,
+            detect_types=_DETECT_TYPES, uri=uri
+        )
         conn.row_factory = sqlite3.Row
         
         # Performance optimizations
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL") 
-        conn.execute("PRAGMA cache_size=10000")
-        conn.execute("PRAGMA temp_store=MEMORY")
-        conn.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped I/O
+        for pragma in connection_pragmas(
+            self.cache_size, self.mmap_size, self.busy_timeout_ms,
+            self.wal_autocheckpoint, self.enable_wal, self.read_only
+        ):
+            conn.execute(pragma)
         
-        return conn    
+        return conn
+    
+    @staticmethod
+    def _close_connection(conn: sqlite3.Connection):
+        """Refresh planner statistics gathered by this connection, then close it"""
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        conn.close()
+    
     def get_connection(self):
-        """Acquire connection from pool"""
-        with self._condition:
-            # Wait if all connections are in use
-            while len(self._connections) == 0 and len(self._in_use) >= self.max_connections:
-                self._condition.wait()
-                
-            # Get existing connection or create new one
-            if self._connections:
-                conn = self._connections.pop()
-            else:
-                conn = self._create_connection()
-                
-            self._in_use.add(conn)
+        """Acquire connection from pool, blocking while all are in use"""
+        conn = self._pool.get()
+        if conn is not None:
             return conn
+        
+        try:
+            return self._create_connection()
+        except Exception:
+            self._pool.put_nowait(None)
+            raise
             
+    def submit_write(self, fn: Callable, *args) -> Future:
+        """Queue fn(conn, *args) for the writer thread and return its Future"""
+        future: Future = Future()
+        with self._lock:
+            if self._writer_thread is None:
+                self._writer_conn = self._create_connection()
+                self._writer_conn.isolation_level = None  # transactions managed explicitly
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="sqlite-writer", daemon=True
+                )
+                self._writer_thread.start()
+        self._write_queue.put((fn, args, future))
+        return future
+    
+    def _writer_loop(self):
+        """Drain queued writes, committing up to write_batch_size per transaction"""
+        conn = self._writer_conn
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            stop = False
+            while len(batch) < self.write_batch_size:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            results = []
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                for fn, args, future in batch:
+                    # Savepoint per job so one failure doesn't discard the batch
+                    conn.execute("SAVEPOINT write_job")
+                    try:
+                        results.append((future, fn(conn, *args), None))
+                        conn.execute("RELEASE write_job")
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO write_job")
+                        conn.execute("RELEASE write_job")
+                        results.append((future, None, e))
+                conn.execute("COMMIT")
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                for fn, args, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                results = []
+            
+            for future, result, error in results:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            
+            if stop:
+                break
+        
+        self._close_connection(conn)
+    
     def return_connection(self, conn: sqlite3.Connection):
         """Return connection to pool"""
-        with self._condition:
-            self._in_use.discard(conn)
-            if len(self._connections) < self.max_connections:
-                self._connections.append(conn)
-            else:
-                conn.close()
-            self._condition.notify()
-            
+        self._pool.put_nowait(conn)
+    
+    def optimize_idle(self):
+        """Run PRAGMA optimize on each idle connection; it only affects the connection it runs on"""
+        taken = []
+        while True:
+            try:
+                taken.append(self._pool.get_nowait())
+            except queue.Empty:
+                break
+        for conn in taken:
+            if conn is not None:
+                try:
+                    conn.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+            self._pool.put_nowait(conn)
+    
     def close_all(self):
         """Close all connections"""
-        with self._lock:
-            for conn in self._connections:
-                conn.close()
-            for conn in self._in_use:
-                conn.close()
-            self._connections.clear()
-            self._in_use.clear()
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._writer_conn = None
+        
+        # Close idle connections; checked-out ones are closed when next drained
+        drained = 0
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            if conn is not None:
+                self._close_connection(conn)
+            drained += 1
+        for _ in range(drained):
+            self._pool.put_nowait(None)
 
 class DatabaseManager:
     """Enhanced database manager with async support and query optimization"""
     
+    # Logical tables whose writes bump a version counter
+    _VERSIONED_TABLES = ('targets', 'scraped_data', 'clients', 'revenue', 'notifications')
+    
+    # Cache key -> tables whose writes make the cached value stale
+    _CACHE_DEPENDENCIES = {
+        'active_targets': ('targets', 'scraped_data', 'clients'),
+        'revenue_analytics': ('targets', 'clients', 'revenue'),
+    }
+    
     def __init__(self, db_path: Optional[Path] = None):
         config = get_config()
         self.db_path = db_path or config.database.path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Connection pool for sync operations
-        self.pool = ConnectionPool(self.db_path, config.database.max_connections)
+        db_config = config.database
+        self._pragmas = connection_pragmas(
+            db_config.cache_size, db_config.mmap_size, db_config.busy_timeout_ms,
+            db_config.wal_autocheckpoint, db_config.enable_wal
+        )
+        self._reader_pragmas = connection_pragmas(
+            db_config.cache_size, db_config.mmap_size, db_config.busy_timeout_ms,
+            read_only=True
+        )
+        pool_kwargs = dict(
+            cache_size=db_config.cache_size,
+            enable_wal=db_config.enable_wal,
+            mmap_size=db_config.mmap_size,
+            busy_timeout_ms=db_config.busy_timeout_ms,
+            wal_autocheckpoint=db_config.wal_autocheckpoint
+        )
+        self.pool = ConnectionPool(self.db_path, db_config.max_connections, **pool_kwargs)
+        
+        # Read-only connections for query paths; opened lazily once the schema exists
+        self.reader_pool = ConnectionPool(
+            self.db_path, db_config.max_connections, read_only=True, **pool_kwargs
+        )
         
-        # Cache for frequently accessed data
-        self._cache = {}
-        self._cache_timestamps = {}
-        self._cache_ttl = 60  # seconds
+        # Cache for frequently accessed data; entries are (value, table-version snapshot)
+        self._cache: Dict[str, Tuple[Any, Tuple[int, ...]]] = {}
+        self._table_versions = {table: 0 for table in self._VERSIONED_TABLES}
+        self._versions_lock = threading.Lock()
         
         # Initialize database
         self.init_database()
@@ -104,9 +550,31 @@ def __init__(self, db_path: Optional[Path] = None):
         # Async connection string
         self.async_db_path = f"file:{self.db_path}?mode=rw"
         
+        # Idle aiosqlite connections, keyed by read_only
+        self._async_idle: Dict[bool, List[aiosqlite.Connection]] = {False: [], True: []}
+        self._async_lock = threading.Lock()
+        self._async_pool_size = db_config.max_connections
+        
+        # Periodically truncate the WAL so it cannot grow without bound and
+        # run maintenance() to keep planner statistics fresh
+        self._maintenance_stop = threading.Event()
+        self._checkpoint_interval = db_config.checkpoint_interval if db_config.enable_wal else 0
+        self._maintenance_interval = db_config.maintenance_interval
+        self._archive_months_to_keep = db_config.archive_months_to_keep
+        self._next_daily_maintenance = time.monotonic() + 86400
+        if self._checkpoint_interval > 0 or self._maintenance_interval > 0:
+            threading.Thread(
+                target=self._maintenance_loop, name="sqlite-maintenance", daemon=True
+            ).start()
+        
     @contextmanager
     def get_connection(self):
-        """Get connection from pool with automatic return"""
+        """Get connection from pool with automatic return
+        
+        Hot write paths (add_target, store_scraped_data, add_client) go through
+        the pool's single writer thread and pure queries use get_reader();
+        this read-write connection is for schema setup and maintenance.
+        """
         conn = self.pool.get_connection()
         try:
             yield conn
@@ -117,16 +585,163 @@ def get_connection(self):
         finally:
             self.pool.return_connection(conn)
             
+    @contextmanager
+    def get_reader(self):
+        """Get a read-only pooled connection; nothing to commit on exit"""
+        conn = self.reader_pool.get_connection()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self.reader_pool.return_connection(conn)
+    
+    async def _open_async_connection(self, read_only: bool) -> aiosqlite.Connection:
+        """Open an aiosqlite connection and apply its PRAGMAs in one round trip"""
+        if read_only:
+            conn = await aiosqlite.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, detect_types=_DETECT_TYPES
+            )
+            pragmas = self._reader_pragmas
+        else:
+            conn = await aiosqlite.connect(self.db_path, detect_types=_DETECT_TYPES)
+            pragmas = self._pragmas
+        await conn.executescript(";\n".join(pragmas) + ";")
+        conn.row_factory = aiosqlite.Row
+        return conn
+    
     @asynccontextmanager
-    async def get_async_connection(self):
-        """Get async connection for concurrent operations"""
-        async with aiosqlite.connect(self.db_path) as conn:
-            await conn.execute("PRAGMA journal_mode=WAL")
-            await conn.execute("PRAGMA synchronous=NORMAL")
-            await conn.execute("PRAGMA cache_size=10000")
-            await conn.execute("PRAGMA temp_store=MEMORY")
-            conn.row_factory = aiosqlite.Row
-            yield conn    
+    async def get_async_connection(self, read_only: bool = False):
+        """Get a pooled async connection for concurrent operations
+        
+        aiosqlite connections are not tied to an event loop, so idle ones are
+        kept in a plain list and reused by any loop.
+        """
+        with self._async_lock:
+            idle = self._async_idle[read_only]
+            conn = idle.pop() if idle else None
+        if conn is None:
+            conn = await self._open_async_connection(read_only)
+        
+        try:
+            yield conn
+        finally:
+            # Discard uncommitted work, as closing the connection used to
+            if conn.in_transaction:
+                await conn.rollback()
+            with self._async_lock:
+                idle = self._async_idle[read_only]
+                keep = len(idle) < self._async_pool_size
+                if keep:
+                    idle.append(conn)
+            if not keep:
+                await conn.close()
+    
+    def checkpoint_wal(self, mode: str = "TRUNCATE"):
+        """Checkpoint the write-ahead log back into the main database file"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute(f"PRAGMA wal_checkpoint({mode})")
+        except sqlite3.Error as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+    
+    def _maintenance_loop(self):
+        """Background loop running checkpoint_wal and maintenance until close() is called"""
+        tick = min(i for i in (self._checkpoint_interval, self._maintenance_interval) if i > 0)
+        next_maintenance = time.monotonic() + self._maintenance_interval
+        while not self._maintenance_stop.wait(tick):
+            if self._checkpoint_interval > 0:
+                self.checkpoint_wal()
+            if self._maintenance_interval > 0 and time.monotonic() >= next_maintenance:
+                self.maintenance()
+                next_maintenance = time.monotonic() + self._maintenance_interval
+    
+    def maintenance(self):
+        """Checkpoint the WAL, refresh planner statistics and trim the freelist
+        
+        ANALYZE, archiving of old partitions and the mv_active_targets_summary
+        rebuild run at most once a day.
+        """
+        self.checkpoint_wal("PASSIVE")
+        
+        daily = time.monotonic() >= self._next_daily_maintenance
+        try:
+            self.pool.submit_write(self._maintenance_txn, daily).result()
+        except sqlite3.Error as e:
+            logger.warning(f"Database maintenance failed: {e}")
+            return
+        
+        self.pool.optimize_idle()
+        self.reader_pool.optimize_idle()
+        self._incremental_vacuum()
+        
+        if daily:
+            if self._archive_months_to_keep > 0:
+                self.archive_old_partitions(self._archive_months_to_keep)
+            self.rebuild_target_summary()
+            self._next_daily_maintenance = time.monotonic() + 86400
+    
+    def _maintenance_txn(self, conn: sqlite3.Connection, analyze: bool):
+        """Writer-thread body of maintenance"""
+        if analyze:
+            conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
+    
+    def _incremental_vacuum(self, pages: int = 0):
+        """Return up to pages free pages (0 = all) to the OS when auto_vacuum is INCREMENTAL"""
+        try:
+            with self.get_connection() as conn:
+                # 2 = INCREMENTAL, set when the database file was created or by compact_database()
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                    # execute() would free a single page; executescript steps it to completion
+                    conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+        except sqlite3.Error as e:
+            logger.warning(f"Incremental vacuum failed: {e}")
+    
+    def rebuild_target_summary(self):
+        """Recompute mv_active_targets_summary from all scrape history to correct drift"""
+        try:
+            self.pool.submit_write(self._rebuild_target_summary_txn).result()
+        except sqlite3.Error as e:
+            logger.error(f"Error rebuilding target summary: {e}")
+            return
+        self._bump_versions('targets')
+    
+    def _rebuild_target_summary_txn(self, conn: sqlite3.Connection):
+        """Writer-thread body of rebuild_target_summary"""
+        conn.execute("DELETE FROM mv_active_targets_summary")
+        conn.execute(_SQL_REBUILD_TARGET_SUMMARY)
+    
+
+    def _migrate_raw_html(self, cursor: sqlite3.Cursor):
+        """Move raw_html out of scraped_data rows created by older schemas"""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(scraped_data)")}
+        if 'raw_html' not in columns:
+            return
+        
+        cursor.execute('''
+            INSERT OR IGNORE INTO scraped_data_blobs (scraped_id, codec, raw_html)
+            SELECT id, 'identity', raw_html FROM scraped_data WHERE raw_html IS NOT NULL
+        ''')
+        try:
+            cursor.execute("ALTER TABLE scraped_data DROP COLUMN raw_html")
+        except sqlite3.OperationalError:
+            # SQLite < 3.35 cannot drop columns; the copy is still authoritative
+            cursor.execute("UPDATE scraped_data SET raw_html = NULL WHERE raw_html IS NOT NULL")
+        logger.info("Migrated raw_html to scraped_data_blobs")
+    
+    def _migrate_partition_month(self, cursor: sqlite3.Cursor):
+        """Add and backfill scraped_data.partition_month on older schemas"""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(scraped_data)")}
+        if 'partition_month' in columns:
+            return
+        
+        cursor.execute("ALTER TABLE scraped_data ADD COLUMN partition_month INTEGER")
+        cursor.execute(
+            "UPDATE scraped_data SET partition_month = CAST(strftime('%Y%m', timestamp) AS INTEGER)"
+        )
+        logger.info("Added partition_month to scraped_data")
+    
     def init_database(self):
         """Initialize database schema with optimized indexes and views"""
         with self.get_connection() as conn:
@@ -162,7 +777,6 @@ def init_database(self):
                     target_id TEXT NOT NULL,
                     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     data TEXT NOT NULL,
-                    raw_html TEXT,
                     change_detected BOOLEAN DEFAULT FALSE,
                     changes TEXT DEFAULT '{}',
                     hash_signature TEXT NOT NULL,
@@ -173,9 +787,45 @@ def init_database(self):
                     errors TEXT DEFAULT '[]',
                     warnings TEXT DEFAULT '[]',
                     metadata TEXT DEFAULT '{}',
+                    partition_month INTEGER,
+                    FOREIGN KEY (target_id) REFERENCES scraping_targets (id) ON DELETE CASCADE
+                )
+            ''')
+            self._migrate_partition_month(cursor)
+            
+            # Raw HTML lives off the hot row so scans of scraped_data stay narrow
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS scraped_data_blobs (
+                    scraped_id INTEGER PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    raw_html BLOB NOT NULL,
+                    FOREIGN KEY (scraped_id) REFERENCES scraped_data (id) ON DELETE CASCADE
+                )
+            ''')
+            self._migrate_raw_html(cursor)
+            
+            # Latest scrape per target, so change detection never scans scraped_data
+            has_snapshot = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scraped_latest'"
+            ).fetchone()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS scraped_latest (
+                    target_id TEXT PRIMARY KEY,
+                    scraped_id INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    hash_signature TEXT NOT NULL,
                     FOREIGN KEY (target_id) REFERENCES scraping_targets (id) ON DELETE CASCADE
                 )
             ''')
+            if not has_snapshot:
+                cursor.execute('''
+                    INSERT INTO scraped_latest (target_id, scraped_id, data, hash_signature)
+                    SELECT sd.target_id, sd.id, sd.data, sd.hash_signature
+                    FROM scraped_data sd
+                    JOIN (SELECT MAX(id) AS id FROM scraped_data GROUP BY target_id) latest
+                        ON sd.id = latest.id
+                    JOIN scraping_targets t ON t.id = sd.target_id
+                ''')
             
             # Enhanced clients table with CRM features
             cursor.execute('''
@@ -239,9 +889,13 @@ def init_database(self):
                 "CREATE INDEX IF NOT EXISTS idx_target_status ON scraping_targets(status, is_active)",
                 
                 # Scraped data indexes
-                "CREATE INDEX IF NOT EXISTS idx_scraped_target_time ON scraped_data(target_id, timestamp DESC)",
+                # Covers the per-target "latest row" lookup including its hash
+                "DROP INDEX IF EXISTS idx_scraped_target_time",
+                "CREATE INDEX IF NOT EXISTS idx_scraped_latest ON scraped_data(target_id, timestamp DESC, hash_signature)",
                 "CREATE INDEX IF NOT EXISTS idx_scraped_changes ON scraped_data(change_detected, timestamp DESC)",
                 "CREATE INDEX IF NOT EXISTS idx_scraped_hash ON scraped_data(target_id, hash_signature)",
+                "CREATE INDEX IF NOT EXISTS idx_scraped_partition ON scraped_data(partition_month)",
+                "CREATE INDEX IF NOT EXISTS idx_scraped_timestamp ON scraped_data(timestamp)",
                 
                 # Client indexes
                 "CREATE INDEX IF NOT EXISTS idx_client_email ON clients(email)",
@@ -257,24 +911,96 @@ def init_database(self):
             
             for index_sql in indexes:
                 cursor.execute(index_sql)
+            self._rebuild_archive_view(cursor)
+            
+            # Duplicate URLs per client are rejected by the insert itself
+            try:
+                cursor.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS uq_target_url_client_active "
+                    "ON scraping_targets(url, client_id) WHERE is_active = TRUE"
+                )
+            except sqlite3.IntegrityError:
+                logger.warning("Existing duplicate active targets; uq_target_url_client_active not created")
+            
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_target_insert
+                AFTER INSERT ON scraping_targets
+                BEGIN
+                    UPDATE clients SET last_activity = CURRENT_TIMESTAMP WHERE id = NEW.client_id;
+                END
+            ''')
+            
+            # Per-target scrape aggregates, kept current by triggers on scraped_data
+            has_summary = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mv_active_targets_summary'"
+            ).fetchone()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS mv_active_targets_summary (
+                    target_id TEXT PRIMARY KEY,
+                    total_scrapes INTEGER NOT NULL DEFAULT 0,
+                    changes_detected INTEGER NOT NULL DEFAULT 0,
+                    avg_response_time REAL,
+                    last_data_timestamp TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_scraped_summary_insert
+                AFTER INSERT ON scraped_data
+                BEGIN
+                    INSERT INTO mv_active_targets_summary
+                    (target_id, total_scrapes, changes_detected, avg_response_time, last_data_timestamp)
+                    VALUES (NEW.target_id, 1, CASE WHEN NEW.change_detected THEN 1 ELSE 0 END,
+                            NEW.response_time_ms, NEW.timestamp)
+                    ON CONFLICT(target_id) DO UPDATE SET
+                        total_scrapes = total_scrapes + 1,
+                        changes_detected = changes_detected + excluded.changes_detected,
+                        avg_response_time = avg_response_time
+                            + (excluded.avg_response_time - avg_response_time) / (total_scrapes + 1),
+                        last_data_timestamp = MAX(last_data_timestamp, excluded.last_data_timestamp);
+                END
+            ''')
+            # Deletes keep the counts exact; the average drifts until the next rebuild.
+            # Archive moves also fire this, so archiving rebuilds the summary afterwards.
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_scraped_summary_delete
+                AFTER DELETE ON scraped_data
+                BEGIN
+                    UPDATE mv_active_targets_summary SET
+                        total_scrapes = total_scrapes - 1,
+                        changes_detected = changes_detected - (CASE WHEN OLD.change_detected THEN 1 ELSE 0 END)
+                    WHERE target_id = OLD.target_id;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_target_summary_delete
+                AFTER DELETE ON scraping_targets
+                BEGIN
+                    DELETE FROM mv_active_targets_summary WHERE target_id = OLD.id;
+                END
+            ''')
+            if not has_summary:
+                cursor.execute(_SQL_REBUILD_TARGET_SUMMARY)
             
             # Create materialized views for performance
+            # Recreated on startup so existing databases pick up column changes
+            cursor.execute("DROP VIEW IF EXISTS v_active_targets_summary")
             cursor.execute('''
-                CREATE VIEW IF NOT EXISTS v_active_targets_summary AS
+                CREATE VIEW v_active_targets_summary AS
                 SELECT 
                     t.id, t.name, t.url, t.frequency_hours,
                     t.last_scraped, t.success_rate, t.status,
+                    t.selectors, t.client_id, t.price_per_month, t.consecutive_errors,
+                    t.metadata, t.headers, t.cookies,
                     c.name as client_name, c.email as client_email,
                     c.plan_type, c.monthly_value,
-                    COUNT(DISTINCT sd.id) as total_scrapes,
-                    SUM(CASE WHEN sd.change_detected THEN 1 ELSE 0 END) as changes_detected,
-                    AVG(sd.response_time_ms) as avg_response_time,
-                    MAX(sd.timestamp) as last_data_timestamp
+                    COALESCE(mv.total_scrapes, 0) as total_scrapes,
+                    COALESCE(mv.changes_detected, 0) as changes_detected,
+                    mv.avg_response_time,
+                    mv.last_data_timestamp
                 FROM scraping_targets t
                 LEFT JOIN clients c ON t.client_id = c.id
-                LEFT JOIN scraped_data sd ON t.id = sd.target_id
+                LEFT JOIN mv_active_targets_summary mv ON t.id = mv.target_id
                 WHERE t.is_active = TRUE
-                GROUP BY t.id
             ''')
             
             cursor.execute('''
@@ -310,70 +1036,67 @@ def init_database(self):
     def add_target(self, target: ScrapingTarget) -> bool:
         """Add scraping target with duplicate detection and client validation"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Validate client exists and can add targets
-                cursor.execute("""
-                    SELECT c.id, c.plan_type, 
-                           COUNT(t.id) as current_targets
-                    FROM clients c
-                    LEFT JOIN scraping_targets t ON c.id = t.client_id AND t.is_active = TRUE
-                    WHERE c.id = ? AND c.is_active = TRUE
-                    GROUP BY c.id, c.plan_type
-                """, (target.client_id,))
-                
-                client_data = cursor.fetchone()
-                if not client_data:
-                    logger.error(f"Client {target.client_id} not found or inactive")
-                    return False
-                
-                # Check plan limits
-                plan_type = PlanType(client_data['plan_type'])
-                if client_data['current_targets'] >= plan_type.max_targets:
-                    logger.warning(f"Client {target.client_id} has reached plan limit")
-                    return False
-                
-                # Check for duplicate URLs for the same client
-                cursor.execute("""
-                    SELECT id FROM scraping_targets 
-                    WHERE url = ? AND client_id = ? AND is_active = TRUE
-                """, (target.url, target.client_id))
-                
-                if cursor.fetchone():
-                    logger.warning(f"Duplicate URL {target.url} for client {target.client_id}")
-                    return False
-                
-                # Insert target
-                cursor.execute("""
-                    INSERT INTO scraping_targets 
-                    (id, name, url, selectors, frequency_hours, client_id, 
-                     price_per_month, status, metadata, headers, cookies)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    target.id, target.name, target.url,
-                    json.dumps(target.selectors), target.frequency_hours,
-                    target.client_id, target.price_per_month,
-                    target.status.value, json.dumps(target.metadata),
-                    json.dumps(target.headers), json.dumps(target.cookies)
-                ))
-                
-                # Update client's last activity
-                cursor.execute("""
-                    UPDATE clients 
-                    SET last_activity = CURRENT_TIMESTAMP 
-                    WHERE id = ?
-                """, (target.client_id,))
-                
-                # Clear cache
-                self._invalidate_cache('active_targets')
-                
-                logger.info(f"Added target {target.name} for client {target.client_id}")
-                return True
-                
+            added = self.pool.submit_write(self._add_target_txn, target).result()
+        except sqlite3.IntegrityError:
+            logger.warning(f"Duplicate URL {target.url} for client {target.client_id}")
+            return False
         except Exception as e:
             logger.error(f"Error adding target: {e}")
             return False
+        
+        if added:
+            self._bump_versions('targets', 'clients')
+            logger.info(f"Added target {target.name} for client {target.client_id}")
+        return added
+    
+    def _add_target_txn(self, conn: sqlite3.Connection, target: ScrapingTarget) -> bool:
+        """Writer-thread body of add_target"""
+        cursor = conn.cursor()
+        
+        # Validate client exists and can add targets
+        cursor.execute(_SQL_CLIENT_TARGET_CAPACITY, (target.client_id,))
+        
+        client_data = cursor.fetchone()
+        if not client_data:
+            logger.error(f"Client {target.client_id} not found or inactive")
+            return False
+        
+        # Check plan limits
+        plan_type = PlanType(client_data['plan_type'])
+        if client_data['current_targets'] >= plan_type.max_targets:
+            logger.warning(f"Client {target.client_id} has reached plan limit")
+            return False
+        
+        # Insert target; uq_target_url_client_active rejects duplicates and
+        # trg_target_insert records the client's activity
+        cursor.execute(_SQL_INSERT_TARGET, (
+            target.id, target.name, target.url,
+            _dumps(target.selectors), target.frequency_hours,
+            target.client_id, target.price_per_month,
+            target.status.value, _dumps(target.metadata),
+            _dumps(target.headers), _dumps(target.cookies)
+        ))
+        
+        return True
+    
+    def deactivate_target(self, target_id: str) -> bool:
+        """Soft-delete a target so it drops out of get_active_targets"""
+        try:
+            updated = self.pool.submit_write(self._deactivate_target_txn, target_id).result()
+        except Exception as e:
+            logger.error(f"Error deactivating target {target_id}: {e}")
+            return False
+        
+        if updated:
+            self._bump_versions('targets')
+            logger.info(f"Deactivated target {target_id}")
+        return updated
+    
+    def _deactivate_target_txn(self, conn: sqlite3.Connection, target_id: str) -> bool:
+        """Writer-thread body of deactivate_target"""
+        return conn.execute(
+            "UPDATE scraping_targets SET is_active = FALSE WHERE id = ? AND is_active", (target_id,)
+        ).rowcount > 0
     
     def get_active_targets(self, force_refresh: bool = False) -> List[ScrapingTarget]:
         """Get active targets with intelligent caching"""
@@ -381,50 +1104,38 @@ def get_active_targets(self, force_refresh: bool = False) -> List[ScrapingTarget
         
         # Check cache
         if not force_refresh and self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
+            return self._cache[cache_key][0]
         
         try:
-            with self.get_connection() as conn:
+            with self.get_reader() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT * FROM v_active_targets_summary
-                    ORDER BY 
-                        CASE 
-                            WHEN last_scraped IS NULL THEN 0
-                            ELSE (julianday('now') - julianday(last_scraped)) * 24
-                        END DESC,
-                        success_rate ASC
-                """)
+                cursor.execute(_SQL_SELECT_ACTIVE_TARGETS)
                 
-                targets = []
-                for row in cursor.fetchall():
-                    target = ScrapingTarget(
+                # Stream rows straight off the cursor; JSON and TIMESTAMP columns
+                # arrive already converted by the registered sqlite3 converters
+                targets = [
+                    ScrapingTarget(
                         id=row['id'],
                         name=row['name'],
                         url=row['url'],
-                        selectors=json.loads(cursor.execute(
-                            "SELECT selectors FROM scraping_targets WHERE id = ?",
-                            (row['id'],)
-                        ).fetchone()['selectors']),
+                        selectors=row['selectors'],
                         frequency_hours=row['frequency_hours'],
-                        client_id=cursor.execute(
-                            "SELECT client_id FROM scraping_targets WHERE id = ?",
-                            (row['id'],)
-                        ).fetchone()['client_id'],
-                        price_per_month=cursor.execute(
-                            "SELECT price_per_month FROM scraping_targets WHERE id = ?",
-                            (row['id'],)
-                        ).fetchone()['price_per_month'],
-                        last_scraped=datetime.fromisoformat(row['last_scraped']) if row['last_scraped'] else None,
+                        client_id=row['client_id'],
+                        price_per_month=row['price_per_month'],
+                        last_scraped=row['last_scraped'],
                         status=TargetStatus(row['status']),
-                        success_rate=row['success_rate']
+                        success_rate=row['success_rate'],
+                        consecutive_errors=row['consecutive_errors'],
+                        metadata=row['metadata'],
+                        headers=row['headers'],
+                        cookies=row['cookies']
                     )
-                    targets.append(target)
+                    for row in cursor
+                ]
                 
                 # Update cache
-                self._cache[cache_key] = targets
-                self._cache_timestamps[cache_key] = time.time()
+                self._cache_store(cache_key, targets)
                 
                 return targets
                 
@@ -434,14 +1145,8 @@ def get_active_targets(self, force_refresh: bool = False) -> List[ScrapingTarget
     
     async def get_active_targets_async(self) -> List[ScrapingTarget]:
         """Async version for concurrent operations"""
-        async with self.get_async_connection() as conn:
-            cursor = await conn.execute("""
-                SELECT t.*, c.plan_type
-                FROM scraping_targets t
-                JOIN clients c ON t.client_id = c.id
-                WHERE t.is_active = TRUE AND c.is_active = TRUE
-                ORDER BY t.last_scraped ASC NULLS FIRST
-            """)
+        async with self.get_async_connection(read_only=True) as conn:
+            cursor = await conn.execute(_SQL_SELECT_ACTIVE_TARGETS_ASYNC)
             
             rows = await cursor.fetchall()
             targets = []
@@ -451,17 +1156,17 @@ async def get_active_targets_async(self) -> List[ScrapingTarget]:
                     id=row['id'],
                     name=row['name'],
                     url=row['url'],
-                    selectors=json.loads(row['selectors']),
+                    selectors=row['selectors'],
                     frequency_hours=row['frequency_hours'],
                     client_id=row['client_id'],
                     price_per_month=row['price_per_month'],
-                    last_scraped=datetime.fromisoformat(row['last_scraped']) if row['last_scraped'] else None,
+                    last_scraped=row['last_scraped'],
                     status=TargetStatus(row['status']),
                     success_rate=row['success_rate'],
                     consecutive_errors=row['consecutive_errors'],
-                    metadata=json.loads(row['metadata']),
-                    headers=json.loads(row['headers']),
-                    cookies=json.loads(row['cookies'])
+                    metadata=row['metadata'],
+                    headers=row['headers'],
+                    cookies=row['cookies']
                 )
                 targets.append(target)
                 
@@ -469,167 +1174,236 @@ async def get_active_targets_async(self) -> List[ScrapingTarget]:
     def store_scraped_data(self, data: ScrapedData) -> bool:
         """Store scraped data with change detection and performance metrics"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get previous data for comparison
-                cursor.execute("""
-                    SELECT data, hash_signature 
-                    FROM scraped_data 
-                    WHERE target_id = ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1
-                """, (data.target_id,))
-                
-                previous = cursor.fetchone()
-                
-                # Detect changes
-                if previous:
-                    previous_data = json.loads(previous['data'])
-                    changes = data.compare_with(ScrapedData(
-                        data=previous_data,
-                        hash_signature=previous['hash_signature']
-                    ))
-                    data.changes = changes
-                    data.change_detected = bool(changes)
-                
-                # Insert scraped data
-                cursor.execute("""
-                    INSERT INTO scraped_data 
-                    (target_id, data, raw_html, change_detected, changes, hash_signature,
-                     response_time_ms, status_code, content_length, extraction_success_rate,
-                     errors, warnings, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data.target_id, json.dumps(data.data), data.raw_html,
-                    data.change_detected, json.dumps(data.changes), data.hash_signature,
-                    data.response_time_ms, data.status_code, data.content_length,
-                    data.extraction_success_rate, json.dumps(data.errors),
-                    json.dumps(data.warnings), json.dumps(data.metadata)
-                ))
-                
-                # Update target statistics
-                if data.status_code == 200:
-                    cursor.execute("""
-                        UPDATE scraping_targets 
-                        SET last_scraped = CURRENT_TIMESTAMP,
-                            success_rate = MIN(100, success_rate * 0.95 + 5.0),
-                            consecutive_errors = 0,
-                            status = 'active'
-                        WHERE id = ?
-                    """, (data.target_id,))
-                else:
-                    cursor.execute("""
-                        UPDATE scraping_targets 
-                        SET last_scraped = CURRENT_TIMESTAMP,
-                            success_rate = MAX(0, success_rate * 0.95),
-                            error_count = error_count + 1,
-                            consecutive_errors = consecutive_errors + 1,
-                            status = CASE 
-                                WHEN consecutive_errors >= 3 THEN 'error'
-                                ELSE status
-                            END
-                        WHERE id = ?
-                    """, (data.target_id,))
-                
-                # Queue notifications if needed
-                if data.change_detected:
-                    cursor.execute("""
-                        INSERT INTO notification_queue 
-                        (target_id, client_id, notification_type, priority, payload)
-                        SELECT t.id, t.client_id, 'change_detected', 8, ?
-                        FROM scraping_targets t
-                        WHERE t.id = ?
-                    """, (json.dumps({
-                        'changes': data.changes,
-                        'timestamp': data.timestamp.isoformat()
-                    }), data.target_id))
-                
-                # Clear relevant caches
-                self._invalidate_cache('active_targets')
-                
-                return True
-                
+            self.pool.submit_write(self._store_scraped_data_txn, data).result()
         except Exception as e:
             logger.error(f"Error storing scraped data: {e}")
             return False
+        
+        self._bump_versions('targets', 'scraped_data', 'notifications')
+        return True
+    
+    def _store_scraped_data_txn(self, conn: sqlite3.Connection, data: ScrapedData):
+        """Writer-thread body of store_scraped_data"""
+        cursor = conn.cursor()
+        
+        # Get previous data for comparison
+        cursor.execute(_SQL_PREVIOUS_SCRAPE, (data.target_id,))
+        
+        previous = cursor.fetchone()
+        
+        # Detect changes
+        if previous:
+            changes = data.compare_with(ScrapedData(
+                data=previous['data'],
+                hash_signature=previous['hash_signature']
+            ))
+            data.changes = changes
+            data.change_detected = bool(changes)
+        
+        # Insert scraped data
+        data_json = _dumps(data.data)
+        cursor.execute(_SQL_INSERT_SCRAPED_DATA, (
+            data.target_id, data_json,
+            data.change_detected, _dumps(data.changes), data.hash_signature,
+            data.response_time_ms, data.status_code, data.content_length,
+            data.extraction_success_rate, _dumps(data.errors),
+            _dumps(data.warnings), _dumps(data.metadata)
+        ))
+        data.id = cursor.lastrowid
+        cursor.execute(_SQL_UPSERT_LATEST_SCRAPE, (data.target_id, data.id, data_json, data.hash_signature))
+        
+        # ScrapedData already holds the page gzip-compressed; store those bytes as-is
+        if data.raw_html_gz:
+            cursor.execute(_SQL_INSERT_RAW_HTML, (data.id, 'gzip', data.raw_html_gz))
+        
+        # Update target statistics
+        cursor.execute(_SQL_UPDATE_TARGET_STATS, {
+            'status_code': data.status_code, 'target_id': data.target_id
+        })
+        
+        # Queue notifications if needed
+        if data.change_detected:
+            cursor.execute(_SQL_QUEUE_CHANGE_NOTIFICATION, (_dumps({
+                'changes': data.changes,
+                'timestamp': data.timestamp
+            }), data.target_id))
+    
+    def store_scraped_data_bulk(self, items: List[ScrapedData], batch_size: int = 500) -> int:
+        """Store many scrape results, one transaction per batch of batch_size items"""
+        stored = 0
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            try:
+                self.pool.submit_write(self._store_scraped_data_bulk_txn, batch).result()
+                stored += len(batch)
+            except Exception as e:
+                logger.error(f"Error storing scraped data batch: {e}")
+        
+        if stored:
+            self._bump_versions('targets', 'scraped_data', 'notifications')
+        return stored
+    
+    def _store_scraped_data_bulk_txn(self, conn: sqlite3.Connection, items: List[ScrapedData]):
+        """Writer-thread body of store_scraped_data_bulk"""
+        target_ids = list({item.target_id for item in items})
+        placeholders = ",".join("?" * len(target_ids))
+        
+        # Latest stored row per target, fetched in one statement
+        previous = {
+            row['target_id']: row
+            for row in conn.execute(_SQL_PREVIOUS_SCRAPES_FOR_TARGETS.format(placeholders=placeholders), target_ids)
+        }
+        
+        insert_rows, stats_rows, notification_rows = [], [], []
+        for data in items:
+            prev = previous.get(data.target_id)
+            if prev is not None:
+                changes = data.compare_with(ScrapedData(
+                    data=prev['data'],
+                    hash_signature=prev['hash_signature']
+                ))
+                data.changes = changes
+                data.change_detected = bool(changes)
+            # Later items for the same target compare against this one
+            previous[data.target_id] = {'data': data.data, 'hash_signature': data.hash_signature}
+            
+            insert_rows.append((
+                data.target_id, _dumps(data.data),
+                data.change_detected, _dumps(data.changes), data.hash_signature,
+                data.response_time_ms, data.status_code, data.content_length,
+                data.extraction_success_rate, _dumps(data.errors),
+                _dumps(data.warnings), _dumps(data.metadata)
+            ))
+            stats_rows.append({'status_code': data.status_code, 'target_id': data.target_id})
+            if data.change_detected:
+                notification_rows.append((_dumps({
+                    'changes': data.changes,
+                    'timestamp': data.timestamp
+                }), data.target_id))
+        
+        conn.executemany(_SQL_INSERT_SCRAPED_DATA, insert_rows)
+        
+        # The writer thread owns the connection, so the batch received consecutive ids
+        first_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0] - len(items) + 1
+        blob_rows, latest_rows = [], {}
+        for offset, (data, row) in enumerate(zip(items, insert_rows)):
+            data.id = first_id + offset
+            latest_rows[data.target_id] = (data.target_id, data.id, row[1], data.hash_signature)
+            if data.raw_html_gz:
+                blob_rows.append((data.id, 'gzip', data.raw_html_gz))
+        conn.executemany(_SQL_INSERT_RAW_HTML, blob_rows)
+        conn.executemany(_SQL_UPSERT_LATEST_SCRAPE, latest_rows.values())
+        
+        conn.executemany(_SQL_UPDATE_TARGET_STATS, stats_rows)
+        
+        conn.executemany(_SQL_QUEUE_CHANGE_NOTIFICATION, notification_rows)
+    
+    def archive_old_partitions(self, months_to_keep: int = 3) -> int:
+        """Move scraped_data rows older than months_to_keep into scraped_data_YYYYMM tables
+        
+        Each target's latest row stays in scraped_data. Archived rows keep their
+        raw HTML and stay queryable through v_scraped_data_all.
+        """
+        now = datetime.utcnow()
+        months = now.year * 12 + now.month - 1 - months_to_keep
+        cutoff = (months // 12) * 100 + months % 12 + 1
+        
+        try:
+            archived = self.pool.submit_write(self._archive_partitions_txn, cutoff).result()
+        except sqlite3.Error as e:
+            logger.error(f"Error archiving scraped data partitions: {e}")
+            return 0
+        
+        if archived:
+            self._bump_versions('targets', 'scraped_data')
+            logger.info(f"Archived {archived} scraped data rows older than {cutoff}")
+        return archived
+    
+    def _archive_partitions_txn(self, conn: sqlite3.Connection, cutoff: int) -> int:
+        """Writer-thread body of archive_old_partitions"""
+        months = [row[0] for row in conn.execute(
+            "SELECT DISTINCT partition_month FROM scraped_data WHERE partition_month < ?", (cutoff,)
+        )]
+        
+        archived = 0
+        for month in months:
+            table = f"scraped_data_{month}"
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} AS
+                SELECT {_ARCHIVE_COLUMNS}, NULL AS codec, NULL AS raw_html FROM scraped_data WHERE 0
+            """)
+            conn.execute(f"""
+                INSERT INTO {table}
+                SELECT {', '.join('sd.' + col.strip() for col in _ARCHIVE_COLUMNS.split(','))},
+                       b.codec, b.raw_html
+                FROM scraped_data sd
+                LEFT JOIN scraped_data_blobs b ON b.scraped_id = sd.id
+                WHERE sd.partition_month = ?
+                AND sd.id NOT IN (SELECT scraped_id FROM scraped_latest)
+            """, (month,))
+            # Blob rows follow via ON DELETE CASCADE
+            archived += conn.execute("""
+                DELETE FROM scraped_data
+                WHERE partition_month = ?
+                AND id NOT IN (SELECT scraped_id FROM scraped_latest)
+            """, (month,)).rowcount
+        
+        if months:
+            self._rebuild_archive_view(conn)
+            # The deletes above decremented the summary; archived rows still count
+            self._rebuild_target_summary_txn(conn)
+        return archived
+    
+    @staticmethod
+    def _rebuild_archive_view(conn: sqlite3.Connection):
+        """Recreate v_scraped_data_all as scraped_data UNION ALL every archive table"""
+        tables = ['scraped_data'] + [row[0] for row in conn.execute(_SQL_ARCHIVE_TABLES)]
+        conn.execute("DROP VIEW IF EXISTS v_scraped_data_all")
+        conn.execute("CREATE VIEW v_scraped_data_all AS " + " UNION ALL ".join(
+            f"SELECT {_ARCHIVE_COLUMNS} FROM {table}" for table in tables
+        ))
+    
+    def get_raw_html(self, scraped_id: int) -> Optional[str]:
+        """Fetch and decompress the raw HTML stored for a scrape, if any"""
+        with self.get_reader() as conn:
+            row = conn.execute(_SQL_SELECT_RAW_HTML, (scraped_id,)).fetchone()
+        return _decompress_html(row['codec'], row['raw_html']) if row else None
     
     def get_revenue_analytics(self) -> Dict[str, Any]:
         """Get comprehensive revenue analytics with caching"""
         cache_key = 'revenue_analytics'
         
         if self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
+            return self._cache[cache_key][0]
         
         try:
-            with self.get_connection() as conn:
-                # Current MRR
-                mrr_result = conn.execute("""
-                    SELECT SUM(price_per_month) as mrr
-                    FROM scraping_targets
-                    WHERE is_active = TRUE
-                """).fetchone()
-                
-                # Client metrics
-                client_metrics = conn.execute("""
-                    SELECT 
-                        COUNT(DISTINCT c.id) as client_count,
-                        COUNT(DISTINCT CASE WHEN c.plan_type = 'enterprise' THEN c.id END) as enterprise_clients,
-                        AVG(c.satisfaction_score) as avg_satisfaction
-                    FROM clients c
-                    WHERE c.is_active = TRUE
-                """).fetchone()
-                
-                # Target metrics
-                target_metrics = conn.execute("""
-                    SELECT 
-                        COUNT(*) as target_count,
-                        COUNT(CASE WHEN status = 'active' THEN 1 END) as active_targets,
-                        AVG(success_rate) as avg_success_rate,
-                        SUM(CASE WHEN last_scraped > datetime('now', '-24 hours') THEN 1 ELSE 0 END) as recent_scrapes
-                    FROM scraping_targets
-                    WHERE is_active = TRUE
-                """).fetchone()
+            with self.get_reader() as conn:
+                # Headline MRR, client, target, churn and growth metrics in one statement
+                summary = conn.execute(_SQL_REVENUE_SUMMARY).fetchone()
                 
                 # Revenue trend (last 30 days)
-                revenue_trend = pd.read_sql_query("""
-                    SELECT 
-                        DATE(payment_date) as date,
-                        SUM(amount) as revenue
-                    FROM revenue_tracking
-                    WHERE payment_date > datetime('now', '-30 days')
-                        AND status = 'active'
-                    GROUP BY DATE(payment_date)
-                    ORDER BY date
-                """, conn)
-                
-                # Churn risk analysis
-                churn_risk = conn.execute("""
-                    SELECT 
-                        COUNT(CASE WHEN satisfaction_score < 3 THEN 1 END) as high_risk_clients,
-                        COUNT(CASE WHEN last_activity < datetime('now', '-30 days') THEN 1 END) as inactive_clients
-                    FROM clients
-                    WHERE is_active = TRUE
-                """).fetchone()
+                revenue_trend = [
+                    {'date': row[0], 'revenue': row[1]}
+                    for row in conn.execute(_SQL_REVENUE_TREND).fetchall()
+                ]
                 
                 analytics = {
-                    'mrr': float(mrr_result['mrr'] or 0),
-                    'client_count': int(client_metrics['client_count'] or 0),
-                    'enterprise_clients': int(client_metrics['enterprise_clients'] or 0),
-                    'avg_satisfaction': float(client_metrics['avg_satisfaction'] or 5.0),
-                    'target_count': int(target_metrics['target_count'] or 0),
-                    'active_targets': int(target_metrics['active_targets'] or 0),
-                    'avg_success_rate': float(target_metrics['avg_success_rate'] or 100.0),
-                    'recent_scrapes': int(target_metrics['recent_scrapes'] or 0),
-                    'revenue_trend': revenue_trend.to_dict('records'),
-                    'high_risk_clients': int(churn_risk['high_risk_clients'] or 0),
-                    'inactive_clients': int(churn_risk['inactive_clients'] or 0),
-                    'growth_rate': self._calculate_growth_rate(conn)
+                    'mrr': float(summary['mrr'] or 0),
+                    'client_count': int(summary['client_count'] or 0),
+                    'enterprise_clients': int(summary['enterprise_clients'] or 0),
+                    'avg_satisfaction': float(summary['avg_satisfaction'] or 5.0),
+                    'target_count': int(summary['target_count'] or 0),
+                    'active_targets': int(summary['active_targets'] or 0),
+                    'avg_success_rate': float(summary['avg_success_rate'] or 100.0),
+                    'recent_scrapes': int(summary['recent_scrapes'] or 0),
+                    'revenue_trend': revenue_trend,
+                    'high_risk_clients': int(summary['high_risk_clients'] or 0),
+                    'inactive_clients': int(summary['inactive_clients'] or 0),
+                    'growth_rate': float(summary['growth_rate'] or 0.0)
                 }
                 
                 # Cache results
-                self._cache[cache_key] = analytics
-                self._cache_timestamps[cache_key] = time.time()
+                self._cache_store(cache_key, analytics)
                 
                 return analytics
                 
@@ -640,119 +1414,161 @@ def get_revenue_analytics(self) -> Dict[str, Any]:
                 'revenue_trend': [], 'growth_rate': 0
             }
     
-    def _calculate_growth_rate(self, conn) -> float:
-        """Calculate month-over-month growth rate"""
-        try:
-            result = conn.execute("""
-                SELECT 
-                    SUM(CASE WHEN payment_date > datetime('now', '-30 days') THEN amount ELSE 0 END) as current_month,
-                    SUM(CASE WHEN payment_date > datetime('now', '-60 days') 
-                             AND payment_date <= datetime('now', '-30 days') THEN amount ELSE 0 END) as previous_month
-                FROM revenue_tracking
-                WHERE status = 'active'
-            """).fetchone()
-            
-            if result['previous_month'] and result['previous_month'] > 0:
-                return ((result['current_month'] - result['previous_month']) / result['previous_month']) * 100
-            return 0.0
-            
-        except:
-            return 0.0
+    def _version_snapshot(self, key: str) -> Tuple[int, ...]:
+        """Current versions of the tables a cache key depends on"""
+        return tuple(self._table_versions[table] for table in self._CACHE_DEPENDENCIES[key])
+    
+    def _cache_store(self, key: str, value: Any):
+        """Cache value alongside the table versions it was computed from"""
+        self._cache[key] = (value, self._version_snapshot(key))
     
     def _is_cache_valid(self, key: str) -> bool:
         """Check if cached data is still valid"""
-        if key not in self._cache or key not in self._cache_timestamps:
-            return False
-        
-        age = time.time() - self._cache_timestamps[key]
-        return age < self._cache_ttl
+        entry = self._cache.get(key)
+        return entry is not None and entry[1] == self._version_snapshot(key)
     
-    def _invalidate_cache(self, key: Optional[str] = None):
-        """Invalidate cache entries"""
-        if key:
-            self._cache.pop(key, None)
-            self._cache_timestamps.pop(key, None)
-        else:
-            self._cache.clear()
-            self._cache_timestamps.clear()
+    def _bump_versions(self, *tables: str):
+        """Record writes to tables, invalidating every cache entry that reads them"""
+        with self._versions_lock:
+            for table in tables:
+                self._table_versions[table] += 1
     
     def add_client(self, client: Client) -> bool:
         """Add new client with validation"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    INSERT INTO clients 
-                    (id, name, email, company, phone, plan_type, monthly_value, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    client.id, client.name, client.email, client.company,
-                    client.phone, client.plan_type.value, client.monthly_value,
-                    json.dumps(client.metadata)
-                ))
-                
-                self._invalidate_cache()
-                logger.info(f"Added client {client.name}")
-                return True
-                
+            self.pool.submit_write(self._add_clients_txn, [client]).result()
         except sqlite3.IntegrityError:
             logger.error(f"Client with email {client.email} already exists")
             return False
         except Exception as e:
             logger.error(f"Error adding client: {e}")
             return False
+        
+        self._bump_versions('clients')
+        logger.info(f"Added client {client.name}")
+        return True
     
-    def get_recent_changes(self, limit: int = 50) -> pd.DataFrame:
-        """Get recent content changes for monitoring"""
-        with self.get_connection() as conn:
-            return pd.read_sql_query("""
-                SELECT 
-                    sd.timestamp,
-                    t.name as target_name,
-                    t.url,
-                    c.name as client_name,
-                    sd.changes,
-                    sd.response_time_ms
-                FROM scraped_data sd
-                JOIN scraping_targets t ON sd.target_id = t.id
-                JOIN clients c ON t.client_id = c.id
-                WHERE sd.change_detected = TRUE
-                ORDER BY sd.timestamp DESC
-                LIMIT ?
-            """, conn, params=(limit,))
+    def add_clients(self, clients: List[Client]) -> bool:
+        """Add many clients in one transaction; a duplicate email rejects the whole batch"""
+        if not clients:
+            return True
+        
+        try:
+            self.pool.submit_write(self._add_clients_txn, clients).result()
+        except sqlite3.IntegrityError as e:
+            logger.error(f"Duplicate client in batch: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error adding clients: {e}")
+            return False
+        
+        self._bump_versions('clients')
+        logger.info(f"Added {len(clients)} clients")
+        return True
+    
+    def _add_clients_txn(self, conn: sqlite3.Connection, clients: List[Client]):
+        """Writer-thread body of add_client and add_clients"""
+        conn.executemany(_SQL_INSERT_CLIENT, [
+            (
+                client.id, client.name, client.email, client.company,
+                client.phone, client.plan_type.value, client.monthly_value,
+                _dumps(client.metadata)
+            )
+            for client in clients
+        ])
+    
+    def get_recent_changes(self, limit: int = 50, chunksize: int = 10000) -> pd.DataFrame:
+        """Get recent content changes for monitoring
+        
+        Limits above chunksize are read in chunks to bound peak memory.
+        """
+        with self.get_reader() as conn:
+            if limit <= chunksize:
+                return pd.read_sql_query(
+                    _SQL_RECENT_CHANGES, conn, params=(limit,), dtype=_RECENT_CHANGES_DTYPES
+                )
+            
+            parts = list(pd.read_sql_query(
+                _SQL_RECENT_CHANGES, conn, params=(limit,),
+                dtype=_RECENT_CHANGES_DTYPES, chunksize=chunksize
+            ))
+            if not parts:
+                return pd.DataFrame(columns=list(_RECENT_CHANGES_DTYPES))
+            return pd.concat(parts, ignore_index=True)
     
     def cleanup_old_data(self, days_to_keep: int = 90):
         """Clean up old scraped data to manage database size"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Keep at least one record per target
-                cursor.execute("""
-                    DELETE FROM scraped_data
-                    WHERE timestamp < datetime('now', '-' || ? || ' days')
-                    AND id NOT IN (
-                        SELECT MAX(id)
-                        FROM scraped_data
-                        GROUP BY target_id
-                    )
-                """, (days_to_keep,))
-                
-                deleted = cursor.rowcount
-                
-                # Vacuum to reclaim space
-                cursor.execute("VACUUM")
-                
-                logger.info(f"Cleaned up {deleted} old records")
-                return deleted
-                
+            deleted = self.pool.submit_write(self._cleanup_old_data_txn, days_to_keep).result()
         except Exception as e:
             logger.error(f"Error cleaning up old data: {e}")
             return 0
+        
+        self._bump_versions('targets', 'scraped_data')
+        
+        # Bounded reclaim instead of a full VACUUM, which would block every connection
+        self._incremental_vacuum(pages=1000)
+        
+        logger.info(f"Cleaned up {deleted} old records")
+        return deleted
+    
+    def _cleanup_old_data_txn(self, conn: sqlite3.Connection, days_to_keep: int) -> int:
+        """Writer-thread body of cleanup_old_data"""
+        # Keep each target's latest row, as recorded in scraped_latest (the same
+        # definition archive_old_partitions uses)
+        deleted = conn.execute("""
+            DELETE FROM scraped_data
+            WHERE timestamp < datetime('now', '-' || ? || ' days')
+            AND id NOT IN (SELECT scraped_id FROM scraped_latest)
+        """, (days_to_keep,)).rowcount
+        
+        # Archive tables never hold a target's latest row; emptied ones are dropped
+        archive_deleted = 0
+        dropped = False
+        for (table,) in conn.execute(_SQL_ARCHIVE_TABLES).fetchall():
+            archive_deleted += conn.execute(
+                f"DELETE FROM {table} WHERE timestamp < datetime('now', '-' || ? || ' days')",
+                (days_to_keep,)
+            ).rowcount
+            if conn.execute(f"SELECT NOT EXISTS (SELECT 1 FROM {table})").fetchone()[0]:
+                conn.execute(f"DROP TABLE {table}")
+                dropped = True
+        
+        if dropped:
+            self._rebuild_archive_view(conn)
+        if archive_deleted:
+            # Summary triggers only watch scraped_data
+            self._rebuild_target_summary_txn(conn)
+        return deleted + archive_deleted
+    
+    def compact_database(self) -> bool:
+        """Rewrite the whole file with VACUUM; blocks all writers, intended for operator use
+        
+        Also switches older files to auto_vacuum=INCREMENTAL, which only takes
+        effect through a VACUUM.
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+        except sqlite3.Error as e:
+            logger.error(f"Error compacting database: {e}")
+            return False
+        
+        logger.info("Database compacted")
+        return True
     
     def close(self):
         """Close all connections and cleanup"""
+        self._maintenance_stop.set()
+        self.reader_pool.close_all()
         self.pool.close_all()
+        
+        # Stop idle aiosqlite worker threads; close() itself needs a running loop
+        with self._async_lock:
+            idle = self._async_idle[False] + self._async_idle[True]
+            self._async_idle = {False: [], True: []}
+        for conn in idle:
+            conn.stop()
         self._cache.clear()
         logger.info("Database manager closed")
\ No newline at end of file
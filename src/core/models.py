@@ -3,15 +3,61 @@
 Implements domain-driven design patterns for robust data handling
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union, Any
+from dataclasses import dataclass, field, fields, MISSING
+from functools import wraps
+from datetime import datetime
+from typing import List, Dict, Optional, Union, Any, Tuple
 from enum import Enum
+import gzip
 import hashlib
 import json
+import re
+import time
 import uuid
 from urllib.parse import urlparse
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+from .config import get_config
+
+# Compiled once; rejects strings that merely contain an '@'
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+\Z")
+
+def _content_hash(content: bytes) -> str:
+    """Fast non-cryptographic digest for change detection; SHA-256 when config requires it"""
+    if get_config().require_crypto_hash:
+        return hashlib.sha256(content).hexdigest()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(content)
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+def _with_slots(cls):
+    """Rebuild a dataclass with __slots__, as dataclass(slots=True) does on Python 3.10+"""
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names + ('__dict__', '__weakref__'):
+        # Defaults already live in the generated __init__
+        namespace.pop(name, None)
+    namespace['__slots__'] = field_names
+    
+    # init=False fields relied on the class attribute for their default
+    late_defaults = [(f.name, f.default) for f in fields(cls) if not f.init and f.default is not MISSING]
+    if late_defaults:
+        init = namespace['__init__']
+        
+        @wraps(init)
+        def __init__(self, *args, **kwargs):
+            for name, default in late_defaults:
+                setattr(self, name, default)
+            init(self, *args, **kwargs)
+        
+        namespace['__init__'] = __init__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
 class PlanType(Enum):
     """Subscription plan types with feature sets"""
     STARTER = "starter"
@@ -22,27 +68,29 @@ class PlanType(Enum):
     @property
     def max_targets(self) -> int:
         """Get maximum targets allowed for plan"""
-        mapping = {
-            self.STARTER: 5,
-            self.PROFESSIONAL: 15,
-            self.ENTERPRISE: 50,
-            self.CUSTOM: 9999
-        }
-        return mapping.get(self, 5)
+        return _PLAN_MAX_TARGETS[self]
     
     @property
-    def features(self) -> List[str]:
+    def features(self) -> Tuple[str, ...]:
         """Get feature list for plan"""
-        base_features = ["Web Monitoring", "Change Detection", "Email Alerts"]
-        
-        if self == self.STARTER:
-            return base_features
-        elif self == self.PROFESSIONAL:
-            return base_features + ["API Access", "Slack Integration", "Custom Alerts"]
-        elif self == self.ENTERPRISE:
-            return base_features + ["API Access", "Slack Integration", "Custom Alerts", 
-                                   "White Label", "Dedicated Support", "Custom Integrations"]
-        return base_features + ["All Features"]
+        return _PLAN_FEATURES[self]
+
+# Plan lookup tables, built once at import
+_PLAN_MAX_TARGETS = {
+    PlanType.STARTER: 5,
+    PlanType.PROFESSIONAL: 15,
+    PlanType.ENTERPRISE: 50,
+    PlanType.CUSTOM: 9999
+}
+
+_BASE_FEATURES = ("Web Monitoring", "Change Detection", "Email Alerts")
+_PLAN_FEATURES = {
+    PlanType.STARTER: _BASE_FEATURES,
+    PlanType.PROFESSIONAL: _BASE_FEATURES + ("API Access", "Slack Integration", "Custom Alerts"),
+    PlanType.ENTERPRISE: _BASE_FEATURES + ("API Access", "Slack Integration", "Custom Alerts",
+                                           "White Label", "Dedicated Support", "Custom Integrations"),
+    PlanType.CUSTOM: _BASE_FEATURES + ("All Features",)
+}
 
 class TargetStatus(Enum):
     """Scraping target operational status"""
@@ -51,6 +99,7 @@ class TargetStatus(Enum):
     ERROR = "error"
     MAINTENANCE = "maintenance"
     ARCHIVED = "archived"
+@_with_slots
 @dataclass
 class ScrapingTarget:
     """Enhanced scraping target with comprehensive validation and business logic"""
@@ -71,6 +120,13 @@ class ScrapingTarget:
     metadata: Dict[str, Any] = field(default_factory=dict)
     headers: Dict[str, str] = field(default_factory=dict)
     cookies: Dict[str, str] = field(default_factory=dict)
+    keep_raw_html: bool = False  # retain the fetched page on ScrapedData
+    _health_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _health_cache_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Epoch value of last_scraped for the scheduling check, recomputed
+    # whenever last_scraped is reassigned (datetimes are immutable)
+    _last_scraped_ts: float = field(default=0.0, init=False, repr=False, compare=False)
+    _last_scraped_src: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate and normalize target data"""
@@ -104,24 +160,39 @@ def __post_init__(self):
                 "price": "[class*='price']",
                 "availability": "[class*='stock'], [class*='availability']"
             }
+        
+        # Persisted through metadata so no schema change is needed
+        if self.keep_raw_html:
+            self.metadata['keep_raw_html'] = True
+        else:
+            self.keep_raw_html = bool(self.metadata.get('keep_raw_html', False))
     
     @property
     def is_due_for_scraping(self) -> bool:
         """Check if target is due for scraping based on frequency"""
-        if not self.last_scraped:
+        last = self.last_scraped
+        if not isinstance(last, datetime):
             return True
         
-        next_scrape = self.last_scraped + timedelta(hours=self.frequency_hours)
-        return datetime.now() >= next_scrape
+        if last is not self._last_scraped_src:
+            self._last_scraped_ts, self._last_scraped_src = last.timestamp(), last
+        return time.time() - self._last_scraped_ts >= self.frequency_hours * 3600
     
     @property
     def health_score(self) -> float:
         """Calculate target health score (0-100)"""
+        key = (self.consecutive_errors, self.success_rate)
+        if key == self._health_cache_key:
+            return self._health_cache
+        
         if self.consecutive_errors >= 5:
-            return 0.0
+            score = 0.0
+        else:
+            error_penalty = min(self.consecutive_errors * 20, 80)
+            score = max(self.success_rate - error_penalty, 0)
         
-        error_penalty = min(self.consecutive_errors * 20, 80)
-        return max(self.success_rate - error_penalty, 0)
+        self._health_cache, self._health_cache_key = score, key
+        return score
     
     def update_stats(self, success: bool, response_time: float = 0):
         """Update target statistics after scraping attempt"""
@@ -139,6 +210,8 @@ def update_stats(self, success: bool, response_time: float = 0):
                 
         self.last_scraped = datetime.now()
         self.metadata['last_response_time'] = response_time
+        self._health_cache_key = None
+@_with_slots
 @dataclass
 class ScrapedData:
     """Enhanced scraped data model with comprehensive metrics"""
@@ -146,7 +219,7 @@ class ScrapedData:
     target_id: str = ""
     timestamp: datetime = field(default_factory=datetime.now)
     data: Dict[str, Any] = field(default_factory=dict)
-    raw_html: Optional[str] = None
+    _raw_html_gz: Optional[bytes] = field(default=None, repr=False)
     change_detected: bool = False
     changes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     hash_signature: str = ""
@@ -161,37 +234,44 @@ class ScrapedData:
     def __post_init__(self):
         """Generate hash signature if not provided"""
         if not self.hash_signature and self.data:
-            content = json.dumps(self.data, sort_keys=True)
-            self.hash_signature = hashlib.sha256(content.encode()).hexdigest()
+            content = json.dumps(self.data, sort_keys=True, separators=(',', ':'))
+            self.hash_signature = _content_hash(content.encode())
+    
+    @property
+    def raw_html(self) -> Optional[str]:
+        """Raw page HTML, decompressed on access"""
+        return gzip.decompress(self._raw_html_gz).decode("utf-8") if self._raw_html_gz else None
+    
+    @property
+    def raw_html_gz(self) -> Optional[bytes]:
+        """Raw page HTML as stored, gzip-compressed"""
+        return self._raw_html_gz
+    
+    def set_raw_html(self, html: Optional[str]):
+        """Keep the raw page HTML gzip-compressed rather than as a str"""
+        self._raw_html_gz = gzip.compress(html.encode("utf-8"), compresslevel=3) if html else None
     
     def compare_with(self, previous: 'ScrapedData') -> Dict[str, Dict[str, Any]]:
         """Compare with previous scrape to detect changes"""
-        changes = {}
+        current, prev = self.data, previous.data
+        current_keys, previous_keys = current.keys(), prev.keys()
         
-        for key, current_value in self.data.items():
-            if key in previous.data:
-                previous_value = previous.data[key]
-                if current_value != previous_value:
-                    changes[key] = {
-                        'previous': previous_value,
-                        'current': current_value,
-                        'change_type': self._detect_change_type(previous_value, current_value)
-                    }
-            else:
-                changes[key] = {
-                    'previous': None,
-                    'current': current_value,
-                    'change_type': 'added'
-                }
+        # Key-view set algebra runs in C rather than two interpreter loops
+        changes = {
+            key: {
+                'previous': prev[key],
+                'current': current[key],
+                'change_type': self._detect_change_type(prev[key], current[key])
+            }
+            for key in current_keys & previous_keys
+            if current[key] != prev[key]
+        }
         
-        # Check for removed fields
-        for key in previous.data:
-            if key not in self.data:
-                changes[key] = {
-                    'previous': previous.data[key],
-                    'current': None,
-                    'change_type': 'removed'
-                }
+        for key in current_keys - previous_keys:
+            changes[key] = {'previous': None, 'current': current[key], 'change_type': 'added'}
+        
+        for key in previous_keys - current_keys:
+            changes[key] = {'previous': prev[key], 'current': None, 'change_type': 'removed'}
         
         return changes
     
@@ -204,6 +284,7 @@ def _detect_change_type(self, previous: Any, current: Any) -> str:
                 return 'decreased'
         return 'modified'
 
+@_with_slots
 @dataclass
 class Client:
     """Enhanced client model with comprehensive business logic"""
@@ -222,10 +303,12 @@ class Client:
     lifetime_value: float = 0.0
     notes: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _churn_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _churn_cache_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate client data"""
-        if not self.email or '@' not in self.email:
+        if not self.email or not _EMAIL_RE.match(self.email):
             raise ValueError("Valid email is required")
             
         if not self.name:
@@ -246,7 +329,15 @@ def targets_remaining(self) -> int:
     
     @property
     def churn_risk_score(self) -> float:
-        """Calculate churn risk score (0-100, higher = more risk)"""
+        """Calculate churn risk score (0-100, higher = more risk)
+        
+        Memoized on the inputs plus the current hour, since inactivity grows with time.
+        """
+        key = (self.satisfaction_score, self.last_activity, self.plan_type,
+               self.targets_count, int(time.time() // 3600))
+        if key == self._churn_cache_key:
+            return self._churn_cache
+        
         score = 0.0
         
         # Satisfaction component (40%)
@@ -254,7 +345,7 @@ def churn_risk_score(self) -> float:
         
         # Activity component (30%)
         if self.last_activity:
-            days_inactive = (datetime.now() - self.last_activity).days
+            days_inactive = int((time.time() - self.last_activity.timestamp()) // 86400)
             if days_inactive > 30:
                 score += min(30, days_inactive - 30)
         else:
@@ -267,5 +358,7 @@ def churn_risk_score(self) -> float:
                 score += 30
             elif usage_ratio < 0.5:
                 score += 15
-                
-        return min(100, score)
\ No newline at end of file
+        
+        score = min(100, score)
+        self._churn_cache, self._churn_cache_key = score, key
+        return score
\ No newline at end of file
@@ -6,8 +6,12 @@
 import logging
 import time
 import os
-from functools import wraps
-from typing import Dict, Any, Optional, Callable
+import atexit
+import math
+import threading
+from array import array
+from functools import wraps, lru_cache
+from typing import Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
 import json
 import traceback
@@ -21,69 +25,162 @@
 except ImportError:
     SENTRY_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj: Any, default: Optional[Callable] = None) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return orjson.dumps(obj, default=default)
+else:
+    def _json_dumps(obj: Any, default: Optional[Callable] = None) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return json.dumps(obj, default=default).encode()
+
+# Recent samples retained per timing metric
+TIMING_WINDOW = 1000
+
+# METRICS_ENABLED=0 makes track_performance return functions unwrapped
+_METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") != "0"
+
+# Tag dicts shared by every track_performance sample
+_SUCCESS_TAGS = {"status": "success"}
+_ERROR_TAGS = {"status": "error"}
+
+_ts_cache = [0, ""]
+
+def _now_iso() -> str:
+    """Local time in ISO format at one-second resolution, formatted once per second"""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[1] = datetime.fromtimestamp(t).isoformat()
+        _ts_cache[0] = t
+    return _ts_cache[1]
+
+@lru_cache(maxsize=1024)
+def _tag_key(metric: str, tag_items: Tuple[Tuple[str, str], ...]) -> str:
+    """On-disk key for a metric; only materialized when metrics are saved"""
+    return f"{metric}:{_json_dumps(dict(tag_items)).decode()}"
+
 class MetricsCollector:
     """Collects and tracks application metrics"""
     
-    def __init__(self):
+    def __init__(self, flush_interval: float = 5.0):
         self.metrics = {}
         self.start_time = time.time()
         self.metrics_file = Path("logs/metrics.json")
         self.metrics_file.parent.mkdir(exist_ok=True)
         
+        # Metrics accumulate in memory and are written at most every flush_interval
+        self._dirty = False
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._flush_lock = threading.Lock()
+        threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True).start()
+        atexit.register(self._save_metrics)
+        
     def increment(self, metric: str, value: int = 1, tags: Dict[str, str] = None):
         """Increment a counter metric"""
-        key = f"{metric}:{json.dumps(tags or {})}"
+        key = (metric, tuple(sorted(tags.items())) if tags else ())
         if key not in self.metrics:
             self.metrics[key] = {
                 "name": metric,
                 "type": "counter",
                 "value": 0,
                 "tags": tags or {},
-                "last_updated": datetime.now().isoformat()
+                "last_updated": _now_iso()
             }
         self.metrics[key]["value"] += value
-        self.metrics[key]["last_updated"] = datetime.now().isoformat()
-        self._save_metrics()
+        self.metrics[key]["last_updated"] = _now_iso()
+        self._dirty = True
+        self._maybe_flush()
     
     def gauge(self, metric: str, value: float, tags: Dict[str, str] = None):
         """Set a gauge metric"""
-        key = f"{metric}:{json.dumps(tags or {})}"
+        key = (metric, tuple(sorted(tags.items())) if tags else ())
         self.metrics[key] = {
             "name": metric,
             "type": "gauge", 
             "value": value,
             "tags": tags or {},
-            "last_updated": datetime.now().isoformat()
+            "last_updated": _now_iso()
         }
-        self._save_metrics()
+        self._dirty = True
+        self._maybe_flush()
     
     def timing(self, metric: str, duration_ms: float, tags: Dict[str, str] = None):
         """Record a timing metric"""
-        key = f"{metric}:{json.dumps(tags or {})}"
-        if key not in self.metrics:
-            self.metrics[key] = {
+        key = (metric, tuple(sorted(tags.items())) if tags else ())
+        entry = self.metrics.get(key)
+        if entry is None:
+            entry = self.metrics[key] = {
                 "name": metric,
                 "type": "timing",
-                "values": [],
                 "tags": tags or {},
-                "last_updated": datetime.now().isoformat()
+                "last_updated": _now_iso(),
+                # Ring buffer of the last TIMING_WINDOW samples plus running totals
+                "buf": array('d', [0.0]) * TIMING_WINDOW,
+                "head": 0,
+                "filled": 0,
+                "count": 0,
+                "sum": 0.0,
+                "sum_sq": 0.0,
+                "min": math.inf,
+                "max": -math.inf
             }
-        self.metrics[key]["values"].append(duration_ms)
-        # Keep only last 1000 values
-        if len(self.metrics[key]["values"]) > 1000:
-            self.metrics[key]["values"] = self.metrics[key]["values"][-1000:]
-        self.metrics[key]["last_updated"] = datetime.now().isoformat()
-        self._save_metrics()
+        
+        head = entry["head"]
+        entry["buf"][head] = duration_ms
+        entry["head"] = (head + 1) % TIMING_WINDOW
+        if entry["filled"] < TIMING_WINDOW:
+            entry["filled"] += 1
+        entry["count"] += 1
+        entry["sum"] += duration_ms
+        entry["sum_sq"] += duration_ms * duration_ms
+        if duration_ms < entry["min"]:
+            entry["min"] = duration_ms
+        if duration_ms > entry["max"]:
+            entry["max"] = duration_ms
+        entry["last_updated"] = _now_iso()
+        self._dirty = True
+        self._maybe_flush()
+    
+    def _maybe_flush(self):
+        """Persist metrics if the flush interval has elapsed"""
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self._save_metrics()
+    
+    def _flush_loop(self):
+        """Background flush so quiet periods still reach disk"""
+        while True:
+            time.sleep(self._flush_interval)
+            self._maybe_flush()
     
     def _save_metrics(self):
         """Persist metrics to disk"""
-        try:
-            with open(self.metrics_file, 'w') as f:
-                json.dump(self.metrics, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save metrics: {e}")
+        with self._flush_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            
+            # Write a temp file and swap it in so readers never see a partial file
+            tmp_file = self.metrics_file.with_suffix(".json.tmp")
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(_json_dumps(
+                        {_tag_key(*key): metric for key, metric in list(self.metrics.items())},
+                        default=array.tolist
+                    ))
+                os.replace(tmp_file, self.metrics_file)
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Failed to save metrics: {e}")
     
     def get_summary(self) -> Dict[str, Any]:
         """Get metrics summary"""
@@ -92,17 +189,26 @@ def get_summary(self) -> Dict[str, Any]:
             "metrics": {}
         }
         
-        for key, metric in self.metrics.items():
+        for key, metric in list(self.metrics.items()):
             name = metric["name"]
             if name not in summary["metrics"]:
                 summary["metrics"][name] = []
             
-            if metric["type"] == "timing" and metric.get("values"):
-                avg_time = sum(metric["values"]) / len(metric["values"])
-                metric["average"] = avg_time
-                metric["min"] = min(metric["values"])
-                metric["max"] = max(metric["values"])
-                metric.pop("values", None)  # Don't include all values in summary
+            if metric["type"] == "timing":
+                # Derived from the running totals; raw samples stay out of the summary
+                count = metric["count"]
+                average = metric["sum"] / count
+                metric = {
+                    "name": name,
+                    "type": "timing",
+                    "tags": metric["tags"],
+                    "last_updated": metric["last_updated"],
+                    "count": count,
+                    "average": average,
+                    "min": metric["min"],
+                    "max": metric["max"],
+                    "stddev": math.sqrt(max(metric["sum_sq"] / count - average * average, 0.0))
+                }
             
             summary["metrics"][name].append(metric)
         
@@ -111,12 +217,37 @@ def get_summary(self) -> Dict[str, Any]:
 # Global metrics collector
 metrics = MetricsCollector()
 
+# Append-only error log, rotated to errors.jsonl.1 once it passes ERROR_LOG_MAX_BYTES
+ERROR_LOG_FILE = Path("logs/errors.jsonl")
+ERROR_LOG_MAX_BYTES = 10 * 1024 * 1024
+_error_log = None
+_error_log_lock = threading.Lock()
+
+def _write_error_log(entry: Dict[str, Any]):
+    """Append one error record as a JSON line, rotating the file when it grows too large"""
+    global _error_log
+    line = _json_dumps(entry, default=str) + b"\n"
+    with _error_log_lock:
+        if _error_log is None:
+            ERROR_LOG_FILE.parent.mkdir(exist_ok=True)
+            _error_log = open(ERROR_LOG_FILE, 'ab', buffering=0)
+        _error_log.write(line)
+        if _error_log.tell() > ERROR_LOG_MAX_BYTES:
+            _error_log.close()
+            os.replace(ERROR_LOG_FILE, ERROR_LOG_FILE.with_name(ERROR_LOG_FILE.name + ".1"))
+            _error_log = open(ERROR_LOG_FILE, 'ab', buffering=0)
+
 def track_performance(metric_name: str = None):
     """Decorator to track function performance"""
     def decorator(func: Callable) -> Callable:
+        if not _METRICS_ENABLED:
+            return func
+        
+        name = metric_name or f"function.{func.__name__}"
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             error_occurred = False
             
             try:
@@ -131,19 +262,16 @@ def wrapper(*args, **kwargs):
                 })
                 raise
             finally:
-                duration_ms = (time.time() - start_time) * 1000
-                name = metric_name or f"function.{func.__name__}"
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 
-                metrics.timing(name, duration_ms, tags={
-                    "status": "error" if error_occurred else "success"
-                })
+                metrics.timing(name, duration_ms, tags=_ERROR_TAGS if error_occurred else _SUCCESS_TAGS)
                 
                 if duration_ms > 5000:  # Log slow operations
                     logger.warning(f"Slow operation: {name} took {duration_ms:.0f}ms")
         
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             error_occurred = False
             
             try:
@@ -158,12 +286,9 @@ async def async_wrapper(*args, **kwargs):
                 })
                 raise
             finally:
-                duration_ms = (time.time() - start_time) * 1000
-                name = metric_name or f"function.{func.__name__}"
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 
-                metrics.timing(name, duration_ms, tags={
-                    "status": "error" if error_occurred else "success"
-                })
+                metrics.timing(name, duration_ms, tags=_ERROR_TAGS if error_occurred else _SUCCESS_TAGS)
                 
                 if duration_ms > 5000:  # Log slow operations
                     logger.warning(f"Slow operation: {name} took {duration_ms:.0f}ms")
@@ -195,29 +320,15 @@ def track_error(error: Exception, context: Dict[str, Any] = None):
     
     # Save error details
     error_log = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "type": error_type,
         "message": error_message,
         "traceback": traceback.format_exc(),
         "context": context or {}
     }
     
-    error_file = Path("logs/errors.json")
-    error_file.parent.mkdir(exist_ok=True)
-    
     try:
-        errors = []
-        if error_file.exists():
-            with open(error_file, 'r') as f:
-                errors = json.load(f)
-        
-        errors.append(error_log)
-        # Keep only last 1000 errors
-        if len(errors) > 1000:
-            errors = errors[-1000:]
-        
-        with open(error_file, 'w') as f:
-            json.dump(errors, f, indent=2)
+        _write_error_log(error_log)
     except Exception as e:
         logger.error(f"Failed to save error log: {e}")
 
@@ -239,55 +350,86 @@ def init_monitoring():
     metrics.increment("app.startup")
 
 # Health check endpoint data
+HEALTH_SAMPLE_TTL = 2.0  # seconds disk/memory/metrics samples are reused
+_health_db = None
+_health_sample_cache = {"ts": 0.0, "value": None}
+
 class HealthChecker:
     """System health monitoring"""
     
     @staticmethod
-    def get_health_status() -> Dict[str, Any]:
-        """Get current system health status"""
-        from ..database import DatabaseManager
-        
-        health = {
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "checks": {}
-        }
+    def _get_database():
+        """Shared DatabaseManager for health probes, created on first use"""
+        global _health_db
+        if _health_db is None:
+            from .database import DatabaseManager
+            _health_db = DatabaseManager()
+        return _health_db
+    
+    @staticmethod
+    def _sample_system() -> Dict[str, Any]:
+        """Disk, memory and metrics checks, cached for HEALTH_SAMPLE_TTL seconds"""
+        now = time.monotonic()
+        if _health_sample_cache["value"] is not None and now - _health_sample_cache["ts"] < HEALTH_SAMPLE_TTL:
+            return _health_sample_cache["value"]
         
-        # Check database
-        try:
-            db = DatabaseManager()
-            with db.get_connection() as conn:
-                conn.execute("SELECT 1")
-            health["checks"]["database"] = {"status": "ok"}
-        except Exception as e:
-            health["checks"]["database"] = {"status": "error", "message": str(e)}
-            health["status"] = "unhealthy"
+        checks = {}
         
         # Check disk space
         try:
             import shutil
             usage = shutil.disk_usage("/")
             free_gb = usage.free / (1024**3)
-            health["checks"]["disk"] = {
+            checks["disk"] = {
                 "status": "ok" if free_gb > 1 else "warning",
                 "free_gb": round(free_gb, 2)
             }
         except:
-            health["checks"]["disk"] = {"status": "unknown"}
+            checks["disk"] = {"status": "unknown"}
         
         # Check memory
         try:
             import psutil
             memory = psutil.virtual_memory()
-            health["checks"]["memory"] = {
+            checks["memory"] = {
                 "status": "ok" if memory.percent < 90 else "warning",
                 "percent_used": memory.percent
             }
         except:
-            health["checks"]["memory"] = {"status": "unknown"}
+            checks["memory"] = {"status": "unknown"}
+        
+        sample = {"checks": checks, "metrics": metrics.get_summary()}
+        _health_sample_cache["ts"] = now
+        _health_sample_cache["value"] = sample
+        return sample
+    
+    @staticmethod
+    def get_health_status(db=None) -> Dict[str, Any]:
+        """Get current system health status
+        
+        db defaults to a module-level DatabaseManager shared across probes.
+        """
+        health = {
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "checks": {}
+        }
+        
+        # Check database on an already-open pooled connection
+        try:
+            db = db or HealthChecker._get_database()
+            with db.get_connection() as conn:
+                conn.execute("SELECT 1")
+            health["checks"]["database"] = {"status": "ok"}
+        except Exception as e:
+            health["checks"]["database"] = {"status": "error", "message": str(e)}
+            health["status"] = "unhealthy"
+        
+        sample = HealthChecker._sample_system()
+        health["checks"].update(sample["checks"])
         
         # Add metrics summary
-        health["metrics"] = metrics.get_summary()
+        health["metrics"] = sample["metrics"]
         
         return health
 
@@ -6,7 +6,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from .config import get_config
 
 logger = logging.getLogger(__name__)
@@ -17,7 +17,9 @@ class ProxyLoader:
     def __init__(self, config_file: Optional[Path] = None):
         self.config = get_config()
         self.config_file = config_file or self.config.scraping.proxy.config_file
-        self.proxies = []
+        # Insertion-ordered set of proxy URLs: O(1) membership and removal,
+        # file order kept for rotation
+        self.proxies: Dict[str, None] = {}
         self._load_proxies()
     
     def _load_proxies(self):
@@ -42,20 +44,13 @@ def _load_proxies(self):
                 password = proxy_conf.get('password')
                 
                 if username and password:
-                    # Insert credentials into URL
-                    from urllib.parse import urlparse, urlunparse
-                    parsed = urlparse(proxy_url)
-                    netloc_with_auth = f"{username}:{password}@{parsed.netloc}"
-                    proxy_url = urlunparse((
-                        parsed.scheme,
-                        netloc_with_auth,
-                        parsed.path,
-                        parsed.params,
-                        parsed.query,
-                        parsed.fragment
-                    ))
+                    # Insert credentials into URL unless its authority already carries some
+                    scheme, sep, rest = proxy_url.partition("://")
+                    if sep and "@" not in rest.split("/", 1)[0]:
+                        proxy_url = f"{scheme}://{username}:{password}@{rest}"
                 
-                self.proxies.append(proxy_url)
+                # Duplicate entries in the file collapse into one
+                self.proxies[proxy_url] = None
                 
             logger.info(f"Loaded {len(self.proxies)} proxies from {self.config_file}")
             
@@ -64,17 +59,15 @@ def _load_proxies(self):
     
     def get_proxy_list(self) -> List[str]:
         """Get list of proxy URLs"""
-        return self.proxies.copy()
+        return list(self.proxies)
     
     def add_proxy(self, proxy_url: str):
         """Add a proxy to the list"""
-        if proxy_url not in self.proxies:
-            self.proxies.append(proxy_url)
+        self.proxies.setdefault(proxy_url)
     
     def remove_proxy(self, proxy_url: str):
         """Remove a proxy from the list"""
-        if proxy_url in self.proxies:
-            self.proxies.remove(proxy_url)
+        self.proxies.pop(proxy_url, None)
     
     def save_proxies(self):
         """Save current proxy list back to config file"""
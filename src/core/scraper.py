@@ -5,7 +5,8 @@
 
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+import ssl
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
 from typing import Dict, Optional, List, Any, Tuple
 import time
@@ -15,12 +16,19 @@
 from functools import lru_cache
 import logging
 from urllib.parse import urljoin, urlparse
+from email.utils import parsedate_to_datetime
 import re
-from contextlib import asynccontextmanager
 import random
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+import os
 import pickle
+import queue
+import threading
+import atexit
 from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 
 from .models import ScrapingTarget, ScrapedData
 from .config import get_config
@@ -33,8 +41,182 @@
     STEALTH_AVAILABLE = False
     logging.warning("Stealth scraper not available, using basic scraping")
 
+# C-backed HTML parser for BeautifulSoup
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Only advertise encodings the HTTP clients can actually decode: aiohttp and
+# urllib3 handle br through the brotli C extension and zstd through their
+# respective zstd backends, when installed
+try:
+    from aiohttp import compression_utils as _aiohttp_compression
+    _AIOHTTP_ENCODINGS = ['gzip', 'deflate']
+    if getattr(_aiohttp_compression, 'HAS_BROTLI', False):
+        _AIOHTTP_ENCODINGS.append('br')
+    if getattr(_aiohttp_compression, 'HAS_ZSTD', False):
+        _AIOHTTP_ENCODINGS.append('zstd')
+except ImportError:
+    _AIOHTTP_ENCODINGS = ['gzip', 'deflate']
+ASYNC_ACCEPT_ENCODING = ', '.join(_AIOHTTP_ENCODINGS)
+
+try:
+    from urllib3.util.request import ACCEPT_ENCODING as SYNC_ACCEPT_ENCODING
+except ImportError:
+    SYNC_ACCEPT_ENCODING = 'gzip, deflate'
+
+# Compiled CSS selectors evaluated directly against an lxml tree
+try:
+    import lxml.html
+    from lxml import etree
+    from cssselect import HTMLTranslator, SelectorError
+    CSSSELECT_AVAILABLE = True
+except ImportError:
+    CSSSELECT_AVAILABLE = False
+
+# Fast non-cryptographic hash for response cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+# Shared so TLS sessions can be resumed across requests to the same host
+_SSL_CONTEXT = ssl.create_default_context()
+# Concurrent requests allowed against a single host
+PER_HOST_CONCURRENCY = 10
+# Statuses worth retrying in the async fetch path, and the longest pause between attempts
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+RETRY_MAX_DELAY = 30.0
+# Seconds between background saves of the last-hash map
+HASH_FLUSH_INTERVAL = 5.0
+# Batch size from which scrape_multiple_async extracts in worker processes
+PROCESS_POOL_MIN_TARGETS = 20
+_TAG_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9]*$')
+
+
+def _hash_data(data: Dict[str, Any]) -> str:
+    """SHA-256 of the sorted JSON encoding of extracted data
+
+    The byte format (default separators, ASCII escapes) must not change:
+    stored last hashes and hash_signature values were computed from it.
+    """
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(url: str, header_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Response cache key; not security sensitive, so xxh3 when available"""
+    material = '\n'.join([url] + [f"{name}:{value}" for name, value in header_items]).encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(material)
+    return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _build_strainer(selectors: Tuple[str, ...]) -> Optional[SoupStrainer]:
+    """Restrict parsing to the selected tags when every selector is a bare tag name"""
+    if selectors and all(_TAG_NAME_RE.match(sel) for sel in selectors):
+        return SoupStrainer(list(set(selectors)))
+    return None
+
+
+# First number in the text, digits with any '.'/',' grouping or decimal separators
+_PRICE_RE = re.compile(r'-?\d+(?:[.,]\d+)*')
+# Availability keywords; the group name of the first match is the normalized status
+_AVAIL_RE = re.compile(
+    r'(?P<out_of_stock>out[- ]of[- ]stock|unavailable|sold out)'
+    r'|(?P<in_stock>in[- ]stock|available|ready)'
+    r'|(?P<limited>limited|low stock|few left)'
+)
+_AVAILABILITY_FIELD_WORDS = ('availability', 'stock', 'available')
+_REGEX_META_RE = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+
+@dataclass(frozen=True)
+class _SelectorPlan:
+    """Pre-parsed form of a selector string for _extract_with_strategy"""
+    css: bool
+    attr: Optional[Tuple[str, str]]
+    text_pattern: Optional[Any]
+    # Lowercased literal for 'text:' selectors that can be searched via lxml
+    text_needle: Optional[str]
+    chain: Optional[Tuple[str, ...]]
+
+
+@lru_cache(maxsize=4096)
+def _compile_selector(selector: str) -> _SelectorPlan:
+    """Parse a selector once into the strategies that can apply to it"""
+    attr = None
+    if '=' in selector:
+        attr_name, attr_value = selector.split('=', 1)
+        attr = (attr_name, attr_value.strip('"\''))
+    
+    text_pattern = None
+    text_needle = None
+    if selector.startswith('text:'):
+        search_text = selector[5:].strip()
+        try:
+            text_pattern = re.compile(search_text, re.I)
+        except re.error:
+            pass
+        # XPath translate() only folds ASCII case, and contains() is literal
+        if search_text.isascii() and not _REGEX_META_RE.search(search_text):
+            text_needle = search_text.lower()
+    
+    chain = None
+    if '>' in selector:
+        chain = tuple(p.strip() for p in selector.split('>'))
+    
+    return _SelectorPlan(
+        css=selector.startswith(('.', '#', '[')) or ' ' in selector,
+        attr=attr,
+        text_pattern=text_pattern,
+        text_needle=text_needle,
+        chain=chain,
+    )
+
+
+if CSSSELECT_AVAILABLE:
+    _CSS_TRANSLATOR = HTMLTranslator()
+    # Same text get_text(strip=True) sees: no comments, scripts or styles
+    _TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+    # First visible text node containing $needle, compared case-insensitively
+    _TEXT_SEARCH_XPATH = etree.XPath(
+        "//text()[not(ancestor::script) and not(ancestor::style)]"
+        "[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), $needle)]"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _css_xpath(selector: str) -> Optional[Any]:
+    """Compile a CSS selector to an lxml XPath, or None if it needs the soup strategies"""
+    if not CSSSELECT_AVAILABLE:
+        return None
+    plan = _compile_selector(selector)
+    if not plan.css or plan.attr or plan.text_pattern is not None:
+        return None
+    try:
+        return etree.XPath(_CSS_TRANSLATOR.css_to_xpath(selector))
+    except (SelectorError, etree.XPathError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _field_kind(field_name: str) -> str:
+    """Classify a field name as 'price', 'availability' or 'text'"""
+    lowered = field_name.lower()
+    if 'price' in lowered:
+        return 'price'
+    if any(keyword in lowered for keyword in _AVAILABILITY_FIELD_WORDS):
+        return 'availability'
+    return 'text'
+
 class RateLimiter:
     """Token bucket rate limiter for controlling request frequency"""
     
@@ -42,23 +224,26 @@ def __init__(self, rate: float = 1.0, burst: int = 1):
         self.rate = rate  # requests per second
         self.burst = burst  # burst capacity
         self.tokens = burst
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
     
     async def acquire(self):
         """Acquire permission to make a request"""
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_update
-            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            
-            if self.tokens < 1:
-                sleep_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(sleep_time)
-                self.tokens = 1
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                elapsed = now - self.last_update
+                self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+                self.last_update = now
                 
-            self.tokens -= 1
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                sleep_time = (1 - self.tokens) / self.rate
+            
+            # Sleep without holding the lock so other waiters can re-check
+            await asyncio.sleep(sleep_time)
+
 class CircuitBreaker:
     """Circuit breaker pattern to prevent cascading failures"""
     
@@ -68,33 +253,72 @@ def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60):
         self.failure_count = 0
         self.last_failure_time = None
         self.state = 'closed'  # closed, open, half-open
+        # When the single half-open probe was admitted (None if no probe in flight)
+        self._probe_started = None
         
     def call_succeeded(self):
         """Reset circuit breaker on successful call"""
         self.failure_count = 0
         self.state = 'closed'
+        self._probe_started = None
         
     def call_failed(self):
         """Record failure and potentially open circuit"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
+        self._probe_started = None
         
         if self.failure_count >= self.failure_threshold:
+            if self.state != 'open':
+                logger.warning(f"Circuit breaker opened after {self.failure_count} failures")
             self.state = 'open'
-            logger.warning(f"Circuit breaker opened after {self.failure_count} failures")
     
     @property
     def is_open(self) -> bool:
-        """Check if circuit is open (failing)"""
+        """Check if circuit is open (failing); admits one probe at a time when half-open"""
         if self.state == 'closed':
             return False
-            
-        if self.state == 'open' and self.last_failure_time:
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                self.state = 'half-open'
-                return False
-                
-        return self.state == 'open'
+        
+        now = time.monotonic()
+        if self.state == 'open':
+            if self.last_failure_time is None or now - self.last_failure_time <= self.recovery_timeout:
+                return True
+            self.state = 'half-open'
+        
+        # Half-open: let exactly one caller through. A probe whose outcome was
+        # never reported is considered lost after recovery_timeout.
+        if self._probe_started is not None and now - self._probe_started <= self.recovery_timeout:
+            return True
+        self._probe_started = now
+        return False
+
+
+class CircuitBreakerRegistry(OrderedDict):
+    """Per-key circuit breakers, capped in size by evicting idle closed breakers"""
+    
+    def __init__(self, max_size: int = 10000):
+        super().__init__()
+        self.max_size = max_size
+    
+    def __missing__(self, key: str) -> CircuitBreaker:
+        breaker = CircuitBreaker()
+        self[key] = breaker
+        if len(self) > self.max_size:
+            self._evict()
+        return breaker
+    
+    def __getitem__(self, key: str) -> CircuitBreaker:
+        breaker = super().__getitem__(key)
+        self.move_to_end(key)
+        return breaker
+    
+    def _evict(self):
+        """Drop the least recently used closed breaker, or the oldest if none is closed"""
+        for key, breaker in self.items():
+            if breaker.state == 'closed':
+                del self[key]
+                return
+        self.popitem(last=False)
 
 class ResponseCache:
     """LRU cache for HTTP responses with TTL support"""
@@ -102,29 +326,34 @@ class ResponseCache:
     def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache = {}
-        self.access_times = {}
+        # key -> (response, monotonic timestamp), ordered least to most recently used
+        self.cache = OrderedDict()
         self.cache_dir = Path(get_config().project_root) / "temp" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Disk writes are handed to a background thread so scrapes running on
+        # the event loop never block on pickling and file I/O
+        self._write_queue = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
         
     def _get_cache_key(self, url: str, headers: Dict = None) -> str:
         """Generate cache key from URL and headers"""
-        key_data = {'url': url, 'headers': headers or {}}
-        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+        return _cache_key(url, tuple(sorted(headers.items())) if headers else ())
     
     def get(self, url: str, headers: Dict = None) -> Optional[Tuple[str, int]]:
         """Get cached response if valid"""
         key = self._get_cache_key(url, headers)
         
-        if key in self.cache:
-            timestamp = self.access_times[key]
-            if time.time() - timestamp < self.ttl_seconds:
+        entry = self.cache.get(key)
+        if entry is not None:
+            response, timestamp = entry
+            if time.monotonic() - timestamp < self.ttl_seconds:
                 logger.debug(f"Cache hit for {url}")
-                return self.cache[key]
+                self.cache.move_to_end(key)
+                return response
             else:
                 # Expired
                 del self.cache[key]
-                del self.access_times[key]
                 
         # Check disk cache
         cache_file = self.cache_dir / f"{key}.pkl"
@@ -132,47 +361,163 @@ def get(self, url: str, headers: Dict = None) -> Optional[Tuple[str, int]]:
             try:
                 with open(cache_file, 'rb') as f:
                     data = pickle.load(f)
-                    if time.time() - data['timestamp'] < self.ttl_seconds:
-                        self.cache[key] = data['response']
-                        self.access_times[key] = data['timestamp']
+                    age = time.time() - data['timestamp']
+                    if age < self.ttl_seconds:
+                        self._remember(key, data['response'], time.monotonic() - age)
                         return data['response']
             except:
                 cache_file.unlink()
                 
         return None
     
+    def _remember(self, key: str, response: Tuple[str, int], timestamp: float):
+        """Store a response in memory, evicting the least recently used entry"""
+        self.cache[key] = (response, timestamp)
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+    
     def set(self, url: str, response: Tuple[str, int], headers: Dict = None):
         """Cache response with TTL"""
         key = self._get_cache_key(url, headers)
         
         # Memory cache
-        if len(self.cache) >= self.max_size:
-            # Evict oldest
-            oldest_key = min(self.access_times, key=self.access_times.get)
-            del self.cache[oldest_key]
-            del self.access_times[oldest_key]
-            
-        self.cache[key] = response
-        self.access_times[key] = time.time()
+        self._remember(key, response, time.monotonic())
         
         # Disk cache for persistence
-        cache_file = self.cache_dir / f"{key}.pkl"
-        with open(cache_file, 'wb') as f:
-            pickle.dump({
-                'timestamp': time.time(),
-                'response': response,
-                'url': url
-            }, f)
+        self._ensure_writer()
+        self._write_queue.put((self.cache_dir / f"{key}.pkl", {
+            'timestamp': time.time(),
+            'response': response,
+            'url': url
+        }))
+    
+    def _ensure_writer(self):
+        """Start the disk writer thread on first use"""
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="response-cache-writer", daemon=True
+                )
+                self._writer.start()
+                atexit.register(self.flush)
+    
+    def _write_loop(self):
+        """Drain queued cache entries to disk in batches"""
+        while True:
+            batch = [self._write_queue.get()]
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for cache_file, payload in batch:
+                try:
+                    with open(cache_file, 'wb') as f:
+                        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                except OSError as e:
+                    logger.warning(f"Failed to write cache file {cache_file}: {e}")
+                finally:
+                    self._write_queue.task_done()
+    
+    def flush(self):
+        """Block until all queued cache entries are written to disk"""
+        if self._writer is not None:
+            self._write_queue.join()
+class _LastHashStore:
+    """Last content hash per target, persisted to one file
+
+    Shared by every scraper that uses the same file, so there is one map,
+    one flush thread and one atexit hook per file rather than per instance.
+    """
+    
+    _stores: Dict[Path, "_LastHashStore"] = {}
+    _stores_lock = threading.Lock()
+    
+    @classmethod
+    def for_file(cls, path: Path) -> "_LastHashStore":
+        path = Path(path).resolve()
+        with cls._stores_lock:
+            store = cls._stores.get(path)
+            if store is None:
+                store = cls._stores[path] = cls(path)
+            return store
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._hashes = self._load()
+        threading.Thread(
+            target=self._flush_loop, name="scraper-hash-flush", daemon=True
+        ).start()
+        atexit.register(self.save)
+    
+    def swap(self, target_id: str, new_hash: str) -> Optional[str]:
+        """Record new_hash for target_id and return the previous hash"""
+        with self._lock:
+            previous = self._hashes.get(target_id)
+            if previous != new_hash:
+                self._hashes[target_id] = new_hash
+                self._dirty = True
+            return previous
+    
+    def _load(self) -> Dict[str, str]:
+        """Load the hashes file, importing legacy per-target files once"""
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read {self.path}: {e}")
+            return {}
+        
+        hashes = {}
+        for legacy in self.path.parent.glob("*_last_hash.txt"):
+            try:
+                hashes[legacy.name[:-len("_last_hash.txt")]] = legacy.read_text().strip()
+            except OSError:
+                pass
+        self._dirty = bool(hashes)
+        return hashes
+    
+    def _flush_loop(self):
+        while True:
+            time.sleep(HASH_FLUSH_INTERVAL)
+            self.save()
+    
+    def save(self):
+        """Persist the hashes if they changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            snapshot = dict(self._hashes)
+            
+            # Write a temp file and swap it in so readers never see a partial file
+            tmp_file = self.path.with_suffix(".json.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_text(json.dumps(snapshot))
+                os.replace(tmp_file, self.path)
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Failed to save last hashes: {e}")
+
+
 class WebScraper:
     """Enterprise-grade web scraper with advanced extraction and resilience patterns"""
     
     def __init__(self, config=None, proxy_list=None, use_stealth=True):
         self.config = config or get_config()
-        self.rate_limiter = RateLimiter(
-            rate=1.0 / self.config.scraping.rate_limit_delay,
-            burst=5
-        )
-        self.circuit_breakers = defaultdict(lambda: CircuitBreaker())
+        # Rate limiting and circuit breaking are tracked per host so a slow
+        # or failing site cannot stall targets on unrelated hosts
+        rate = 1.0 / self.config.scraping.rate_limit_delay
+        self.rate_limiters = defaultdict(lambda: RateLimiter(rate=rate, burst=5))
+        self.circuit_breakers = CircuitBreakerRegistry()
         self.cache = ResponseCache(
             ttl_seconds=self.config.scraping.cache_ttl
         ) if self.config.scraping.cache_responses else None
@@ -180,7 +525,10 @@ def __init__(self, config=None, proxy_list=None, use_stealth=True):
         # Initialize stealth scraper if available and requested
         self.use_stealth = use_stealth and STEALTH_AVAILABLE
         if self.use_stealth:
-            self.stealth_scraper = StealthScraper(proxy_list=proxy_list)
+            self.stealth_scraper = StealthScraper(
+                proxy_list=proxy_list,
+                rotation_strategy=self.config.scraping.proxy.rotation_strategy
+            )
             logger.info("Stealth scraping enabled with proxy rotation and anti-detection")
         else:
             self.stealth_scraper = None
@@ -190,6 +538,21 @@ def __init__(self, config=None, proxy_list=None, use_stealth=True):
         # Session configuration with connection pooling
         self.session = None
         self.async_session = None
+        self._session_loop = None
+        # Private event loop reused by the synchronous wrappers so the
+        # aiohttp session (which is bound to a loop) survives between calls
+        self._sync_loop = None
+        self._sync_lock = threading.Lock()
+        # Worker processes for batches large enough to shard extraction;
+        # created on first use and kept until aclose()
+        self._process_pool = None
+        self._pool_batches = 0  # running batches that extract in the pool
+        
+        # Last content hash per target for change detection, kept in memory
+        # and flushed to a single file in the background
+        self._last_hashes = _LastHashStore.for_file(
+            Path(self.config.project_root) / "temp" / "last_hashes.json"
+        )
         self._setup_sessions()
         
     def _setup_sessions(self):
@@ -199,7 +562,7 @@ def _setup_sessions(self):
             'User-Agent': self.config.scraping.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': SYNC_ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
@@ -225,13 +588,14 @@ def _setup_sessions(self):
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
-    @asynccontextmanager
-    async def _get_async_session(self):
-        """Get or create async session with connection pooling"""
-        if not self.async_session:
+    async def start(self) -> aiohttp.ClientSession:
+        """Create the shared async session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if (self.async_session is None or self.async_session.closed
+                or self._session_loop is not loop):
             connector = aiohttp.TCPConnector(
                 limit=100,
-                limit_per_host=10,
+                limit_per_host=PER_HOST_CONCURRENCY,
                 ttl_dns_cache=300
             )
             
@@ -249,30 +613,41 @@ async def _get_async_session(self):
                     'User-Agent': self.config.scraping.user_agent,
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                     'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br'
+                    'Accept-Encoding': ASYNC_ACCEPT_ENCODING
                 }
             )
+            self._session_loop = loop
             
-        yield self.async_session
+        return self.async_session
+    
+    async def close(self):
+        """Close the shared async session"""
+        if self.async_session is not None and not self.async_session.closed:
+            await self.async_session.close()
+        self.async_session = None
+        self._session_loop = None
     
     async def scrape_target_async(self, target: ScrapingTarget) -> Optional[ScrapedData]:
         """Asynchronously scrape a target with circuit breaker and caching"""
-        circuit_breaker = self.circuit_breakers[target.id]
+        host = urlparse(target.url).netloc
+        circuit_breaker = self.circuit_breakers[host]
         
         if circuit_breaker.is_open:
-            logger.warning(f"Circuit breaker open for {target.name}")
+            logger.warning(f"Circuit breaker open for {host} ({target.name})")
             return None
             
         try:
             # Rate limiting
-            await self.rate_limiter.acquire()
+            await self.rate_limiters[host].acquire()
             
             # Check cache first
             if self.cache:
                 cached = self.cache.get(target.url, target.headers)
                 if cached:
                     html_content, status_code = cached
-                    return self._extract_data(target, html_content, 0, status_code, from_cache=True)
+                    return await self._extract_data_async(
+                        target, html_content, 0, status_code, from_cache=True
+                    )
             
             # Use stealth scraping if available and enabled
             if self.use_stealth and self.stealth_scraper:
@@ -286,9 +661,7 @@ async def scrape_target_async(self, target: ScrapingTarget) -> Optional[ScrapedD
                         circuit_breaker.call_succeeded()
                         
                         # Create ScrapedData from stealth result
-                        content_hash = hashlib.sha256(
-                            json.dumps(data, sort_keys=True).encode()
-                        ).hexdigest()
+                        content_hash = _hash_data(data)
                         
                         change_detected = self._detect_changes(target.id, content_hash)
                         
@@ -314,44 +687,30 @@ async def scrape_target_async(self, target: ScrapingTarget) -> Optional[ScrapedD
                     # Fall through to basic scraping
             
             # Basic scraping (fallback or when stealth not available)
-            start_time = time.time()
+            html_content, status_code, response_time = await self._fetch(target)
             
-            async with self._get_async_session() as session:
-                headers = {**session.headers, **target.headers}
+            if status_code == 200:
+                circuit_breaker.call_succeeded()
                 
-                async with session.get(
-                    target.url,
-                    headers=headers,
-                    cookies=target.cookies,
-                    allow_redirects=True,
-                    ssl=False  # For development; use True in production
-                ) as response:
-                    response_time = int((time.time() - start_time) * 1000)
-                    html_content = await response.text()
-                    status_code = response.status
+                # Cache successful response
+                if self.cache:
+                    self.cache.set(target.url, (html_content, status_code), target.headers)
+                    
+                return await self._extract_data_async(
+                    target, html_content, response_time, status_code
+                )
+            else:
+                circuit_breaker.call_failed()
+                logger.error(f"Failed to scrape {target.url}: HTTP {status_code}")
+                
+                return ScrapedData(
+                    target_id=target.id,
+                    status_code=status_code,
+                    response_time_ms=response_time,
+                    errors=[f"HTTP {status_code}"],
+                    extraction_success_rate=0.0
+                )
                     
-                    if status_code == 200:
-                        circuit_breaker.call_succeeded()
-                        
-                        # Cache successful response
-                        if self.cache:
-                            self.cache.set(target.url, (html_content, status_code), target.headers)
-                            
-                        return self._extract_data(
-                            target, html_content, response_time, status_code
-                        )
-                    else:
-                        circuit_breaker.call_failed()
-                        logger.error(f"Failed to scrape {target.url}: HTTP {status_code}")
-                        
-                        return ScrapedData(
-                            target_id=target.id,
-                            status_code=status_code,
-                            response_time_ms=response_time,
-                            errors=[f"HTTP {status_code}"],
-                            extraction_success_rate=0.0
-                        )
-                        
         except asyncio.TimeoutError:
             circuit_breaker.call_failed()
             logger.error(f"Timeout scraping {target.url}")
@@ -372,56 +731,105 @@ async def scrape_target_async(self, target: ScrapingTarget) -> Optional[ScrapedD
                 extraction_success_rate=0.0
             )
     
+    async def _fetch(self, target: ScrapingTarget) -> Tuple[str, int, int]:
+        """GET the target, retrying transient failures; returns (body, status, response_ms)"""
+        session = await self.start()
+        attempts = max(1, self.config.scraping.retry_attempts)
+        
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            start_time = time.time()
+            try:
+                # aiohttp merges these over the session's default headers
+                async with session.get(
+                    target.url,
+                    headers=target.headers or None,
+                    cookies=target.cookies or None,
+                    allow_redirects=True,
+                    ssl=_SSL_CONTEXT if self.config.scraping.verify_ssl else False
+                ) as response:
+                    status_code = response.status
+                    if last_attempt or status_code not in RETRY_STATUSES:
+                        html_content = await self._read_body(response)
+                        response_time = int((time.time() - start_time) * 1000)
+                        return html_content, status_code, response_time
+                    delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                    logger.info(f"HTTP {status_code} from {target.url}, retrying in {delay:.1f}s")
+            except asyncio.TimeoutError:
+                if last_attempt:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.info(f"Timeout from {target.url}, retrying in {delay:.1f}s")
+            
+            await asyncio.sleep(delay)
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Backoff before the next attempt, honouring a Retry-After header when present"""
+        if retry_after:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    seconds = retry_at.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    seconds = None
+            if seconds is not None:
+                return min(RETRY_MAX_DELAY, max(0.0, seconds))
+        
+        # Exponential backoff with jitter so retries from many tasks spread out
+        backoff = min(RETRY_MAX_DELAY, self.config.scraping.retry_delay * 2 ** attempt)
+        return backoff * (0.5 + random.random())
+    
+    async def _read_body(self, response: aiohttp.ClientResponse) -> str:
+        """Read at most max_body_bytes and decode with the declared charset"""
+        limit = self.config.scraping.max_body_bytes
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                logger.warning(f"Response from {response.url} truncated at {limit} bytes")
+                break
+        raw = b''.join(chunks)[:limit]
+        
+        # Skip charset sniffing; pages without a declared charset are nearly always UTF-8
+        try:
+            return raw.decode(response.charset or 'utf-8', errors='replace')
+        except LookupError:
+            return raw.decode('utf-8', errors='replace')
+    
     def scrape_target(self, target: ScrapingTarget) -> Optional[ScrapedData]:
         """Synchronous wrapper for scraping (for backward compatibility)"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(self.scrape_target_async(target))
-        finally:
-            loop.close()
+        with self._sync_lock:
+            if self._sync_loop is None or self._sync_loop.is_closed():
+                self._sync_loop = asyncio.new_event_loop()
+            return self._sync_loop.run_until_complete(self.scrape_target_async(target))
     def _extract_data(self, target: ScrapingTarget, html_content: str, 
                      response_time: int, status_code: int, 
-                     from_cache: bool = False) -> ScrapedData:
+                     from_cache: bool = False,
+                     fields: Optional[Tuple[Dict[str, Any], List[str], List[str], int]] = None
+                     ) -> ScrapedData:
         """Extract structured data using BeautifulSoup with intelligent parsing"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            extracted_data = {}
-            extraction_errors = []
-            warnings = []
-            
-            # Track extraction success for each selector
-            successful_extractions = 0
+            if fields is None:
+                fields = _extract_fields(target.selectors, html_content)
+            extracted_data, extraction_errors, warnings, successful_extractions = fields
             total_selectors = len(target.selectors)
             
-            for field_name, selector in target.selectors.items():
-                try:
-                    # Enhanced selector parsing with multiple strategies
-                    value = self._extract_with_strategy(soup, selector, field_name)
-                    
-                    if value is not None:
-                        extracted_data[field_name] = value
-                        successful_extractions += 1
-                    else:
-                        warnings.append(f"No data found for {field_name}")
-                        
-                except Exception as e:
-                    extraction_errors.append(f"Error extracting {field_name}: {str(e)}")
-                    logger.error(f"Extraction error for {field_name} with selector '{selector}': {e}")
-            
             # Calculate extraction success rate
             extraction_rate = (successful_extractions / total_selectors * 100) if total_selectors > 0 else 0
             
             # Generate content hash
-            content_hash = hashlib.sha256(json.dumps(extracted_data, sort_keys=True).encode()).hexdigest()
+            content_hash = _hash_data(extracted_data)
             
             # Detect changes if we have previous data
             change_detected = self._detect_changes(target.id, content_hash)
             
-            return ScrapedData(
+            scraped = ScrapedData(
                 target_id=target.id,
                 data=extracted_data,
-                raw_html=html_content if not from_cache else None,
                 change_detected=change_detected,
                 hash_signature=content_hash,
                 response_time_ms=response_time,
@@ -436,6 +844,10 @@ def _extract_data(self, target: ScrapingTarget, html_content: str,
                     'successful_extractions': successful_extractions
                 }
             )
+            # Raw pages are large; only hold on to them when the target asks for it
+            if target.keep_raw_html and not from_cache:
+                scraped.set_raw_html(html_content)
+            return scraped
             
         except Exception as e:
             logger.error(f"Critical extraction error: {e}")
@@ -447,26 +859,47 @@ def _extract_data(self, target: ScrapingTarget, html_content: str,
                 extraction_success_rate=0.0
             )
     
-    def _extract_with_strategy(self, soup: BeautifulSoup, selector: str, 
+    async def _extract_data_async(self, target: ScrapingTarget, html_content: str,
+                                  response_time: int, status_code: int,
+                                  from_cache: bool = False) -> ScrapedData:
+        """Extract data, parsing in the process pool while a large batch is running"""
+        fields = None
+        if self._pool_batches and self._process_pool is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                fields = await loop.run_in_executor(
+                    self._process_pool, _extract_fields, dict(target.selectors), html_content
+                )
+            except Exception as e:
+                # Fall back to in-process extraction, which reports its own errors
+                logger.debug(f"Process pool extraction failed for {target.url}: {e}")
+        return self._extract_data(
+            target, html_content, response_time, status_code, from_cache, fields
+        )
+    
+    @staticmethod
+    def _extract_with_strategy(soup: BeautifulSoup, selector: str, 
                               field_name: str) -> Optional[Any]:
         """Extract data using multiple strategies for robustness"""
+        plan = _compile_selector(selector)
         
         # Strategy 1: CSS Selector
-        try:
-            if selector.startswith(('.', '#', '[')) or ' ' in selector:
+        if plan.css:
+            try:
                 elements = soup.select(selector)
                 if elements:
+                    kind = _field_kind(field_name)
                     # For price fields, try to extract numeric value
-                    if 'price' in field_name.lower():
-                        return self._extract_price(elements[0])
+                    if kind == 'price':
+                        return WebScraper._extract_price(elements[0])
                     # For availability/stock, extract boolean or text
-                    elif any(keyword in field_name.lower() for keyword in ['availability', 'stock', 'available']):
-                        return self._extract_availability(elements[0])
+                    elif kind == 'availability':
+                        return WebScraper._extract_availability(elements[0])
                     # Default: get text content
                     else:
                         return elements[0].get_text(strip=True)
-        except Exception as e:
-            logger.debug(f"CSS selector failed for {selector}: {e}")
+            except Exception as e:
+                logger.debug(f"CSS selector failed for {selector}: {e}")
         
         # Strategy 2: Direct tag search
         try:
@@ -477,116 +910,131 @@ def _extract_with_strategy(self, soup: BeautifulSoup, selector: str,
             pass
         
         # Strategy 3: Attribute search
-        try:
-            if '=' in selector:
-                attr_name, attr_value = selector.split('=', 1)
-                attr_value = attr_value.strip('"\'')
-                element = soup.find(attrs={attr_name: attr_value})
+        if plan.attr:
+            try:
+                element = soup.find(attrs={plan.attr[0]: plan.attr[1]})
                 if element:
                     return element.get_text(strip=True)
-        except:
-            pass
+            except:
+                pass
         
         # Strategy 4: Text content search
-        try:
-            if selector.startswith('text:'):
-                search_text = selector[5:].strip()
-                element = soup.find(text=re.compile(search_text, re.I))
+        if plan.text_pattern is not None:
+            try:
+                element = soup.find(text=plan.text_pattern)
                 if element:
                     return element.parent.get_text(strip=True)
-        except:
-            pass
+            except:
+                pass
         
         # Strategy 5: XPath-like navigation
-        try:
-            if '>' in selector:
-                parts = [p.strip() for p in selector.split('>')]
+        if plan.chain:
+            try:
                 current = soup
-                for part in parts:
+                for part in plan.chain:
                     current = current.find(part)
                     if not current:
                         break
                 if current:
                     return current.get_text(strip=True)
-        except:
-            pass
+            except:
+                pass
         
         return None
     
-    def _extract_price(self, element) -> Optional[float]:
+    @staticmethod
+    def _extract_price(element) -> Optional[float]:
         """Extract numeric price from element with currency handling"""
-        try:
-            text = element.get_text(strip=True)
-            # Remove currency symbols and normalize
-            price_text = re.sub(r'[^\d.,\-]', '', text)
-            price_text = price_text.replace(',', '')
-            
-            # Handle different decimal separators
-            if '.' in price_text and price_text.count('.') == 1:
-                return float(price_text)
-            elif ',' in price_text and price_text.count(',') == 1:
-                return float(price_text.replace(',', '.'))
-            else:
-                # Try to extract any number
-                numbers = re.findall(r'\d+\.?\d*', price_text)
-                if numbers:
-                    return float(numbers[0])
-        except:
-            pass
+        return WebScraper._parse_price(element.get_text(strip=True))
+    
+    @staticmethod
+    def _parse_price(text: str) -> Optional[float]:
+        """Parse a numeric price from element text"""
+        match = _PRICE_RE.search(text)
+        if not match:
+            return None
+        number = match.group(0)
         
-        return None
+        # The later of '.' and ',' is the decimal separator when both appear;
+        # a lone separator repeated, or a lone comma before exactly three
+        # digits, groups thousands ("1,299", "1.299.000")
+        dot, comma = number.rfind('.'), number.rfind(',')
+        if dot >= 0 and comma >= 0:
+            decimal = '.' if dot > comma else ','
+        elif comma >= 0:
+            decimal = ',' if number.count(',') == 1 and len(number) - comma - 1 != 3 else None
+        elif dot >= 0:
+            decimal = '.' if number.count('.') == 1 else None
+        else:
+            decimal = None
+        
+        if decimal is None:
+            normalized = number.replace(',', '').replace('.', '')
+        else:
+            thousands = ',' if decimal == '.' else '.'
+            normalized = number.replace(thousands, '').replace(decimal, '.')
+        
+        try:
+            return float(normalized)
+        except ValueError:
+            return None
     
-    def _extract_availability(self, element) -> str:
+    @staticmethod
+    def _extract_availability(element) -> str:
         """Extract availability/stock status with normalization"""
         try:
-            text = element.get_text(strip=True).lower()
+            return WebScraper._parse_availability(element.get_text(strip=True))
+        except:
+            return 'unknown'
+    
+    @staticmethod
+    def _parse_availability(text: str) -> str:
+        """Normalize availability text to in_stock/out_of_stock/limited"""
+        try:
+            text = text.lower()
             
-            # Positive indicators
-            if any(word in text for word in ['in stock', 'available', 'in-stock', 'ready']):
-                return 'in_stock'
-            # Negative indicators  
-            elif any(word in text for word in ['out of stock', 'unavailable', 'sold out', 'out-of-stock']):
-                return 'out_of_stock'
-            # Limited availability
-            elif any(word in text for word in ['limited', 'low stock', 'few left']):
-                return 'limited'
-            else:
-                return text[:50]  # Return first 50 chars of original text
+            match = _AVAIL_RE.search(text)
+            if match:
+                return match.lastgroup
+            return text[:50]  # Return first 50 chars of original text
         except:
             return 'unknown'
     
     def _detect_changes(self, target_id: str, new_hash: str) -> bool:
         """Detect if content has changed since last scrape"""
-        # This would typically check against the database
-        # For now, we'll use a simple file-based approach
-        hash_file = Path(self.config.project_root) / "temp" / f"{target_id}_last_hash.txt"
-        
-        try:
-            if hash_file.exists():
-                last_hash = hash_file.read_text().strip()
-                if last_hash != new_hash:
-                    hash_file.write_text(new_hash)
-                    return True
-                return False
-            else:
-                hash_file.parent.mkdir(parents=True, exist_ok=True)
-                hash_file.write_text(new_hash)
-                return False
-        except:
-            return False
+        previous = self._last_hashes.swap(target_id, new_hash)
+        return previous is not None and previous != new_hash
+    
+    def save_last_hashes(self):
+        """Persist last content hashes if they changed"""
+        self._last_hashes.save()
     
     async def scrape_multiple_async(self, targets: List[ScrapingTarget], 
                                    max_concurrent: Optional[int] = None) -> List[ScrapedData]:
         """Scrape multiple targets concurrently with semaphore control"""
         max_concurrent = max_concurrent or self.config.scraping.max_concurrent_scrapers
         semaphore = asyncio.Semaphore(max_concurrent)
+        # Bulkhead: a slow host can hold at most PER_HOST_CONCURRENCY of the
+        # global slots, leaving the rest for other hosts
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(PER_HOST_CONCURRENCY))
         
         async def scrape_with_semaphore(target):
-            async with semaphore:
-                return await self.scrape_target_async(target)
+            async with host_semaphores[urlparse(target.url).netloc]:
+                async with semaphore:
+                    return await self.scrape_target_async(target)
         
-        tasks = [scrape_with_semaphore(target) for target in targets]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Large batches parse HTML in worker processes so extraction is not
+        # bound to the event loop thread
+        use_pool = (os.cpu_count() or 1) > 1 and len(targets) >= PROCESS_POOL_MIN_TARGETS
+        if use_pool:
+            self._get_process_pool()
+            self._pool_batches += 1
+        try:
+            tasks = [scrape_with_semaphore(target) for target in targets]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if use_pool:
+                self._pool_batches -= 1
         
         # Filter out exceptions and None results
         valid_results = []
@@ -598,10 +1046,145 @@ async def scrape_with_semaphore(target):
                 
         return valid_results
     
-    def cleanup(self):
-        """Cleanup resources"""
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Long-lived extraction pool whose workers are not forked from this process
+        
+        This process runs the sqlite writer, hash flush and Streamlit threads;
+        a plain fork could copy one of their locks while held and deadlock
+        the worker, so workers start from forkserver (or spawn).
+        """
+        if self._process_pool is None:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context(method)
+            )
+        return self._process_pool
+    
+    def _shutdown_process_pool(self):
+        if self._process_pool is not None:
+            pool, self._process_pool = self._process_pool, None
+            pool.shutdown(wait=False)
+    
+    async def aclose(self):
+        """Close the async and sync sessions and let the connector drain"""
+        self._shutdown_process_pool()
+        await asyncio.get_running_loop().run_in_executor(None, self.save_last_hashes)
+        if self.stealth_scraper:
+            await self.stealth_scraper.aclose()
+        if self.async_session is not None and not self.async_session.closed:
+            await self.close()
+            # Give the connector a moment to close SSL transports cleanly
+            await asyncio.sleep(0.25)
         if self.session:
             self.session.close()
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def cleanup(self):
+        """Cleanup resources"""
+        with self._sync_lock:
+            if self._sync_loop is not None and not self._sync_loop.is_closed():
+                self._sync_loop.run_until_complete(self.aclose())
+                self._sync_loop.close()
+                self._sync_loop = None
+            else:
+                self._shutdown_process_pool()
+                self.save_last_hashes()
+                if self.session:
+                    self.session.close()
+
+
+def _extract_fields(selectors: Dict[str, str], html_content: str
+                    ) -> Tuple[Dict[str, Any], List[str], List[str], int]:
+    """Parse HTML and run every selector; returns (data, errors, warnings, successes)
+
+    Module-level so it can be shipped to a ProcessPoolExecutor.
+    """
+    extracted_data = {}
+    extraction_errors = []
+    warnings = []
+    
+    # Track extraction success for each selector
+    successful_extractions = 0
+    
+    # Plain CSS selectors and literal text searches are answered from one
+    # lxml parse with precompiled XPath; only fields it cannot resolve go
+    # through the soup strategies
+    lxml_values = {}
+    resolved = set()
+    compiled = {name: _css_xpath(sel) for name, sel in selectors.items()}
+    needles = {}
+    if CSSSELECT_AVAILABLE:
+        for name, sel in selectors.items():
+            plan = _compile_selector(sel)
+            if plan.text_needle is not None and not plan.attr and not plan.chain:
+                needles[name] = plan.text_needle
+    if needles or any(xpath is not None for xpath in compiled.values()):
+        try:
+            tree = lxml.html.fromstring(html_content)
+        except (etree.ParserError, ValueError):
+            tree = None
+        if tree is not None:
+            for field_name, xpath in compiled.items():
+                if xpath is None:
+                    continue
+                try:
+                    elements = xpath(tree)
+                    if elements:
+                        lxml_values[field_name] = _value_from_text(field_name, _element_text(elements[0]))
+                except Exception as e:
+                    logger.debug(f"Compiled CSS selector failed for {field_name}: {e}")
+            for field_name, needle in needles.items():
+                matches = _TEXT_SEARCH_XPATH(tree, needle=needle)
+                if matches:
+                    node = matches[0].getparent()
+                    # A tail string belongs to the element's parent, not the element
+                    if matches[0].is_tail:
+                        node = node.getparent()
+                    lxml_values[field_name] = _element_text(node)
+                # A miss here is a miss for the soup text search as well
+                resolved.add(field_name)
+    
+    soup = None
+    for field_name, selector in selectors.items():
+        try:
+            value = lxml_values.get(field_name)
+            if value is None and field_name not in resolved:
+                if soup is None:
+                    strainer = _build_strainer(tuple(sorted(selectors.values())))
+                    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=strainer)
+                # Enhanced selector parsing with multiple strategies
+                value = WebScraper._extract_with_strategy(soup, selector, field_name)
             
-        if self.async_session:
-            asyncio.create_task(self.async_session.close())
\ No newline at end of file
+            if value is not None:
+                extracted_data[field_name] = value
+                successful_extractions += 1
+            else:
+                warnings.append(f"No data found for {field_name}")
+                
+        except Exception as e:
+            extraction_errors.append(f"Error extracting {field_name}: {str(e)}")
+            logger.error(f"Extraction error for {field_name} with selector '{selector}': {e}")
+    
+    return extracted_data, extraction_errors, warnings, successful_extractions
+
+
+def _element_text(element) -> str:
+    """lxml equivalent of BeautifulSoup's get_text(strip=True)"""
+    return ''.join(t.strip() for t in _TEXT_XPATH(element))
+
+
+def _value_from_text(field_name: str, text: str) -> Optional[Any]:
+    """Interpret element text according to the field kind"""
+    kind = _field_kind(field_name)
+    if kind == 'price':
+        return WebScraper._parse_price(text)
+    if kind == 'availability':
+        return WebScraper._parse_availability(text)
+    return text
@@ -5,25 +5,238 @@
 
 import random
 import asyncio
+import math
+import itertools
 import time
+import threading
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
 import aiohttp
 from aiohttp import ClientSession, TCPConnector
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import ThreadedResolver
 from aiohttp_proxy import ProxyConnector
 import ssl
+import socket
+from collections import OrderedDict
 from fake_useragent import UserAgent
-from playwright.async_api import async_playwright, Browser
+from playwright.async_api import async_playwright, Browser, Playwright
+from playwright.async_api import Error as PlaywrightError
 import cloudscraper
 from bs4 import BeautifulSoup
 import httpx
 from urllib.parse import urlparse
 import logging
 
+# c-ares backed resolver for aiohttp
+try:
+    import aiodns  # noqa: F401
+    from aiohttp.resolver import AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# C-backed HTML parsing and XPath selectors
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# CSS selectors compiled to lxml XPath
+try:
+    from cssselect import HTMLTranslator, SelectorError
+    CSSSELECT_AVAILABLE = LXML_AVAILABLE
+except ImportError:
+    CSSSELECT_AVAILABLE = False
+
+# Modest-engine HTML parser; fastest path for plain CSS selectors
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Larger bodies are truncated when streamed by the basic strategy
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+if CSSSELECT_AVAILABLE:
+    _CSS_TRANSLATOR = HTMLTranslator()
+    # Text nodes get_text() would return: no comments, scripts or styles
+    _TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+
+# SSL contexts are built once; creating one loads and parses the CA bundle.
+# The basic aiohttp strategy deliberately skips certificate verification
+# (it has to get through proxies and hosts with broken chains), so its
+# context disables hostname and certificate checks. httpx keeps verifying.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+_VERIFIED_SSL_CTX = ssl.create_default_context()
+
+# Browser headers that don't vary per request; User-Agent, Referer and
+# Origin are filled in by StealthScraper._get_stealth_headers
+_STATIC_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Only encodings zlib decodes in C; brotli decoding is far slower
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Chromium flags for the shared browser; viewport is set per context
+_BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-web-security',
+]
+
+# Anti-detection init script; only the fingerprint values vary per profile
+_STEALTH_SCRIPT_TEMPLATE = """
+    // Override navigator properties
+    Object.defineProperty(navigator, 'webdriver', {{
+        get: () => undefined
+    }});
+    
+    // Override chrome property
+    window.chrome = {{
+        runtime: {{}},
+    }};
+    
+    // Override permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({{ state: Notification.permission }}) :
+            originalQuery(parameters)
+    );
+    
+    // Add plugins
+    Object.defineProperty(navigator, 'plugins', {{
+        get: () => {{
+            return {plugins};
+        }},
+    }});
+    
+    // Override hardware concurrency
+    Object.defineProperty(navigator, 'hardwareConcurrency', {{
+        get: () => {hw}
+    }});
+    
+    // Override device memory
+    Object.defineProperty(navigator, 'deviceMemory', {{
+        get: () => {mem}
+    }});
+    
+    // Add WebGL noise
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {{
+        if (parameter === 37445) {{
+            return {vendor};
+        }}
+        if (parameter === 37446) {{
+            return {renderer};
+        }}
+        return getParameter.apply(this, arguments);
+    }};
+"""
+
+
+# Replays mouse moves with pauses, then scrolls to a random depth
+_HUMANIZE_SCRIPT = """
+    async (steps) => {
+        for (const [x, y, pause] of steps) {
+            const target = document.elementFromPoint(x, y) || document;
+            target.dispatchEvent(new MouseEvent('mousemove', {
+                clientX: x, clientY: y, bubbles: true
+            }));
+            await new Promise(resolve => setTimeout(resolve, pause));
+        }
+        window.scrollTo({
+            top: Math.random() * document.body.scrollHeight,
+            behavior: 'smooth'
+        });
+    }
+"""
+
+
+@lru_cache(maxsize=256)
+def _render_stealth_script(plugins: Tuple[str, ...], hw: int, mem: int,
+                           vendor: str, renderer: str) -> str:
+    return _STEALTH_SCRIPT_TEMPLATE.format(
+        plugins=json.dumps(list(plugins)), hw=hw, mem=mem,
+        vendor=json.dumps(vendor), renderer=json.dumps(renderer)
+    )
+
+
+def _build_stealth_script(profile: Dict) -> str:
+    """Stealth init script for a browser profile, rendered once per fingerprint"""
+    return _render_stealth_script(
+        tuple(profile["plugins"]), profile["hardware_concurrency"],
+        profile["device_memory"], profile["webgl_vendor"], profile["webgl_renderer"]
+    )
+
+def _netloc(url: str) -> str:
+    """Host part of 'scheme://netloc/...'; cheaper than urlparse on hot paths"""
+    parts = url.split('/', 3)
+    return parts[2] if len(parts) > 2 else ''
+
+
+class CachingResolver(AbstractResolver):
+    """LRU/TTL cache in front of aiohttp's resolver, shared by all pooled sessions"""
+    
+    POSITIVE_TTL = 300.0  # aiohttp resolvers don't expose record TTLs; clamp to a safe fixed value
+    NEGATIVE_TTL = 60.0
+    MAX_ENTRIES = 1024
+    
+    def __init__(self):
+        self._resolver = AsyncResolver() if AIODNS_AVAILABLE else ThreadedResolver()
+        self._cache: "OrderedDict[Tuple[str, int, int], Tuple[float, object]]" = OrderedDict()
+    
+    async def resolve(self, host: str, port: int = 0,
+                      family: socket.AddressFamily = socket.AF_INET) -> List[Dict]:
+        key = (host, port, family)
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            self._cache.move_to_end(key)
+            if isinstance(entry[1], OSError):
+                raise entry[1]
+            return entry[1]
+        
+        try:
+            result = await self._resolver.resolve(host, port, family)
+        except OSError as e:
+            # Negative-cache lookups that failed (NXDOMAIN and friends)
+            self._store(key, now + self.NEGATIVE_TTL, e)
+            raise
+        self._store(key, now + self.POSITIVE_TTL, result)
+        return result
+    
+    def _store(self, key, expiry: float, value):
+        self._cache[key] = (expiry, value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.MAX_ENTRIES:
+            self._cache.popitem(last=False)
+    
+    async def close(self):
+        await self._resolver.close()
+
+
 @dataclass
 class ProxyConfig:
     """Proxy configuration with health tracking"""
@@ -31,118 +244,173 @@ class ProxyConfig:
     type: str  # 'http', 'socks5', 'residential'
     username: Optional[str] = None
     password: Optional[str] = None
-    last_used: Optional[datetime] = None
+    last_used: Optional[float] = None  # time.monotonic() when last handed out
     success_count: int = 0
     fail_count: int = 0
-    response_times: List[float] = None
     blocked: bool = False
+    # Exponentially weighted latency and success (0..1); track recent behaviour
+    # in constant time and memory
+    rt_ewma: float = 0.0
+    success_ewma: float = 0.0
+    _initialized: bool = field(default=False, init=False, repr=False, compare=False)
+    _proxy_url: str = field(default='', init=False, repr=False, compare=False)
+    
+    EWMA_ALPHA = 0.2
     
     def __post_init__(self):
-        if self.response_times is None:
-            self.response_times = []
+        # The URL and credentials never change, so format the proxy URL once
+        if self.username and self.password:
+            parsed = urlparse(self.url)
+            self._proxy_url = f"{parsed.scheme}://{self.username}:{self.password}@{parsed.netloc}"
+        else:
+            self._proxy_url = self.url
+    
+    def record_response_time(self, response_time: float):
+        """Fold a latency sample into the EWMA"""
+        if self._initialized:
+            self.rt_ewma = self.EWMA_ALPHA * response_time + (1 - self.EWMA_ALPHA) * self.rt_ewma
+        else:
+            self.rt_ewma = response_time
+            self._initialized = True
+    
+    def record_outcome(self, success: bool):
+        """Fold a request outcome into the success EWMA"""
+        outcome = 1.0 if success else 0.0
+        if self.success_count + self.fail_count > 1:
+            self.success_ewma = self.EWMA_ALPHA * outcome + (1 - self.EWMA_ALPHA) * self.success_ewma
+        else:
+            self.success_ewma = outcome
+    
+    @property
+    def has_samples(self) -> bool:
+        return self._initialized
     
     @property
     def success_rate(self) -> float:
-        total = self.success_count + self.fail_count
-        return (self.success_count / total * 100) if total > 0 else 0
+        return self.success_ewma * 100 if self.success_count + self.fail_count else 0
     
     @property
     def avg_response_time(self) -> float:
-        return sum(self.response_times) / len(self.response_times) if self.response_times else 0
+        return self.rt_ewma
     
     def get_proxy_url(self) -> str:
         """Get formatted proxy URL with credentials"""
-        if self.username and self.password:
-            parsed = urlparse(self.url)
-            return f"{parsed.scheme}://{self.username}:{self.password}@{parsed.netloc}"
-        return self.url
+        return self._proxy_url
 
 
 class BrowserProfileManager:
     """Manages browser fingerprints to avoid detection"""
     
-    def __init__(self):
-        self.profiles = self._generate_profiles()
-        
-    def _generate_profiles(self) -> List[Dict]:
-        """Generate diverse browser profiles"""
-        profiles = []
-        
-        # Common screen resolutions
-        resolutions = [
-            (1920, 1080), (1366, 768), (1440, 900), (1536, 864),
-            (1680, 1050), (1280, 720), (1280, 800), (2560, 1440)
-        ]
-        
-        # Common browser languages
-        languages = [
-            ['en-US', 'en'], ['en-GB', 'en'], ['fr-FR', 'fr'],
-            ['de-DE', 'de'], ['es-ES', 'es'], ['it-IT', 'it'],
-            ['pt-BR', 'pt'], ['ja-JP', 'ja'], ['ko-KR', 'ko']
-        ]
-        
-        # Common timezones
-        timezones = [
-            'America/New_York', 'America/Chicago', 'America/Los_Angeles',
-            'Europe/London', 'Europe/Paris', 'Europe/Berlin',
-            'Asia/Tokyo', 'Asia/Shanghai', 'Australia/Sydney'
-        ]
-        
-        # Generate 50 diverse profiles
-        for i in range(50):
-            profile = {
-                'viewport': random.choice(resolutions),
-                'language': random.choice(languages),
-                'timezone': random.choice(timezones),
-                'webgl_vendor': random.choice(['Intel Inc.', 'NVIDIA Corporation', 'AMD']),
-                'webgl_renderer': self._get_random_gpu(),
-                'hardware_concurrency': random.choice([2, 4, 6, 8, 12, 16]),
-                'device_memory': random.choice([2, 4, 8, 16, 32]),
-                'color_depth': random.choice([24, 32]),
-                'platform': self._get_random_platform(),
-                'plugins': self._get_random_plugins(),
-                'canvas_noise': random.random()  # Add noise to canvas fingerprint
-            }
-            profiles.append(profile)
-            
-        return profiles
+    # Common screen resolutions
+    RESOLUTIONS = [
+        (1920, 1080), (1366, 768), (1440, 900), (1536, 864),
+        (1680, 1050), (1280, 720), (1280, 800), (2560, 1440)
+    ]
+    
+    # Common browser languages
+    LANGUAGES = [
+        ['en-US', 'en'], ['en-GB', 'en'], ['fr-FR', 'fr'],
+        ['de-DE', 'de'], ['es-ES', 'es'], ['it-IT', 'it'],
+        ['pt-BR', 'pt'], ['ja-JP', 'ja'], ['ko-KR', 'ko']
+    ]
+    
+    # Common timezones
+    TIMEZONES = [
+        'America/New_York', 'America/Chicago', 'America/Los_Angeles',
+        'Europe/London', 'Europe/Paris', 'Europe/Berlin',
+        'Asia/Tokyo', 'Asia/Shanghai', 'Australia/Sydney'
+    ]
+    
+    WEBGL_VENDORS = ['Intel Inc.', 'NVIDIA Corporation', 'AMD']
+    GPUS = [
+        'ANGLE (Intel HD Graphics 620 Direct3D11 vs_5_0 ps_5_0)',
+        'ANGLE (NVIDIA GeForce GTX 1050 Ti Direct3D11 vs_5_0 ps_5_0)',
+        'ANGLE (AMD Radeon RX 580 Series Direct3D11 vs_5_0 ps_5_0)',
+        'Intel Iris OpenGL Engine',
+        'AMD Radeon Pro 5500M OpenGL Engine',
+        'NVIDIA GeForce RTX 2060 OpenGL Engine'
+    ]
+    PLATFORMS = ['Win32', 'MacIntel', 'Linux x86_64', 'Linux armv81']
+    PLUGINS = [
+        'Chrome PDF Plugin', 'Chrome PDF Viewer', 'Native Client',
+        'Shockwave Flash', 'Widevine Content Decryption Module'
+    ]
+    
+    def _make_profile(self) -> Dict:
+        """Generate one browser profile on demand"""
+        return {
+            'viewport': random.choice(self.RESOLUTIONS),
+            'language': random.choice(self.LANGUAGES),
+            'timezone': random.choice(self.TIMEZONES),
+            'webgl_vendor': random.choice(self.WEBGL_VENDORS),
+            'webgl_renderer': self._get_random_gpu(),
+            'hardware_concurrency': random.choice([2, 4, 6, 8, 12, 16]),
+            'device_memory': random.choice([2, 4, 8, 16, 32]),
+            'color_depth': random.choice([24, 32]),
+            'platform': self._get_random_platform(),
+            'plugins': self._get_random_plugins(),
+            'canvas_noise': random.random()  # Add noise to canvas fingerprint
+        }
     
     def _get_random_gpu(self) -> str:
-        gpus = [
-            'ANGLE (Intel HD Graphics 620 Direct3D11 vs_5_0 ps_5_0)',
-            'ANGLE (NVIDIA GeForce GTX 1050 Ti Direct3D11 vs_5_0 ps_5_0)',
-            'ANGLE (AMD Radeon RX 580 Series Direct3D11 vs_5_0 ps_5_0)',
-            'Intel Iris OpenGL Engine',
-            'AMD Radeon Pro 5500M OpenGL Engine',
-            'NVIDIA GeForce RTX 2060 OpenGL Engine'
-        ]
-        return random.choice(gpus)
+        return random.choice(self.GPUS)
     
     def _get_random_platform(self) -> str:
-        platforms = ['Win32', 'MacIntel', 'Linux x86_64', 'Linux armv81']
-        return random.choice(platforms)
+        return random.choice(self.PLATFORMS)
     
     def _get_random_plugins(self) -> List[str]:
-        all_plugins = [
-            'Chrome PDF Plugin', 'Chrome PDF Viewer', 'Native Client',
-            'Shockwave Flash', 'Widevine Content Decryption Module'
-        ]
-        num_plugins = random.randint(0, len(all_plugins))
-        return random.sample(all_plugins, num_plugins)
+        # One C-level draw, de-duplicated in draw order
+        picks = random.choices(self.PLUGINS, k=random.randint(0, len(self.PLUGINS)))
+        return list(dict.fromkeys(picks))
     
     def get_random_profile(self) -> Dict:
         """Get a random browser profile"""
-        return random.choice(self.profiles)
+        return self._make_profile()
 
 
 class ProxyRotator:
     """Advanced proxy rotation with health monitoring"""
     
-    def __init__(self, proxy_list: List[str] = None):
+    STRATEGIES = ('rr', 'wrr', 'random', 'least_latency')
+    # Names used by ProxyConfiguration.rotation_strategy
+    _STRATEGY_ALIASES = {'round_robin': 'rr', 'best_performance': 'least_latency'}
+    # Proxies scoring within this factor of the best share traffic round-robin
+    TIE_TOLERANCE = 1.1
+    # Weighted round-robin: slots for the heaviest proxy, passes between
+    # reshuffles, and marks between weight recomputations
+    WRR_MULTIPLIER = 10
+    WRR_SHUFFLE_PERIOD = 5
+    WRR_REWEIGHT_MARKS = 20
+    
+    def __init__(self, proxy_list: List[str] = None, strategy: str = 'rr'):
         self.proxies: List[ProxyConfig] = []
         self._load_proxies(proxy_list)
-        self.current_index = 0
-        self.retry_after = timedelta(minutes=30)  # Retry blocked proxies after 30 min
+        self.retry_after = 30 * 60.0  # Retry blocked proxies after 30 min
+        # Round-robin order, plus one bit per blocked proxy and the monotonic
+        # time at which each blocked proxy may be retried
+        self._cycle = itertools.cycle(range(len(self.proxies)))
+        self._blocked_mask = 0
+        self._retry_at: List[float] = [0.0] * len(self.proxies)
+        
+        strategy = self._STRATEGY_ALIASES.get(strategy, strategy)
+        if strategy not in self.STRATEGIES:
+            logger.warning(f"Unknown proxy rotation strategy {strategy!r}, using round-robin")
+            strategy = 'rr'
+        self.strategy = strategy
+        
+        # Cached latency/success scores (lower is better), refreshed on each mark
+        self._index = {id(proxy): i for i, proxy in enumerate(self.proxies)}
+        self._scores = [self._score(proxy) for proxy in self.proxies]
+        self._tie_counter = 0
+        
+        # Shuffled weighted round-robin schedule of proxy indices
+        self.weights: Dict[int, float] = {}
+        self._decisions: List[int] = []
+        self._decision_pos = 0
+        self._pass_count = 0
+        self._marks_since_reweight = 0
+        if self.strategy == 'wrr':
+            self._rebuild_decisions()
         
     def _load_proxies(self, proxy_list: List[str]):
         """Load and validate proxy list"""
@@ -173,43 +441,143 @@ def _load_proxies(self, proxy_list: List[str]):
             )
             self.proxies.append(proxy)
     
+    @staticmethod
+    def _score(proxy: ProxyConfig) -> float:
+        """Expected cost of routing through a proxy; untried proxies score 0 so they get sampled"""
+        if not proxy.success_count + proxy.fail_count:
+            return 0.0
+        # Latency is only recorded on success, so failure-only proxies rank last
+        if not proxy.has_samples:
+            return math.inf
+        return proxy.avg_response_time / max(proxy.success_rate, 1e-3)
+    
+    def _update_score(self, proxy: ProxyConfig):
+        """Refresh a proxy's cached score after a mark"""
+        i = self._index.get(id(proxy))
+        if i is None:
+            return
+        self._scores[i] = self._score(proxy)
+        self._marks_since_reweight += 1
+    
+    def _is_available(self, i: int, now: float) -> bool:
+        """Check if proxy i can be used, unblocking it once retry_after has passed"""
+        if not (self._blocked_mask >> i) & 1:
+            return True
+        if self._retry_at[i] <= now:
+            # Give it another chance
+            self._blocked_mask &= ~(1 << i)
+            self.proxies[i].blocked = False
+            return True
+        return False
+    
     def get_proxy(self) -> Optional[ProxyConfig]:
-        """Get next available proxy using round-robin with health check"""
+        """Get next available proxy according to the rotation strategy"""
         if not self.proxies:
             return None
-            
-        attempts = 0
-        while attempts < len(self.proxies):
-            proxy = self.proxies[self.current_index]
-            self.current_index = (self.current_index + 1) % len(self.proxies)
-            
-            # Skip blocked proxies unless retry time has passed
-            if proxy.blocked:
-                if proxy.last_used and datetime.now() - proxy.last_used > self.retry_after:
-                    proxy.blocked = False  # Give it another chance
-                else:
-                    attempts += 1
-                    continue
-                    
-            proxy.last_used = datetime.now()
-            return proxy
-            
-        logger.warning("All proxies are blocked!")
+        
+        if self.strategy == 'least_latency':
+            proxy = self._get_least_latency_proxy()
+        elif self.strategy == 'wrr':
+            proxy = self._get_weighted_proxy()
+        elif self.strategy == 'random':
+            now = time.monotonic()
+            available = [i for i in range(len(self.proxies)) if self._is_available(i, now)]
+            proxy = self.proxies[random.choice(available)] if available else None
+        else:
+            proxy = self._get_round_robin_proxy()
+        
+        if proxy is None:
+            logger.warning("All proxies are blocked!")
+            return None
+        
+        proxy.last_used = time.monotonic()
+        return proxy
+    
+    def _get_round_robin_proxy(self) -> Optional[ProxyConfig]:
+        """Next available proxy in list order, skipping blocked ones"""
+        if not self._blocked_mask:
+            return self.proxies[next(self._cycle)]
+        now = time.monotonic()
+        for _ in range(len(self.proxies)):
+            i = next(self._cycle)
+            if self._is_available(i, now):
+                return self.proxies[i]
         return None
     
+    def _get_least_latency_proxy(self) -> Optional[ProxyConfig]:
+        """Available proxy with the lowest latency/success score, round-robin among near-ties"""
+        now = time.monotonic()
+        candidates = [i for i in range(len(self.proxies)) if self._is_available(i, now)]
+        if not candidates:
+            return None
+        best = min(self._scores[i] for i in candidates)
+        ties = [i for i in candidates if self._scores[i] <= best * self.TIE_TOLERANCE]
+        self._tie_counter += 1
+        return self.proxies[ties[self._tie_counter % len(ties)]]
+    
+    @staticmethod
+    def _weight(proxy: ProxyConfig) -> float:
+        """Share of traffic a proxy deserves: success ratio over latency"""
+        success = proxy.success_ewma if proxy.success_count + proxy.fail_count else 1.0
+        return success / (proxy.avg_response_time + 0.1)
+    
+    def _rebuild_decisions(self):
+        """Recompute weights and lay out a shuffled schedule proportional to them"""
+        self.weights = {i: self._weight(proxy) for i, proxy in enumerate(self.proxies)}
+        heaviest = max(self.weights.values(), default=0.0)
+        if heaviest > 0:
+            self._decisions = [
+                i for i, weight in self.weights.items()
+                for _ in range(int(weight / heaviest * self.WRR_MULTIPLIER))
+            ]
+        else:
+            self._decisions = list(range(len(self.proxies)))
+        random.shuffle(self._decisions)
+        self._decision_pos = 0
+        self._pass_count = 0
+        self._marks_since_reweight = 0
+    
+    def _get_weighted_proxy(self) -> Optional[ProxyConfig]:
+        """Next available proxy from the shuffled weighted schedule"""
+        if self._marks_since_reweight >= self.WRR_REWEIGHT_MARKS:
+            self._rebuild_decisions()
+        
+        now = time.monotonic()
+        for _ in range(len(self._decisions)):
+            if self._decision_pos >= len(self._decisions):
+                self._decision_pos = 0
+                self._pass_count += 1
+                if self._pass_count >= self.WRR_SHUFFLE_PERIOD:
+                    random.shuffle(self._decisions)
+                    self._pass_count = 0
+            
+            i = self._decisions[self._decision_pos]
+            self._decision_pos += 1
+            if self._is_available(i, now):
+                return self.proxies[i]
+        
+        # Proxies with no slots in the schedule are the last resort
+        return self._get_round_robin_proxy()
+    
     def mark_success(self, proxy: ProxyConfig, response_time: float):
         """Mark proxy request as successful"""
         proxy.success_count += 1
-        proxy.response_times.append(response_time)
-        if len(proxy.response_times) > 100:  # Keep last 100 response times
-            proxy.response_times.pop(0)
+        proxy.record_outcome(True)
+        proxy.record_response_time(response_time)
+        self._update_score(proxy)
     
     def mark_failure(self, proxy: ProxyConfig, block: bool = False):
         """Mark proxy request as failed"""
         proxy.fail_count += 1
+        proxy.record_outcome(False)
         if block or proxy.fail_count > 5:
             proxy.blocked = True
+            i = self._index.get(id(proxy))
+            if i is not None:
+                self._blocked_mask |= 1 << i
+                self._retry_at[i] = time.monotonic() + self.retry_after
             logger.warning(f"Proxy {proxy.url} blocked due to failures")
+        self._update_score(proxy)
     
     def get_best_proxy(self) -> Optional[ProxyConfig]:
         """Get proxy with best performance"""
@@ -217,79 +585,208 @@ def get_best_proxy(self) -> Optional[ProxyConfig]:
         if not available_proxies:
             return None
             
-        # Sort by success rate and response time
-        return sorted(
+        # Highest success rate, then lowest response time
+        return max(
             available_proxies,
-            key=lambda p: (p.success_rate, -p.avg_response_time),
-            reverse=True
-        )[0]
+            key=lambda p: (p.success_rate, -p.avg_response_time)
+        )
 
 
 class StealthScraper:
     """Main stealth scraper with multiple anti-detection techniques"""
     
-    def __init__(self, proxy_list: List[str] = None):
+    UA_POOL_SIZE = 200
+    # Concurrent cloudscraper requests allowed per host
+    CLOUDSCRAPER_PER_HOST = 2
+    
+    def __init__(self, proxy_list: List[str] = None, rotation_strategy: str = 'rr'):
         self.ua = UserAgent()
-        self.proxy_rotator = ProxyRotator(proxy_list)
+        # fake_useragent lookups cost milliseconds each; draws fill a pool
+        # that later picks are served from
+        self._ua_pool: List[str] = []
+        self.proxy_rotator = ProxyRotator(proxy_list, strategy=rotation_strategy)
         self.profile_manager = BrowserProfileManager()
         self.cloudscraper_session = cloudscraper.create_scraper()
+        self._cloudscraper_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self.breaker = AsyncCircuitBreaker()
+        # One browser per event loop; each scrape gets its own context
         self.browser: Optional[Browser] = None
-        self.request_delays = self._generate_human_delays()
-        
-    def _generate_human_delays(self) -> List[float]:
-        """Generate human-like delays between requests"""
-        delays = []
-        for _ in range(100):
-            # Normal distribution around 2 seconds with variance
-            base_delay = random.gauss(2.0, 0.5)
-            # Ensure minimum delay
-            delay = max(0.5, base_delay)
-            # Add occasional longer pauses (human behavior)
-            if random.random() < 0.1:  # 10% chance of longer pause
-                delay += random.uniform(3, 10)
-            delays.append(delay)
-        return delays
+        self._playwright: Optional[Playwright] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        
+        # HTTP clients keyed by proxy URL (None = direct) so connections and
+        # TLS sessions are reused; they are bound to the loop that created them
+        self._sessions: Dict[Optional[str], ClientSession] = {}
+        self._httpx_clients: Dict[Optional[str], httpx.AsyncClient] = {}
+        self._clients_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._resolver: Optional[CachingResolver] = None
+        # selector -> (compiled XPath, attribute, is_xpath)
+        self._selector_cache: Dict[str, Tuple[Optional["etree.XPath"], Optional[str], bool]] = {}
+    
+    def _check_clients_loop(self):
+        """Switch to the running loop, closing clients created on the previous one"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._clients_loop:
+            old_loop, stale = self._clients_loop, self._release_clients()
+            self._resolver = CachingResolver()
+            self._browser_lock = asyncio.Lock()
+            self._clients_loop = loop
+            if old_loop is not None:
+                self._close_on_loop(old_loop, self._close_clients(*stale))
+    
+    def _release_clients(self) -> tuple:
+        """Detach the pooled clients, resolver and browser for _close_clients"""
+        stale = (self._sessions, self._httpx_clients, self._resolver, self.browser, self._playwright)
+        self._sessions, self._httpx_clients, self._resolver = {}, {}, None
+        self.browser = self._playwright = None
+        return stale
+    
+    @staticmethod
+    async def _close_clients(sessions: Dict[Optional[str], ClientSession],
+                             clients: Dict[Optional[str], httpx.AsyncClient],
+                             resolver: Optional[CachingResolver],
+                             browser: Optional[Browser], playwright: Optional[Playwright]):
+        """Close released clients; must run on the loop that created them"""
+        try:
+            for session in sessions.values():
+                if not session.closed:
+                    await session.close()
+            for client in clients.values():
+                await client.aclose()
+            if resolver is not None:
+                await resolver.close()
+        finally:
+            try:
+                if browser is not None and browser.is_connected():
+                    await browser.close()
+            finally:
+                if playwright is not None:
+                    await playwright.stop()
+    
+    @staticmethod
+    def _close_on_loop(loop: asyncio.AbstractEventLoop, coro):
+        """Run a _close_clients coroutine on the loop its resources are bound to"""
+        if loop.is_closed():
+            coro.close()
+            logger.warning("Event loop closed before its HTTP clients and browser were shut down")
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(coro, loop)
+        else:
+            # An idle loop (e.g. WebScraper's sync loop between calls) can be
+            # driven from a helper thread while this one runs the new loop
+            def run():
+                try:
+                    loop.run_until_complete(coro)
+                except Exception as e:
+                    logger.warning(f"Error closing clients of a previous event loop: {e}")
+            closer = threading.Thread(target=run, name="stealth-client-close", daemon=True)
+            closer.start()
+            closer.join()
     
+    def _get_session(self, proxy_url: Optional[str]) -> ClientSession:
+        """Cached aiohttp session for a proxy"""
+        self._check_clients_loop()
+        session = self._sessions.get(proxy_url)
+        if session is None or session.closed:
+            if proxy_url:
+                connector = ProxyConnector.from_url(
+                    proxy_url, ssl=_SSL_CTX, resolver=self._resolver
+                )
+            else:
+                connector = TCPConnector(ssl=_SSL_CTX, resolver=self._resolver)
+            session = ClientSession(
+                connector=connector,
+                # Scrapes are stateless; skip cookie parsing and storage
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._sessions[proxy_url] = session
+        return session
+    
+    def _get_httpx_client(self, proxy_url: Optional[str]) -> httpx.AsyncClient:
+        """Cached HTTP/2 httpx client for a proxy"""
+        self._check_clients_loop()
+        client = self._httpx_clients.get(proxy_url)
+        if client is None or client.is_closed:
+            # HTTPX proxy support is different - use mounts
+            transport = None
+            if proxy_url:
+                transport = httpx.AsyncHTTPTransport(
+                    proxy=proxy_url, http2=True, verify=_VERIFIED_SSL_CTX
+                )
+            client = httpx.AsyncClient(
+                transport=transport,
+                http2=True,
+                verify=_VERIFIED_SSL_CTX,
+                follow_redirects=True,
+                timeout=30.0
+            )
+            self._httpx_clients[proxy_url] = client
+        return client
+    
+    async def _ensure_browser(self) -> Browser:
+        """Launch the shared Chromium instance if it isn't running"""
+        self._check_clients_loop()
+        async with self._browser_lock:
+            if self.browser is None or not self.browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self.browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=_BROWSER_ARGS
+                )
+            return self.browser
+    
+    async def aclose(self):
+        """Close pooled HTTP clients and the shared browser on the loop that owns them"""
+        loop, stale = self._clients_loop, self._release_clients()
+        self._clients_loop = None
+        if loop is None or loop is asyncio.get_running_loop():
+            await self._close_clients(*stale)
+        else:
+            self._close_on_loop(loop, self._close_clients(*stale))
+        
     def _get_random_delay(self) -> float:
-        """Get random human-like delay"""
-        return random.choice(self.request_delays)
+        """Sample a human-like delay between requests"""
+        # Normal distribution around 2 seconds, with a 0.5s floor
+        delay = max(0.5, random.gauss(2.0, 0.5))
+        # Occasional longer pauses (human behavior)
+        if random.random() < 0.1:
+            delay += random.uniform(3, 10)
+        return delay
+    
+    def _random_ua(self) -> str:
+        """Random user agent, served from the pool once it is full"""
+        if len(self._ua_pool) < self.UA_POOL_SIZE:
+            ua = self.ua.random
+            self._ua_pool.append(ua)
+            return ua
+        return random.choice(self._ua_pool)
     
     def _get_stealth_headers(self, url: str) -> Dict[str, str]:
         """Generate stealth headers that mimic real browser"""
-        domain = urlparse(url).netloc
-        
-        headers = {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
+        domain = _netloc(url)
+        
+        return {
+            **_STATIC_HEADERS,
+            'User-Agent': self._random_ua(),
             'Referer': f'https://www.google.com/search?q={domain}',
             'Origin': f'https://{domain}',
         }
-        
-        # Randomize header order (real browsers don't always send in same order)
-        headers_list = list(headers.items())
-        random.shuffle(headers_list)
-        
-        return dict(headers_list)
     
     async def scrape_with_strategy(self, url: str, selectors: Dict[str, str]) -> Tuple[Optional[Dict], Dict]:
         """
         Try multiple scraping strategies in order of sophistication
         Returns: (extracted_data, metadata)
         """
-        strategies = [
+        # Cheap HTTP strategies are raced; the first usable result wins
+        fast = [
             self._scrape_basic_request,
             self._scrape_with_cloudscraper,
             self._scrape_with_httpx,
+        ]
+        # Browser-based strategies are expensive, so they run one at a time
+        heavy = [
             self._scrape_with_playwright,
             self._scrape_with_selenium_grid,
         ]
@@ -301,30 +798,63 @@ async def scrape_with_strategy(self, url: str, selectors: Dict[str, str]) -> Tup
             'errors': []
         }
         
-        for strategy in strategies:
+        metadata['attempts'] += len(fast)
+        pending = {
+            asyncio.create_task(self._run_strategy(strategy, url, selectors, metadata)): strategy
+            for strategy in fast
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    strategy = pending.pop(task)
+                    result = task.result()
+                    if result:
+                        metadata['successful_strategy'] = strategy.__name__
+                        return result, metadata
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        for strategy in heavy:
+            if self.breaker.is_open(_netloc(url)):
+                break
             metadata['attempts'] += 1
-            try:
-                # Add human-like delay between attempts
-                if metadata['attempts'] > 1:
-                    await asyncio.sleep(self._get_random_delay())
-                
-                logger.info(f"Attempting {strategy.__name__} for {url}")
-                result = await strategy(url, selectors)
-                
-                if result:
-                    metadata['successful_strategy'] = strategy.__name__
-                    return result, metadata
-                    
-            except Exception as e:
-                logger.error(f"{strategy.__name__} failed: {str(e)}")
-                metadata['errors'].append({
-                    'strategy': strategy.__name__,
-                    'error': str(e)
-                })
-                continue
+            # Add human-like delay between attempts
+            await asyncio.sleep(self._get_random_delay())
+            
+            result = await self._run_strategy(strategy, url, selectors, metadata)
+            if result:
+                metadata['successful_strategy'] = strategy.__name__
+                return result, metadata
         
         return None, metadata
     
+    async def _run_strategy(self, strategy, url: str, selectors: Dict[str, str],
+                            metadata: Dict) -> Optional[Dict]:
+        """Run one strategy under the host's circuit breaker, recording any error in metadata"""
+        try:
+            async with self.breaker(_netloc(url)) as call:
+                logger.info(f"Attempting {strategy.__name__} for {url}")
+                result = await strategy(url, selectors)
+                if not result:
+                    call.fail()
+                return result
+        except CircuitOpen as e:
+            logger.info(f"Skipping {strategy.__name__}: {e}")
+            metadata['errors'].append({
+                'strategy': strategy.__name__,
+                'error': str(e)
+            })
+            return None
+        except Exception as e:
+            logger.error(f"{strategy.__name__} failed: {str(e)}")
+            metadata['errors'].append({
+                'strategy': strategy.__name__,
+                'error': str(e)
+            })
+            return None
+    
     async def _scrape_basic_request(self, url: str, selectors: Dict[str, str]) -> Optional[Dict]:
         """Basic request with proxy and stealth headers"""
         proxy = self.proxy_rotator.get_proxy()
@@ -338,54 +868,56 @@ async def _scrape_basic_request(self, url: str, selectors: Dict[str, str]) -> Op
         start_time = time.time()
         
         try:
-            # Create custom SSL context that accepts more certificates
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Create connector with proxy
-            if proxy_url:
-                connector = ProxyConnector.from_url(proxy_url, ssl=ssl_context)
-            else:
-                connector = TCPConnector(ssl=ssl_context)
-            
-            timeout = aiohttp.ClientTimeout(total=30)
-            
-            async with ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers=self._get_stealth_headers(url)
-            ) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        data = self._extract_data(html, selectors)
+            # Pooled session per proxy; stealth headers vary per request
+            session = self._get_session(proxy_url)
+            async with session.get(url, headers=self._get_stealth_headers(url)) as response:
+                if response.status == 200:
+                    html = await self._read_body(response)
+                    data = self._extract_data(html, selectors)
+                    
+                    # Mark proxy success
+                    if proxy:
+                        response_time = time.time() - start_time
+                        self.proxy_rotator.mark_success(proxy, response_time)
                         
-                        # Mark proxy success
-                        if proxy:
-                            response_time = time.time() - start_time
-                            self.proxy_rotator.mark_success(proxy, response_time)
-                            
-                        return data
-                    else:
-                        if proxy:
-                            self.proxy_rotator.mark_failure(proxy, response.status == 403)
-                        return None
+                    return data
+                else:
+                    if proxy:
+                        self.proxy_rotator.mark_failure(proxy, response.status == 403)
+                    return None
                         
         except Exception as e:
             if proxy:
                 self.proxy_rotator.mark_failure(proxy)
             raise e
     
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse) -> str:
+        """Stream the body in chunks, stopping at MAX_BODY_BYTES"""
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body += chunk
+            if len(body) >= MAX_BODY_BYTES:
+                logger.warning(f"Truncating {response.url} at {MAX_BODY_BYTES} bytes")
+                del body[MAX_BODY_BYTES:]
+                break
+        return body.decode(response.charset or 'utf-8', errors='replace')
+    
+    def _cloudscraper_get(self, url: str):
+        """Blocking cloudscraper GET, bounded per host (JS challenges are CPU-heavy)"""
+        host = _netloc(url)
+        semaphore = self._cloudscraper_slots.setdefault(
+            host, threading.BoundedSemaphore(self.CLOUDSCRAPER_PER_HOST)
+        )
+        with semaphore:
+            return self.cloudscraper_session.get(url, timeout=30)
+    
     async def _scrape_with_cloudscraper(self, url: str, selectors: Dict[str, str]) -> Optional[Dict]:
         """Use cloudscraper for Cloudflare bypass"""
         try:
-            # Cloudscraper is synchronous, so run in executor
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                self.cloudscraper_session.get,
-                url
+            # Cloudscraper is synchronous, so run it in a worker thread
+            response = await asyncio.get_running_loop().run_in_executor(
+                None, self._cloudscraper_get, url
             )
             
             if response.status_code == 200:
@@ -399,32 +931,14 @@ async def _scrape_with_cloudscraper(self, url: str, selectors: Dict[str, str]) -
     async def _scrape_with_httpx(self, url: str, selectors: Dict[str, str]) -> Optional[Dict]:
         """Use httpx with HTTP/2 support"""
         proxy = self.proxy_rotator.get_proxy()
+        client = self._get_httpx_client(proxy.get_proxy_url() if proxy else None)
         
-        proxies = None
-        if proxy:
-            proxies = {
-                "http://": proxy.get_proxy_url(),
-                "https://": proxy.get_proxy_url()
-            }
-        
-        # HTTPX proxy support is different - use mounts
-        transport = None
-        if proxy:
-            transport = httpx.AsyncHTTPTransport(proxy=proxy.get_proxy_url())
-        
-        async with httpx.AsyncClient(
-            transport=transport,
-            headers=self._get_stealth_headers(url),
-            http2=True,
-            follow_redirects=True,
-            timeout=30.0
-        ) as client:
-            try:
-                response = await client.get(url)
-                if response.status_code == 200:
-                    return self._extract_data(response.text, selectors)
-            except Exception as e:
-                logger.error(f"HTTPX failed: {e}")
+        try:
+            response = await client.get(url, headers=self._get_stealth_headers(url))
+            if response.status_code == 200:
+                return self._extract_data(response.text, selectors)
+        except Exception as e:
+            logger.error(f"HTTPX failed: {e}")
                 
         return None
     
@@ -433,127 +947,65 @@ async def _scrape_with_playwright(self, url: str, selectors: Dict[str, str]) ->
         proxy = self.proxy_rotator.get_proxy()
         profile = self.profile_manager.get_random_profile()
         
-        async with async_playwright() as p:
-            # Launch browser with stealth settings
-            browser_args = [
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-web-security',
-                f'--window-size={profile["viewport"][0]},{profile["viewport"][1]}'
-            ]
+        # Configure proxy
+        proxy_config = None
+        if proxy:
+            proxy_config = {
+                "server": proxy.url,
+            }
+            if proxy.username:
+                proxy_config["username"] = proxy.username
+                proxy_config["password"] = proxy.password
+        
+        context_options = dict(
+            viewport={'width': profile["viewport"][0], 'height': profile["viewport"][1]},
+            user_agent=self._random_ua(),
+            locale=profile["language"][0],
+            timezone_id=profile["timezone"],
+            color_scheme='light',
+            device_scale_factor=1,
+            is_mobile=False,
+            has_touch=False,
+            java_script_enabled=True,
+            proxy=proxy_config,
+        )
+        
+        browser = await self._ensure_browser()
+        try:
+            context = await browser.new_context(**context_options)
+        except PlaywrightError:
+            if browser.is_connected():
+                raise
+            # The browser died under us; relaunch once
+            browser = await self._ensure_browser()
+            context = await browser.new_context(**context_options)
+        
+        try:
+            # Add stealth scripts
+            await context.add_init_script(_build_stealth_script(profile))
             
-            # Configure proxy
-            proxy_config = None
-            if proxy:
-                proxy_config = {
-                    "server": proxy.url,
-                }
-                if proxy.username:
-                    proxy_config["username"] = proxy.username
-                    proxy_config["password"] = proxy.password
+            page = await context.new_page()
             
-            browser = await p.chromium.launch(
-                headless=True,
-                args=browser_args,
-                proxy=proxy_config
-            )
+            # Random mouse movements (x, y, pause in ms) to appear human
+            steps = [
+                (random.randint(100, 800), random.randint(100, 600), random.randint(100, 300))
+                for _ in range(random.randint(2, 5))
+            ]
             
-            context = await browser.new_context(
-                viewport={'width': profile["viewport"][0], 'height': profile["viewport"][1]},
-                user_agent=self.ua.random,
-                locale=profile["language"][0],
-                timezone_id=profile["timezone"],
-                color_scheme='light',
-                device_scale_factor=1,
-                is_mobile=False,
-                has_touch=False,
-                java_script_enabled=True,
-            )
+            # Navigate, then move and scroll in a single browser round trip
+            await page.goto(url, wait_until='networkidle')
+            await page.evaluate(_HUMANIZE_SCRIPT, steps)
             
-            # Add stealth scripts
-            await context.add_init_script("""
-                // Override navigator properties
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Override chrome property
-                window.chrome = {
-                    runtime: {},
-                };
-                
-                // Override permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-                
-                // Add plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => {
-                        return """ + json.dumps(profile["plugins"]) + """;
-                    },
-                });
-                
-                // Override hardware concurrency
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => """ + str(profile["hardware_concurrency"]) + """
-                });
-                
-                // Override device memory
-                Object.defineProperty(navigator, 'deviceMemory', {
-                    get: () => """ + str(profile["device_memory"]) + """
-                });
-                
-                // Add WebGL noise
-                const getParameter = WebGLRenderingContext.prototype.getParameter;
-                WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                    if (parameter === 37445) {
-                        return '""" + profile["webgl_vendor"] + """';
-                    }
-                    if (parameter === 37446) {
-                        return '""" + profile["webgl_renderer"] + """';
-                    }
-                    return getParameter.apply(this, arguments);
-                };
-            """)
+            await asyncio.sleep(random.uniform(1, 3))
             
-            page = await context.new_page()
+            # Extract data
+            html = await page.content()
+            data = self._extract_data(html, selectors)
             
-            # Random mouse movements to appear human
-            async def random_mouse_movement():
-                for _ in range(random.randint(2, 5)):
-                    x = random.randint(100, 800)
-                    y = random.randint(100, 600)
-                    await page.mouse.move(x, y)
-                    await asyncio.sleep(random.uniform(0.1, 0.3))
+            return data
             
-            try:
-                # Navigate with random mouse movements
-                await page.goto(url, wait_until='networkidle')
-                await random_mouse_movement()
-                
-                # Random scroll to appear human
-                await page.evaluate("""
-                    window.scrollTo({
-                        top: Math.random() * document.body.scrollHeight,
-                        behavior: 'smooth'
-                    });
-                """)
-                
-                await asyncio.sleep(random.uniform(1, 3))
-                
-                # Extract data
-                html = await page.content()
-                data = self._extract_data(html, selectors)
-                
-                return data
-                
-            finally:
-                await browser.close()
+        finally:
+            await context.close()
     
     async def _scrape_with_selenium_grid(self, url: str, selectors: Dict[str, str]) -> Optional[Dict]:
         """Fallback to Selenium Grid for distributed scraping"""
@@ -562,17 +1014,114 @@ async def _scrape_with_selenium_grid(self, url: str, selectors: Dict[str, str])
         logger.info("Selenium Grid strategy not implemented in this version")
         return None
     
+    def _compile_selector(self, selector: str) -> Tuple[Optional["etree.XPath"], Optional[str], bool]:
+        """Compile a selector once into (xpath, attribute, is_xpath); xpath is None if invalid"""
+        cached = self._selector_cache.get(selector)
+        if cached is not None:
+            return cached
+        
+        attr = None
+        is_xpath = selector.startswith('//')
+        try:
+            if is_xpath:
+                compiled = etree.XPath(selector)
+            else:
+                # 'css::attr' extracts an attribute instead of text
+                css = selector
+                if '::' in selector:
+                    css, attr = selector.split('::', 1)
+                compiled = etree.XPath(_CSS_TRANSLATOR.css_to_xpath(css))
+        except (SelectorError, etree.XPathError) as e:
+            logger.error(f"Invalid selector {selector}: {e}")
+            compiled = None
+        
+        cached = self._selector_cache[selector] = (compiled, attr, is_xpath)
+        return cached
+    
     def _extract_data(self, html: str, selectors: Dict[str, str]) -> Dict[str, any]:
         """Extract data using CSS selectors"""
-        soup = BeautifulSoup(html, 'html.parser')
+        if SELECTOLAX_AVAILABLE and all(
+            not selector.startswith('//') and '::' not in selector
+            for selector in selectors.values()
+        ):
+            return self._extract_data_selectolax(html, selectors)
+        if not CSSSELECT_AVAILABLE:
+            return self._extract_data_soup(html, selectors)
+        
+        # One parse, then every selector runs as a precompiled XPath over it
+        try:
+            tree = lxml.html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            return {}
+        data = {}
+        
+        for key, selector in selectors.items():
+            try:
+                compiled, attr, is_xpath = self._compile_selector(selector)
+                if compiled is None:
+                    continue
+                results = compiled(tree)
+                if not isinstance(results, list):
+                    results = [results]
+                
+                if is_xpath:
+                    values = [
+                        result.text_content().strip() if hasattr(result, 'text_content')
+                        else str(result).strip()
+                        for result in results
+                    ]
+                elif attr is not None:
+                    values = [el.get(attr, '') for el in results]
+                else:
+                    # Same text BeautifulSoup's get_text(strip=True) returns
+                    values = [''.join(t.strip() for t in _TEXT_XPATH(el)) for el in results]
+                
+                if values:
+                    # Get text from all matching elements
+                    data[key] = values[0] if len(values) == 1 else values
+                    
+            except Exception as e:
+                logger.error(f"Failed to extract {key} with selector {selector}: {e}")
+                
+        return data
+    
+    def _extract_data_selectolax(self, html: str, selectors: Dict[str, str]) -> Dict[str, any]:
+        """Plain CSS selectors over a selectolax tree"""
+        tree = SelectolaxParser(html)
+        data = {}
+        
+        for key, selector in selectors.items():
+            try:
+                values = [node.text(strip=True) for node in tree.css(selector)]
+                if values:
+                    data[key] = values[0] if len(values) == 1 else values
+            except Exception as e:
+                logger.error(f"Failed to extract {key} with selector {selector}: {e}")
+        
+        return data
+    
+    def _extract_data_soup(self, html: str, selectors: Dict[str, str]) -> Dict[str, any]:
+        """BeautifulSoup extraction used when cssselect is not installed"""
+        soup = BeautifulSoup(html, HTML_PARSER)
+        tree = None
         data = {}
         
         for key, selector in selectors.items():
             try:
                 # Try multiple selector strategies
                 if selector.startswith('//'):  # XPath
-                    # Convert to CSS selector or use lxml
-                    logger.warning(f"XPath selectors not fully supported: {selector}")
+                    if not LXML_AVAILABLE:
+                        logger.warning(f"XPath selectors need lxml: {selector}")
+                        continue
+                    if tree is None:
+                        tree = lxml.html.fromstring(html)
+                    values = [
+                        result.text_content().strip() if hasattr(result, 'text_content')
+                        else str(result).strip()
+                        for result in tree.xpath(selector)
+                    ]
+                    if values:
+                        data[key] = values[0] if len(values) == 1 else values
                     continue
                     
                 elements = soup.select(selector)
@@ -599,41 +1148,94 @@ def _extract_data(self, html: str, selectors: Dict[str, str]) -> Dict[str, any]:
         return data
 
 
+class CircuitOpen(Exception):
+    """Raised when a host's circuit breaker rejects a call"""
+
+
+class _BreakerCall:
+    """One guarded call; counts as failed on exception or after fail()"""
+    
+    __slots__ = ('breaker', 'host', 'ok')
+    
+    def __init__(self, breaker: "AsyncCircuitBreaker", host: str):
+        self.breaker = breaker
+        self.host = host
+        self.ok = True
+    
+    def fail(self):
+        self.ok = False
+    
+    async def __aenter__(self) -> "_BreakerCall":
+        self.breaker._admit(self.host)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            # Lost a race; says nothing about the host
+            self.breaker._release(self.host)
+        else:
+            self.breaker._record(self.host, exc_type is None and self.ok)
+        return False
+
+
 # Circuit breaker for resilience
-class CircuitBreaker:
-    """Circuit breaker pattern to prevent hammering failed endpoints"""
+class AsyncCircuitBreaker:
+    """Per-host circuit breaker to prevent hammering failed endpoints
+    
+    Usage: ``async with breaker(host) as call: ...``
+    """
+    
+    MAX_HOSTS = 10000
     
     def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.state = 'closed'  # closed, open, half-open
-        
-    def call(self, func, *args, **kwargs):
-        """Execute function with circuit breaker protection"""
-        if self.state == 'open':
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                self.state = 'half-open'
-            else:
-                raise Exception("Circuit breaker is open")
-                
-        try:
-            result = func(*args, **kwargs)
-            if self.state == 'half-open':
-                self.state = 'closed'
-                self.failure_count = 0
-            return result
-            
-        except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-            
-            if self.failure_count >= self.failure_threshold:
-                self.state = 'open'
-                
-            raise e
+        # host -> (state, failure_count, last_failure_time); closed hosts with
+        # no failures have no entry. States: closed, open, half-open
+        self._state: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+    
+    def __call__(self, host: str) -> _BreakerCall:
+        return _BreakerCall(self, host)
+    
+    def is_open(self, host: str) -> bool:
+        """Whether calls to host are currently rejected"""
+        entry = self._state.get(host)
+        if entry is None or entry[0] == 'closed':
+            return False
+        return entry[0] == 'half-open' or time.monotonic() - entry[2] < self.recovery_timeout
+    
+    def _admit(self, host: str):
+        entry = self._state.get(host)
+        if entry is None or entry[0] == 'closed':
+            return
+        state, failures, last = entry
+        if state == 'half-open' or time.monotonic() - last < self.recovery_timeout:
+            raise CircuitOpen(f"Circuit breaker is open for {host}")
+        # Recovery timeout passed: admit a single probe
+        self._state[host] = ('half-open', failures, last)
+    
+    def _release(self, host: str):
+        entry = self._state.get(host)
+        if entry is not None and entry[0] == 'half-open':
+            self._state[host] = ('open', entry[1], entry[2])
+    
+    def _record(self, host: str, success: bool):
+        if success:
+            self._state.pop(host, None)
+            return
+        entry = self._state.get(host)
+        failures = entry[1] + 1 if entry is not None else 1
+        if failures >= self.failure_threshold or (entry is not None and entry[0] == 'half-open'):
+            if entry is None or entry[0] == 'closed':
+                logger.warning(f"Circuit breaker opened for {host} after {failures} failures")
+            state = 'open'
+        else:
+            state = 'closed'
+        self._state[host] = (state, failures, time.monotonic())
+        self._state.move_to_end(host)
+        if len(self._state) > self.MAX_HOSTS:
+            self._state.popitem(last=False)
 
 
 # Export main class
-__all__ = ['StealthScraper', 'ProxyRotator', 'CircuitBreaker'] 
\ No newline at end of file
+__all__ = ['StealthScraper', 'ProxyRotator', 'AsyncCircuitBreaker', 'CircuitOpen'] 
\ No newline at end of file
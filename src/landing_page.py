@@ -5,17 +5,25 @@
 
 import streamlit as st
 import os
+import textwrap
 
-def main():
-    """Landing page focused on converting visitors to customers"""
-    st.set_page_config(
-        page_title="ScrapeMaster Intelligence - Price Drop Alerts That Make You Money",
-        page_icon="🕷️",
-        layout="wide"
-    )
-    
-    # Hero Section
-    st.markdown("""
+# Python-Markdown renders the static copy to HTML server-side
+try:
+    import markdown
+    MARKDOWN_AVAILABLE = True
+except ImportError:
+    MARKDOWN_AVAILABLE = False
+
+# streamlit run re-executes this module on every rerun, so the conversion is
+# cached per process rather than done at module level
+@st.cache_data(show_spinner=False)
+def _prerender(text: str) -> str:
+    """Markdown to HTML; without Python-Markdown the source is passed through"""
+    text = textwrap.dedent(text).strip()
+    return markdown.markdown(text) if MARKDOWN_AVAILABLE else text
+
+# Static page blocks
+_HERO_CSS = """
     <style>
     .hero {
         text-align: center;
@@ -61,98 +69,38 @@ def main():
         transform: scale(1.05);
     }
     </style>
-    """, unsafe_allow_html=True)
-    
-    # Hero
-    st.markdown("""
+    """
+
+_HERO_HTML = """
     <div class="hero">
         <h1>🕷️ ScrapeMaster Intelligence</h1>
         <p>Price Drop Alerts That Actually Make You Money</p>
         <p style="font-size: 1.2rem;">Monitor ANY competitor's prices • Get instant alerts • Never miss a deal</p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Quick Value Props
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
+    """
+
+_VALUE_PROP_PROFIT_HTML = """
         <div class="value-prop">
             <h3>💰 Make Money Instantly</h3>
             <p>Our users profit $500-$5,000/month from price arbitrage opportunities we find</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
+        """
+
+_VALUE_PROP_SETUP_HTML = """
         <div class="value-prop">
             <h3>⚡ 5-Minute Setup</h3>
             <p>Add any product URL. We monitor it 24/7. Get alerts when prices drop.</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
+        """
+
+_VALUE_PROP_ACCURACY_HTML = """
         <div class="value-prop">
             <h3>🎯 100% Accurate</h3>
             <p>Advanced AI extracts exact prices from ANY website, even those blocking scrapers</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Use Cases
-    st.markdown("## 🚀 Who's Making Money With ScrapeMaster?")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        ### 📦 Amazon FBA Sellers
-        - Monitor competitor prices across marketplaces
-        - Get alerts when products go below your target price
-        - Buy low, sell high - automatically
-        
-        **"Made $3,200 profit last month from alerts"** - Jake S.
-        """)
-        
-        st.markdown("""
-        ### 👟 Sneaker Resellers
-        - Track limited releases across 50+ sites
-        - Instant alerts for restocks and price drops
-        - Never miss a profitable flip again
-        
-        **"Caught a $1,200 profit on one alert!"** - Maria T.
-        """)
-    
-    with col2:
-        st.markdown("""
-        ### 🛍️ E-commerce Store Owners
-        - Monitor competitor pricing strategies
-        - Adjust your prices automatically
-        - Always stay competitive
-        
-        **"Increased revenue 40% in 2 months"** - David L.
-        """)
-        
-        st.markdown("""
-        ### 💎 Deal Hunters & Arbitrageurs
-        - Find pricing errors and arbitrage opportunities
-        - Monitor clearance sections 24/7
-        - First to know = first to profit
-        
-        **"Pays for itself 10x over every month"** - Sarah K.
-        """)
-    
-    st.markdown("---")
-    
-    # Pricing
-    st.markdown("## 💸 Start Making Money Today")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
+        """
+
+_PRICING_STARTER_HTML = """
         <div class="pricing-card">
             <h3>Starter</h3>
             <h1>$99/mo</h1>
@@ -165,10 +113,9 @@ def main():
             </ul>
             <a href="https://buy.stripe.com/your_starter_link" class="cta-button">Start Now</a>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
+        """
+
+_PRICING_PRO_HTML = """
         <div class="pricing-card featured">
             <h3>🔥 Professional</h3>
             <h1>$199/mo</h1>
@@ -182,10 +129,9 @@ def main():
             </ul>
             <a href="https://buy.stripe.com/your_pro_link" class="cta-button">Start Now</a>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
+        """
+
+_PRICING_ENTERPRISE_HTML = """
         <div class="pricing-card">
             <h3>Enterprise</h3>
             <h1>$499/mo</h1>
@@ -199,58 +145,153 @@ def main():
             </ul>
             <a href="https://buy.stripe.com/your_enterprise_link" class="cta-button">Start Now</a>
         </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # FAQ
-    st.markdown("## ❓ Frequently Asked Questions")
-    
-    with st.expander("How quickly will I see results?"):
-        st.write("""
+        """
+
+_FINAL_CTA_HTML = """
+    <div style="text-align: center; padding: 2rem;">
+        <h2>🚀 Ready to Start Making Money?</h2>
+        <p style="font-size: 1.2rem;">Join 500+ sellers already profiting from price drops</p>
+        <a href="https://buy.stripe.com/your_link" class="cta-button" style="font-size: 1.5rem; padding: 1.5rem 3rem;">
+            Start Your 7-Day Trial - Only $1
+        </a>
+        <p style="margin-top: 1rem; color: #666;">Then $99/month. Cancel anytime. Average user profit: $2,000/month</p>
+    </div>
+    """
+
+_FOOTER_HTML = """
+    <div style="text-align: center; color: #666;">
+        <p>© 2024 ScrapeMaster Intelligence | <a href="mailto:support@scrapemaster.ai">support@scrapemaster.ai</a></p>
+        <p>Making money from price drops since 2024</p>
+    </div>
+    """
+
+
+def _grid(*blocks: str) -> str:
+    """Lay HTML blocks out in equal columns within a single element"""
+    # No blank lines, or Markdown would end the HTML block early
+    cells = "".join(block.strip() for block in blocks)
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({len(blocks)}, 1fr); '
+        f'gap: 1rem; align-items: stretch;">{cells}</div>'
+    )
+
+_VALUE_PROPS_HTML = _grid(_VALUE_PROP_PROFIT_HTML, _VALUE_PROP_SETUP_HTML, _VALUE_PROP_ACCURACY_HTML)
+_PRICING_CARDS_HTML = _grid(_PRICING_STARTER_HTML, _PRICING_PRO_HTML, _PRICING_ENTERPRISE_HTML)
+
+# Use-case copy, rendered to HTML through _prerender
+_USECASE_FBA_MD = """
+        ### 📦 Amazon FBA Sellers
+        - Monitor competitor prices across marketplaces
+        - Get alerts when products go below your target price
+        - Buy low, sell high - automatically
+        
+        **"Made $3,200 profit last month from alerts"** - Jake S.
+        """
+
+_USECASE_SNEAKERS_MD = """
+        ### 👟 Sneaker Resellers
+        - Track limited releases across 50+ sites
+        - Instant alerts for restocks and price drops
+        - Never miss a profitable flip again
+        
+        **"Caught a $1,200 profit on one alert!"** - Maria T.
+        """
+
+_USECASE_ECOMMERCE_MD = """
+        ### 🛍️ E-commerce Store Owners
+        - Monitor competitor pricing strategies
+        - Adjust your prices automatically
+        - Always stay competitive
+        
+        **"Increased revenue 40% in 2 months"** - David L.
+        """
+
+_USECASE_DEALS_MD = """
+        ### 💎 Deal Hunters & Arbitrageurs
+        - Find pricing errors and arbitrage opportunities
+        - Monitor clearance sections 24/7
+        - First to know = first to profit
+        
+        **"Pays for itself 10x over every month"** - Sarah K.
+        """
+
+# FAQ (question, Markdown answer) pairs, also rendered through _prerender
+_FAQ = (
+    ("How quickly will I see results?", """
         Most users find their first profitable opportunity within 24-48 hours. 
         The more products you monitor, the more opportunities you'll find.
-        """)
-    
-    with st.expander("What websites can you monitor?"):
-        st.write("""
+        """),
+    ("What websites can you monitor?", """
         ANY website! Amazon, eBay, Shopify stores, brand websites, even sites that block scrapers. 
         Our advanced AI technology works where others fail.
-        """)
-    
-    with st.expander("Is this legal?"):
-        st.write("""
+        """),
+    ("Is this legal?", """
         Yes! We only collect publicly available pricing data, just like you would manually. 
         We respect robots.txt and rate limits.
-        """)
-    
-    with st.expander("Can I cancel anytime?"):
-        st.write("""
+        """),
+    ("Can I cancel anytime?", """
         Absolutely! No contracts, cancel anytime. Most users upgrade within the first month 
         because they're making so much money!
-        """)
+        """),
+)
+
+def main():
+    """Landing page focused on converting visitors to customers"""
+    st.set_page_config(
+        page_title="ScrapeMaster Intelligence - Price Drop Alerts That Make You Money",
+        page_icon="🕷️",
+        layout="wide"
+    )
+    
+    # Hero Section
+    st.markdown(_HERO_CSS, unsafe_allow_html=True)
+    
+    # Hero
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
+    
+    # Quick Value Props
+    st.markdown(_VALUE_PROPS_HTML, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Use Cases
+    st.markdown("## 🚀 Who's Making Money With ScrapeMaster?")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_prerender(_USECASE_FBA_MD), unsafe_allow_html=True)
+        
+        st.markdown(_prerender(_USECASE_SNEAKERS_MD), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_prerender(_USECASE_ECOMMERCE_MD), unsafe_allow_html=True)
+        
+        st.markdown(_prerender(_USECASE_DEALS_MD), unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Pricing
+    st.markdown("## 💸 Start Making Money Today")
+    
+    st.markdown(_PRICING_CARDS_HTML, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # FAQ
+    st.markdown("## ❓ Frequently Asked Questions")
+    
+    for question, answer in _FAQ:
+        with st.expander(question):
+            st.markdown(_prerender(answer), unsafe_allow_html=True)
     
     # Final CTA
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; padding: 2rem;">
-        <h2>🚀 Ready to Start Making Money?</h2>
-        <p style="font-size: 1.2rem;">Join 500+ sellers already profiting from price drops</p>
-        <a href="https://buy.stripe.com/your_link" class="cta-button" style="font-size: 1.5rem; padding: 1.5rem 3rem;">
-            Start Your 7-Day Trial - Only $1
-        </a>
-        <p style="margin-top: 1rem; color: #666;">Then $99/month. Cancel anytime. Average user profit: $2,000/month</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FINAL_CTA_HTML, unsafe_allow_html=True)
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666;">
-        <p>© 2024 ScrapeMaster Intelligence | <a href="mailto:support@scrapemaster.ai">support@scrapemaster.ai</a></p>
-        <p>Making money from price drops since 2024</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
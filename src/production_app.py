@@ -3,14 +3,35 @@
 Full-featured app that works on Railway
 """
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import random
 import os
+from html import escape
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
+
+def _read_secret(name: str) -> str:
+    """Environment variable, falling back to .streamlit/secrets.toml"""
+    value = os.environ.get(name)
+    if value:
+        return value
+    try:
+        return st.secrets.get(name, '')
+    except FileNotFoundError:  # no secrets.toml
+        return ''
+
+# API keys, read once at import
+_API_KEYS = MappingProxyType({
+    'scraperapi': _read_secret('SCRAPERAPI_KEY'),
+    'stripe': _read_secret('STRIPE_SECRET_KEY'),
+})
 
 # Mock data for demonstration (replace with real DB when ready)
+@st.cache_data(ttl=60, show_spinner=False)
 def get_mock_data():
     """Generate mock data for demonstration"""
     return {
@@ -25,6 +46,75 @@ def get_mock_data():
         ]
     }
 
+@st.cache_data(show_spinner=False)
+def _make_revenue_series(seed: int, n: int = 30) -> "np.ndarray":
+    """Sample daily revenue, stable for a given seed"""
+    import numpy as np
+    
+    return np.random.default_rng(seed).integers(200, 401, size=n)
+
+@st.cache_data(show_spinner=False)
+def _make_response_times(seed: int, n: int = 24) -> "np.ndarray":
+    """Sample hourly alert response times, stable for a given seed"""
+    import numpy as np
+    
+    return np.random.default_rng(seed).uniform(0.8, 2.0, size=n)
+
+@st.cache_data(show_spinner=False)
+def _sample_monitors() -> "pd.DataFrame":
+    """Sample active monitors table"""
+    import pandas as pd
+    
+    return pd.DataFrame({
+        'Product': ['Nike Air Max 270', 'Apple AirPods Pro', 'PS5 Controller', 'Samsung SSD 1TB'],
+        'Current Price': ['$120', '$199', '$65', '$89'],
+        'Target Price': ['$100', '$150', '$50', '$70'],
+        'Last Check': ['2 mins ago', '5 mins ago', '12 mins ago', '18 mins ago'],
+        'Status': ['🟢 Active', '🟢 Active', '🟢 Active', '🟢 Active']
+    })
+
+# Figures are cached by their (hashable) inputs and shared across reruns;
+# callers must not mutate them. Plotly is imported on first use so pages
+# without charts don't pay for it.
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _revenue_chart(dates: tuple, revenue: tuple) -> "go.Figure":
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=revenue,
+        mode='lines+markers',
+        line=dict(color='#667eea', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(102, 126, 234, 0.1)'
+    ))
+    
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Date",
+        yaxis_title="Revenue ($)",
+        showlegend=False
+    )
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _alert_pie(categories: tuple, values: tuple) -> "go.Figure":
+    import plotly.express as px
+    
+    fig = px.pie(values=values, names=categories, hole=0.4)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _response_time_chart(times: tuple, response_times: tuple) -> "go.Figure":
+    import plotly.express as px
+    
+    fig = px.line(x=times, y=response_times)
+    fig.update_layout(xaxis_title="Hour", yaxis_title="Response Time (s)")
+    return fig
+
 def main():
     st.set_page_config(
         page_title="ScrapeMaster Intelligence - Professional Price Monitoring",
@@ -37,25 +127,10 @@ def main():
         st.title("🕷️ ScrapeMaster")
         st.markdown("---")
         
-        page = st.radio("Navigation", [
-            "🏠 Dashboard",
-            "🎯 Price Monitoring", 
-            "📊 Analytics",
-            "💰 Pricing",
-            "⚙️ Settings"
-        ])
+        page = st.radio("Navigation", list(_PAGES))
     
     # Main content based on page selection
-    if page == "🏠 Dashboard":
-        render_dashboard()
-    elif page == "🎯 Price Monitoring":
-        render_monitoring()
-    elif page == "📊 Analytics":
-        render_analytics()
-    elif page == "💰 Pricing":
-        render_pricing()
-    elif page == "⚙️ Settings":
-        render_settings()
+    _PAGES[page]()
 
 def render_dashboard():
     """Render the main dashboard"""
@@ -88,39 +163,25 @@ def render_dashboard():
         st.subheader("📈 Revenue Trend")
         
         # Create sample revenue data
-        dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
-        revenue = [random.randint(200, 400) for _ in range(30)]
+        import pandas as pd
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=revenue,
-            mode='lines+markers',
-            line=dict(color='#667eea', width=3),
-            fill='tozeroy',
-            fillcolor='rgba(102, 126, 234, 0.1)'
-        ))
-        
-        fig.update_layout(
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis_title="Date",
-            yaxis_title="Revenue ($)",
-            showlegend=False
-        )
+        dates = pd.date_range(end=datetime.now(), periods=30, freq='D', normalize=True)
+        revenue = _make_revenue_series(datetime.now().date().toordinal())
         
+        fig = _revenue_chart(tuple(dates), tuple(revenue))
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🔔 Recent Alerts")
-        for alert in data['recent_alerts']:
-            st.markdown(f"""
-            **{alert['time']}**  
-            {alert['product']}  
-            💰 Dropped {alert['price_drop']}  
-            [View →]({alert['url']})
-            """)
-            st.markdown("---")
+        # One element for the whole list instead of two per alert
+        alerts_html = "".join(
+            f"<div><b>{escape(alert['time'])}</b><br>"
+            f"{escape(alert['product'])}<br>"
+            f"💰 Dropped {escape(alert['price_drop'])}<br>"
+            f"<a href='{escape(alert['url'], quote=True)}'>View →</a></div><hr>"
+            for alert in data['recent_alerts']
+        )
+        st.markdown(alerts_html, unsafe_allow_html=True)
 
 def render_monitoring():
     """Render price monitoring page"""
@@ -146,16 +207,7 @@ def render_monitoring():
     # Active monitors
     st.subheader("Active Monitors")
     
-    # Sample data
-    monitors = pd.DataFrame({
-        'Product': ['Nike Air Max 270', 'Apple AirPods Pro', 'PS5 Controller', 'Samsung SSD 1TB'],
-        'Current Price': ['$120', '$199', '$65', '$89'],
-        'Target Price': ['$100', '$150', '$50', '$70'],
-        'Last Check': ['2 mins ago', '5 mins ago', '12 mins ago', '18 mins ago'],
-        'Status': ['🟢 Active', '🟢 Active', '🟢 Active', '🟢 Active']
-    })
-    
-    st.dataframe(monitors, use_container_width=True)
+    st.dataframe(_sample_monitors(), use_container_width=True)
 
 def render_analytics():
     """Render analytics page"""
@@ -188,17 +240,17 @@ def render_analytics():
         categories = ['Electronics', 'Fashion', 'Home', 'Sports', 'Books']
         values = [145, 89, 67, 45, 23]
         
-        fig = px.pie(values=values, names=categories, hole=0.4)
-        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig = _alert_pie(tuple(categories), tuple(values))
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("Alert Response Times")
+        import pandas as pd
+        
         times = pd.date_range(start='00:00', end='23:59', freq='H').strftime('%H:%M')
-        response_times = [random.uniform(0.8, 2.0) for _ in range(24)]
+        response_times = _make_response_times(datetime.now().date().toordinal())
         
-        fig = px.line(x=times, y=response_times)
-        fig.update_layout(xaxis_title="Hour", yaxis_title="Response Time (s)")
+        fig = _response_time_chart(tuple(times), tuple(response_times))
         st.plotly_chart(fig, use_container_width=True)
 
 def render_pricing():
@@ -287,8 +339,8 @@ def render_settings():
     
     with tabs[2]:
         st.subheader("API Configuration")
-        st.text_input("ScraperAPI Key", type="password", value="sk_test_..." if os.getenv("SCRAPERAPI_KEY") else "")
-        st.text_input("Stripe Secret Key", type="password", value="sk_test_..." if os.getenv("STRIPE_SECRET_KEY") else "")
+        st.text_input("ScraperAPI Key", type="password", value="sk_test_..." if _API_KEYS['scraperapi'] else "")
+        st.text_input("Stripe Secret Key", type="password", value="sk_test_..." if _API_KEYS['stripe'] else "")
         
         if st.button("Test API Connection"):
             st.success("✅ API connection successful!")
@@ -300,5 +352,14 @@ def render_settings():
         st.button("Update Payment Method")
         st.button("View Invoices")
 
+# Navigation label -> page renderer, in sidebar order
+_PAGES = {
+    "🏠 Dashboard": render_dashboard,
+    "🎯 Price Monitoring": render_monitoring,
+    "📊 Analytics": render_analytics,
+    "💰 Pricing": render_pricing,
+    "⚙️ Settings": render_settings,
+}
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
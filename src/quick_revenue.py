@@ -5,62 +5,152 @@
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from datetime import datetime
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# C JSON codec for monitor persistence
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Simple configuration
 SCRAPERAPI_KEY = os.getenv('SCRAPERAPI_KEY', '')
+_SCRAPERAPI_BASE = 'http://api.scraperapi.com'
+
+# Monitors are stored one JSON object per line so adding one is an append;
+# monitors.json (a single JSON list) is the old format, converted on first load
+MONITORS_FILE = 'monitors.jsonl'
+LEGACY_MONITORS_FILE = 'monitors.json'
+
+# Concurrent scrapes for "Check All"; scraping is I/O-bound
+CHECK_ALL_WORKERS = 16
+
+# Bytes of each page read and scanned for a price
+MAX_SCAN_BYTES = 256 * 1024
+
+# Common price patterns in one alternation so the page is scanned once:
+# $123.45 | 123.45 USD | Price: 123.45
+_PRICE_RE = re.compile(
+    r'(\$[\d,]+\.?\d*)'
+    r'|([\d,]+\.?\d*\s*USD)'
+    r'|(Price:\s*[\d,]+\.?\d*)'
+)
+# Case-insensitive search avoids lower()-copying the whole page
+_OUT_OF_STOCK_RE = re.compile(r'out of stock', re.IGNORECASE)
 
 class QuickRevenueScraper:
     """Minimal viable scraper - just get it working"""
     
     def __init__(self):
         self.use_scraperapi = bool(SCRAPERAPI_KEY)
+        
+        # Keep-alive connection pool shared by every scrape through this instance
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def scrape(self, url, selector=None):
         """Dead simple scraping"""
         try:
             if self.use_scraperapi:
                 # Use ScraperAPI for reliability
-                api_url = f"http://api.scraperapi.com?api_key={SCRAPERAPI_KEY}&url={url}"
-                response = requests.get(api_url, timeout=30)
+                # requests URL-encodes the target, which may contain & or =
+                params = {'api_key': SCRAPERAPI_KEY, 'url': url}
+                response = self.session.get(_SCRAPERAPI_BASE, params=params, timeout=30, stream=True)
             else:
                 # Direct request as fallback
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.session.get(url, timeout=30, stream=True)
             
-            if response.status_code == 200:
-                # Super basic extraction
-                text = response.text
-                
-                # Look for common price patterns
-                import re
-                price_patterns = [
-                    r'\$[\d,]+\.?\d*',  # $123.45
-                    r'[\d,]+\.?\d*\s*USD',  # 123.45 USD
-                    r'Price:\s*[\d,]+\.?\d*',  # Price: 123.45
-                ]
+            with response:
+                if response.status_code != 200:
+                    return {'error': f'HTTP {response.status_code}'}
                 
-                for pattern in price_patterns:
-                    match = re.search(pattern, text)
-                    if match:
-                        return {
-                            'price': match.group(),
-                            'available': 'out of stock' not in text.lower(),
-                            'raw_html': text[:1000]  # First 1000 chars
-                        }
-                
-                return {'error': 'No price found', 'raw_html': text[:1000]}
-            else:
-                return {'error': f'HTTP {response.status_code}'}
+                # Super basic extraction; prices sit near the top of the page,
+                # so only the head of large bodies is downloaded and scanned
+                raw = response.raw.read(MAX_SCAN_BYTES, decode_content=True)
+                text = raw.decode(response.encoding or 'utf-8', errors='replace')
+            
+            # Look for common price patterns
+            match = _PRICE_RE.search(text)
+            if match:
+                return {
+                    'price': match.group(),
+                    'available': _OUT_OF_STOCK_RE.search(text) is None,
+                    'raw_html': text[:1000]  # First 1000 chars
+                }
+            
+            return {'error': 'No price found', 'raw_html': text[:1000]}
                 
         except Exception as e:
             return {'error': str(e)}
 
 
+@st.cache_resource
+def get_scraper() -> QuickRevenueScraper:
+    """One scraper, and so one connection pool, per process, shared across reruns and sessions"""
+    return QuickRevenueScraper()
+
+
+def _dump_line(obj) -> bytes:
+    """One compact JSON line; datetimes become ISO 8601 strings"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj, separators=(',', ':'), default=datetime.isoformat) + '\n').encode()
+
+
+def _load_line(line: bytes):
+    return orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+
+
+def _migrate_legacy_monitors():
+    """Convert an old monitors.json list to JSON lines"""
+    if os.path.exists(MONITORS_FILE) or not os.path.exists(LEGACY_MONITORS_FILE):
+        return
+    with open(LEGACY_MONITORS_FILE, 'rb') as f:
+        monitors = _load_line(f.read())
+    with open(MONITORS_FILE, 'wb') as f:
+        f.writelines(_dump_line(monitor) for monitor in monitors)
+    os.replace(LEGACY_MONITORS_FILE, LEGACY_MONITORS_FILE + '.bak')
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_monitors(mtime_ns: int, size: int) -> list:
+    """Parse the monitors file; (mtime_ns, size) is the cache key"""
+    with open(MONITORS_FILE, 'rb') as f:
+        return [_load_line(line) for line in f if line.strip()]
+
+
+def load_monitors() -> list:
+    """All saved monitors, re-parsed only when the file changes"""
+    _migrate_legacy_monitors()
+    try:
+        stat = os.stat(MONITORS_FILE)
+    except FileNotFoundError:
+        return []
+    # Size catches appends landing within the filesystem's mtime granularity
+    return _load_monitors(stat.st_mtime_ns, stat.st_size)
+
+
+def append_monitor(monitor_data: dict):
+    """Persist one monitor without rewriting the others"""
+    _migrate_legacy_monitors()
+    with open(MONITORS_FILE, 'ab') as f:
+        f.write(_dump_line(monitor_data))
+
+
 def main():
     """Revenue-focused UI"""
     st.set_page_config(
@@ -106,7 +196,7 @@ def main():
             
         if st.button("🚀 Start Monitoring", type="primary"):
             # Quick test scrape
-            scraper = QuickRevenueScraper()
+            scraper = get_scraper()
             with st.spinner("Testing URL..."):
                 result = scraper.scrape(target_url)
             
@@ -121,19 +211,10 @@ def main():
                     'frequency': check_frequency,
                     'threshold': price_threshold,
                     'last_result': result,
-                    'created': datetime.now().isoformat()
+                    'created': datetime.now()
                 }
                 
-                # Append to monitors.json
-                monitors = []
-                if os.path.exists('monitors.json'):
-                    with open('monitors.json', 'r') as f:
-                        monitors = json.load(f)
-                
-                monitors.append(monitor_data)
-                
-                with open('monitors.json', 'w') as f:
-                    json.dump(monitors, f, indent=2)
+                append_monitor(monitor_data)
                 
             else:
                 st.error(f"❌ Scraping failed: {result['error']}")
@@ -143,9 +224,19 @@ def main():
         st.header("Client Dashboard")
         
         # Load monitors
-        if os.path.exists('monitors.json'):
-            with open('monitors.json', 'r') as f:
-                monitors = json.load(f)
+        monitors = load_monitors()
+        if monitors:
+            if st.button("🔄 Check All"):
+                scraper = get_scraper()
+                with st.spinner(f"Checking {len(monitors)} monitors..."):
+                    with ThreadPoolExecutor(max_workers=min(CHECK_ALL_WORKERS, len(monitors))) as ex:
+                        results = list(ex.map(lambda m: scraper.scrape(m['url']), monitors))
+                
+                for monitor, result in zip(monitors, results):
+                    if 'error' not in result:
+                        st.success(f"{monitor['client']}: current price {result.get('price', 'N/A')}")
+                    else:
+                        st.error(f"{monitor['client']}: check failed: {result['error']}")
             
             for monitor in monitors:
                 with st.expander(f"📦 {monitor['client']} - {monitor['url'][:50]}..."):
@@ -161,7 +252,7 @@ def main():
                     
                     with col3:
                         if st.button("🔄 Check Now", key=f"check_{monitor['url']}"):
-                            scraper = QuickRevenueScraper()
+                            scraper = get_scraper()
                             result = scraper.scrape(monitor['url'])
                             
                             if 'error' not in result:
@@ -0,0 +1,26 @@
+import pytest
+
+from src.core.database import DatabaseManager
+from src.core.models import Client, PlanType, ScrapingTarget
+
+
+@pytest.fixture
+def db(tmp_path):
+    """DatabaseManager on a throwaway file, closed after the test"""
+    manager = DatabaseManager(tmp_path / "test.db")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def client(db):
+    client = Client(name="Acme", email="ops@acme.test", plan_type=PlanType.ENTERPRISE)
+    assert db.add_client(client)
+    return client
+
+
+@pytest.fixture
+def target(db, client):
+    target = ScrapingTarget(name="Acme pricing", url="https://acme.test/pricing", client_id=client.id)
+    assert db.add_target(target)
+    return target
@@ -0,0 +1,176 @@
+import threading
+
+import pytest
+
+from src.core.models import Client, ScrapedData, ScrapingTarget
+
+
+def _count(db, sql, *params):
+    with db.get_reader() as conn:
+        return conn.execute(sql, params).fetchone()[0]
+
+
+def _summary(db, target_id):
+    with db.get_reader() as conn:
+        row = conn.execute(
+            "SELECT total_scrapes, changes_detected FROM mv_active_targets_summary WHERE target_id = ?",
+            (target_id,)
+        ).fetchone()
+    return tuple(row)
+
+
+def _history(db, target_id):
+    with db.get_reader() as conn:
+        row = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(change_detected), 0) FROM v_scraped_data_all WHERE target_id = ?",
+            (target_id,)
+        ).fetchone()
+    return tuple(row)
+
+
+def test_writes_run_on_single_writer_thread(db):
+    names = {
+        db.pool.submit_write(lambda conn: threading.current_thread().name).result()
+        for _ in range(5)
+    }
+    assert names == {"sqlite-writer"}
+
+
+def test_failed_write_rolls_back_to_its_savepoint(db):
+    def insert_then_fail(conn):
+        conn.execute("CREATE TABLE IF NOT EXISTS probe (id INTEGER PRIMARY KEY)")
+        conn.execute("INSERT INTO probe (id) VALUES (1)")
+        raise RuntimeError("boom")
+
+    def insert_ok(conn):
+        conn.execute("CREATE TABLE IF NOT EXISTS probe (id INTEGER PRIMARY KEY)")
+        conn.execute("INSERT INTO probe (id) VALUES (2)")
+
+    failing = db.pool.submit_write(insert_then_fail)
+    passing = db.pool.submit_write(insert_ok)
+
+    with pytest.raises(RuntimeError):
+        failing.result()
+    passing.result()
+
+    with db.get_reader() as conn:
+        assert [row[0] for row in conn.execute("SELECT id FROM probe")] == [2]
+
+
+def test_bulk_store_assigns_consecutive_ids(db, target):
+    items = [ScrapedData(target_id=target.id, data={"price": i % 2}) for i in range(6)]
+
+    assert db.store_scraped_data_bulk(items, batch_size=4) == 6
+
+    ids = [item.id for item in items]
+    assert ids[:4] == list(range(ids[0], ids[0] + 4))
+    assert ids[4:] == list(range(ids[4], ids[4] + 2))
+    with db.get_reader() as conn:
+        for item in items:
+            stored = conn.execute(
+                "SELECT hash_signature, change_detected FROM scraped_data WHERE id = ?", (item.id,)
+            ).fetchone()
+            assert stored["hash_signature"] == item.hash_signature
+            assert bool(stored["change_detected"]) == item.change_detected
+
+    # Every item after the first differs from its predecessor
+    assert [item.change_detected for item in items] == [False] + [True] * 5
+
+
+def test_add_clients_rejects_whole_batch_on_duplicate_email(db, client):
+    batch = [
+        Client(name="New", email="new@acme.test"),
+        Client(name="Dup", email=client.email),
+    ]
+
+    assert db.add_clients(batch) is False
+    assert _count(db, "SELECT COUNT(*) FROM clients") == 1
+
+
+def test_add_client_rejects_duplicate_email(db, client):
+    assert db.add_client(Client(name="Other", email=client.email)) is False
+
+
+def test_add_target_rejects_duplicate_url(db, client, target):
+    duplicate = ScrapingTarget(name="Again", url=target.url, client_id=client.id)
+
+    assert db.add_target(duplicate) is False
+    assert _count(db, "SELECT COUNT(*) FROM scraping_targets WHERE url = ?", target.url) == 1
+
+
+def test_archive_keeps_target_summary_consistent(db, target):
+    items = [ScrapedData(target_id=target.id, data={"price": i}) for i in range(7)]
+    db.store_scraped_data_bulk(items)
+    before = _summary(db, target.id)
+    assert before == _history(db, target.id) == (7, 6)
+
+    with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE scraped_data SET partition_month = 202001 "
+            "WHERE id IN (SELECT id FROM scraped_data ORDER BY id LIMIT 5)"
+        )
+
+    assert db.archive_old_partitions() == 5
+    assert _count(db, "SELECT COUNT(*) FROM scraped_data WHERE target_id = ?", target.id) == 2
+    assert _summary(db, target.id) == _history(db, target.id) == before
+
+    db.rebuild_target_summary()
+    assert _summary(db, target.id) == before
+
+
+def _backdate(db, limit):
+    with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE scraped_data SET partition_month = 202001, timestamp = '2020-01-15 00:00:00' "
+            "WHERE id IN (SELECT id FROM scraped_data ORDER BY id LIMIT ?)", (limit,)
+        )
+
+
+def test_daily_maintenance_archives_old_partitions(db, target):
+    db.store_scraped_data_bulk([ScrapedData(target_id=target.id, data={"price": i}) for i in range(4)])
+    _backdate(db, 3)
+
+    db._next_daily_maintenance = 0
+    db.maintenance()
+
+    assert _count(db, "SELECT COUNT(*) FROM scraped_data") == 1
+    assert _count(db, "SELECT COUNT(*) FROM scraped_data_202001") == 3
+    assert _summary(db, target.id) == _history(db, target.id) == (4, 3)
+
+
+def test_cleanup_prunes_archive_tables(db, target):
+    db.store_scraped_data_bulk([ScrapedData(target_id=target.id, data={"price": i}) for i in range(4)])
+    _backdate(db, 3)
+    assert db.archive_old_partitions() == 3
+
+    assert db.cleanup_old_data(days_to_keep=90) == 3
+    assert _count(db, "SELECT COUNT(*) FROM sqlite_master WHERE name = 'scraped_data_202001'") == 0
+    assert _summary(db, target.id) == _history(db, target.id) == (1, 1)
+
+
+def test_compact_database_keeps_data(db, target):
+    db.store_scraped_data_bulk([ScrapedData(target_id=target.id, data={"price": i}) for i in range(3)])
+
+    assert db.compact_database() is True
+    assert _count(db, "SELECT COUNT(*) FROM scraped_data") == 3
+    with db.get_reader() as conn:
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+
+
+def test_deactivate_target_invalidates_active_targets_cache(db, target):
+    assert [t.id for t in db.get_active_targets()] == [target.id]
+
+    assert db.deactivate_target(target.id) is True
+    assert db.get_active_targets() == []
+    assert db.deactivate_target(target.id) is False
+
+
+def test_cleanup_keeps_latest_row_per_target(db, target):
+    items = [ScrapedData(target_id=target.id, data={"price": i}) for i in range(3)]
+    db.store_scraped_data_bulk(items)
+    with db.get_connection() as conn:
+        conn.execute("UPDATE scraped_data SET timestamp = '2020-01-15 00:00:00'")
+
+    assert db.cleanup_old_data(days_to_keep=90) == 2
+    with db.get_reader() as conn:
+        assert [row[0] for row in conn.execute("SELECT id FROM scraped_data")] == [items[-1].id]